@@ -0,0 +1,757 @@
+#!/usr/bin/env python
+"""
+Ad hoc performance benchmarks. Run from the `src` dir on the target hardware:
+
+    python benchmark.py fonts
+    python benchmark.py all -n 500
+"""
+import argparse
+import hashlib
+import hmac
+import math
+import random
+import time
+import tracemalloc
+
+from PIL import Image, ImageDraw
+
+
+def headless_renderer(width: int = 240, height: int = 240):
+    """
+    Stands up a Renderer singleton that draws to an in-memory canvas so that GUI
+    components can be exercised without touching the display driver.
+    """
+    from seedcash.gui.renderer import Renderer
+
+    if Renderer._instance:
+        return Renderer._instance
+
+    renderer = Renderer.__new__(Renderer)
+    renderer.canvas_width = width
+    renderer.canvas_height = height
+    renderer.canvas = Image.new("RGB", (width, height))
+    renderer.draw = ImageDraw.Draw(renderer.canvas)
+    Renderer._instance = renderer
+    return renderer
+
+
+def timeit(label: str, func, iterations: int):
+    start = time.perf_counter()
+    for i in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<48} {elapsed / iterations * 1000:9.3f} ms/iter")
+    return elapsed
+
+
+def synthetic_psbt(
+    num_inputs: int,
+    prev_tx_outputs: int,
+    num_outputs: int = 2,
+    num_parents: int = None,
+    xpriv: str = None,
+) -> bytes:
+    """
+    Builds an unsigned PSBT whose inputs each carry a full PSBT_IN_NON_WITNESS_UTXO
+    previous transaction with `prev_tx_outputs` P2PKH outputs. With `num_parents` the
+    inputs share that many parent txs (e.g. many payouts from one exchange batch).
+    With `xpriv` the BIP32 derivations declare the real pubkeys (needed to sign).
+    """
+    def serialize_varint(n: int) -> bytes:
+        if n < 0xFD:
+            return bytes([n])
+        if n <= 0xFFFF:
+            return b"\xfd" + n.to_bytes(2, "little")
+        return b"\xfe" + n.to_bytes(4, "little")
+
+    p2pkh = b"\x76\xa9\x14" + b"\x11" * 20 + b"\x88\xac"
+
+    def serialize_tx(inputs, outputs):
+        tx = (2).to_bytes(4, "little") + serialize_varint(len(inputs))
+        for prev_txid, prev_index in inputs:
+            tx += prev_txid + prev_index.to_bytes(4, "little") + b"\x00" + b"\xff" * 4
+        tx += serialize_varint(len(outputs))
+        for value, script in outputs:
+            tx += value.to_bytes(8, "little") + serialize_varint(len(script)) + script
+        return tx + (0).to_bytes(4, "little")
+
+    def keypair(key, value):
+        return serialize_varint(len(key)) + key + serialize_varint(len(value)) + value
+
+    num_parents = num_parents or num_inputs
+    prev_txs = []
+    for i in range(num_parents):
+        prev_txs.append(serialize_tx(
+            [(i.to_bytes(32, "little"), 0)],
+            [(1000 + j, p2pkh) for j in range(prev_tx_outputs)],
+        ))
+    prev_txids = [
+        hashlib.sha256(hashlib.sha256(prev_tx).digest()).digest() for prev_tx in prev_txs
+    ]
+
+    # Spend from the far end of each parent's outputs
+    unsigned_tx = serialize_tx(
+        [
+            (prev_txids[i % num_parents], prev_tx_outputs - 1 - (i // num_parents) % prev_tx_outputs)
+            for i in range(num_inputs)
+        ],
+        [(500, p2pkh) for j in range(num_outputs)],
+    )
+
+    signer = None
+    if xpriv:
+        from seedcash.models.psbt_signer import BitcoinCashSigner
+
+        signer = BitcoinCashSigner(xpriv)
+
+    psbt = b"psbt\xff" + keypair(b"\x00", unsigned_tx) + b"\x00"
+    for i in range(num_inputs):
+        path = [44 | 0x80000000, 145 | 0x80000000, 0x80000000, 0, i]
+        derivation = bytes(4) + b"".join(index.to_bytes(4, "little") for index in path)
+        pubkey = signer._derive_path(path)[1] if signer else b"\x02" + bytes(32)
+        psbt += keypair(b"\x00", prev_txs[i % num_parents])
+        psbt += keypair(b"\x06" + pubkey, derivation)
+        psbt += b"\x00"
+    psbt += b"\x00" * num_outputs
+    return psbt
+
+
+def test_xpriv() -> str:
+    """Account xpriv (m/44'/145'/0') for a fixed throwaway seed"""
+    from seedcash.models.bip44 import Bip44
+
+    master = hmac.new(b"Bitcoin seed", bytes(range(64)), hashlib.sha512).digest()
+    xpriv, xpub, fingerprint = Bip44.get_wallet_data(master[:32], master[32:])
+    return xpriv
+
+
+def peak_memory(func) -> int:
+    """Peak bytes allocated by Python while running `func`"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_fonts(iterations: int):
+    from seedcash.gui.components import FormattedAddress, GlyphAtlas
+    from seedcash.gui.keyboard import Keyboard
+
+    renderer = headless_renderer()
+    address = FormattedAddress(
+        address="bitcoincash:qr95sy3j9xwd2ap32xkykttr4cvcu7as4y0qverfuy",
+        font_size=24,
+    )
+    keyboard = Keyboard(draw=renderer.draw, render_now=False)
+
+    for is_enabled in [False, True]:
+        GlyphAtlas.is_enabled = is_enabled
+        label = "GlyphAtlas" if is_enabled else "FreeType"
+        timeit(f"FormattedAddress.render ({label})", address.render, iterations)
+        timeit(f"Keyboard.render_keys ({label})", keyboard.render_keys, iterations)
+
+
+def benchmark_keyboard(iterations: int):
+    from seedcash.gui.keyboard import Keyboard
+    from seedcash.hardware.buttons import HardwareButtonsConstants
+
+    renderer = headless_renderer()
+    keyboards = {
+        "full redraw": Keyboard(draw=renderer.draw),
+        "key sprites": Keyboard(draw=renderer.draw, canvas=renderer.canvas),
+    }
+
+    for label, keyboard in keyboards.items():
+
+        def navigate():
+            keyboard.update_from_input(HardwareButtonsConstants.KEY_RIGHT)
+            if keyboard.canvas is None:
+                # Previous behavior: repaint the whole board on every move
+                keyboard.render_keys()
+
+        timeit(f"Keyboard navigation ({label})", navigate, iterations)
+
+        if keyboard.canvas is None:
+            # Previous behavior: push the full canvas
+            area = renderer.canvas_width * renderer.canvas_height
+        else:
+            x0, y0, x1, y1 = keyboard.pop_damage_rect()
+            area = (x1 - x0) * (y1 - y0)
+        print(f"{'  pixels pushed per move':<48} {area:9d}")
+
+
+def benchmark_button_list(iterations: int):
+    from seedcash.gui.screens.screen import ButtonListScreen, ButtonOption
+
+    headless_renderer()
+    for num_buttons in [10, 100, 1000]:
+        button_data = [ButtonOption(f"Output {i}") for i in range(num_buttons)]
+
+        def open_screen():
+            screen = ButtonListScreen(button_data=button_data)
+            screen._render_visible_buttons()
+
+        timeit(f"ButtonListScreen entry ({num_buttons} buttons)", open_screen, iterations)
+
+
+def benchmark_psbt_parse(iterations: int):
+    from seedcash.models.psbt_parser import parse_psbt
+
+    psbt = bytearray(synthetic_psbt(num_inputs=20, prev_tx_outputs=500))
+    print(f"{'  PSBT size (bytes)':<48} {len(psbt):9d}")
+    for zero_copy in [False, True]:
+        label = "memoryview" if zero_copy else "bytes"
+
+        def parse():
+            parse_psbt(psbt, zero_copy=zero_copy)
+
+        timeit(f"parse_psbt ({label})", parse, iterations)
+        print(f"{'  peak allocated (bytes)':<48} {peak_memory(parse):9d}")
+
+
+def benchmark_psbt_prev_tx(iterations: int):
+    from seedcash.models.psbt_parser import PSBTParser
+
+    psbt = synthetic_psbt(num_inputs=20, prev_tx_outputs=5000, num_parents=2)
+    print(f"{'  PSBT size (bytes)':<48} {len(psbt):9d}")
+    timeit(
+        "PSBTParser (20 inputs, 2 x 5000-output parents)",
+        lambda: PSBTParser(bytearray(psbt), wallet_fingerprint=None),
+        iterations,
+    )
+
+
+def benchmark_psbt_model(iterations: int):
+    from seedcash.models.psbt_parser import PSBTParser, parse_psbt
+
+    psbt = synthetic_psbt(num_inputs=2, prev_tx_outputs=10, num_outputs=1000)
+    timeit("parse_psbt (1000 outputs)", lambda: parse_psbt(psbt), iterations)
+    timeit(
+        "PSBTParser (1000 outputs)",
+        lambda: PSBTParser(bytearray(psbt), wallet_fingerprint=None),
+        iterations,
+    )
+
+    tracemalloc.start()
+    try:
+        psbt_parser = PSBTParser(bytearray(psbt), wallet_fingerprint=None)
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    per_output = retained // len(psbt_parser.tx.outputs)
+    print(f"{'  retained bytes per output':<48} {per_output:9d}")
+
+
+def benchmark_cashaddr(iterations: int):
+    from seedcash.models import cashaddr
+
+    hash160s = [hashlib.new("ripemd160", i.to_bytes(4, "little")).digest() for i in range(100)]
+
+    def encode_uncached():
+        cashaddr.encode.cache_clear()
+        for hash160 in hash160s:
+            cashaddr.encode(hash160)
+
+    def encode_cached():
+        for hash160 in hash160s:
+            cashaddr.encode(hash160)
+
+    timeit("cashaddr.encode x100 (cold)", encode_uncached, iterations)
+    timeit("cashaddr.encode x100 (memoized)", encode_cached, iterations)
+
+
+def benchmark_derivation(iterations: int):
+    from seedcash.models.psbt_signer import BitcoinCashSigner
+
+    xpriv = test_xpriv()
+    hardened = 0x80000000
+    account = [44 | hardened, 145 | hardened, hardened]
+    # 300 inputs spread over 20 receive/change addresses
+    paths = [account + [i % 2, (i // 2) % 10] for i in range(300)]
+
+    def derive_all():
+        signer = BitcoinCashSigner(xpriv)
+        for path in paths:
+            signer._derive_path(path)
+
+    timeit("_derive_path x300 (20 distinct leaves)", derive_all, iterations)
+
+
+def benchmark_signing(iterations: int):
+    from seedcash.models.psbt_signer import sign_psbt, signing_workers
+
+    xpriv = test_xpriv()
+    print(f"{'  signing workers':<48} {signing_workers():9d}")
+    for num_inputs in [50, 500, 2000]:
+        psbt = synthetic_psbt(num_inputs=num_inputs, prev_tx_outputs=4, num_parents=10, xpriv=xpriv)
+        for parallel in [False, True]:
+            label = "parallel" if parallel else "sequential"
+            # Signing is slow; a single pass per size is plenty
+            timeit(
+                f"sign_psbt {num_inputs} inputs ({label})",
+                lambda: sign_psbt(bytearray(psbt), xpriv, parallel=parallel),
+                1,
+            )
+
+
+def benchmark_verify(iterations: int):
+    from seedcash.models.psbt_signer import (
+        BitcoinCashSigner,
+        batch_verify_schnorr,
+        verify_schnorr,
+    )
+
+    signer = BitcoinCashSigner(test_xpriv())
+    hardened = 0x80000000
+    for num_sigs, num_addresses in [(100, 100), (100, 10)]:
+        checks = []
+        for i in range(num_sigs):
+            priv, pub = signer._derive_path([44 | hardened, 145 | hardened, hardened, 0, i % num_addresses])
+            msg_hash = hashlib.sha256(i.to_bytes(4, "little")).digest()
+            checks.append((msg_hash, pub, signer._sign_schnorr(priv, msg_hash, pub)))
+
+        label = f"{num_sigs} sigs, {num_addresses} pubkeys"
+        # Verification is slow; a single pass per size is plenty
+        timeit(f"verify_schnorr x{num_sigs} ({label})", lambda: all(verify_schnorr(*c) for c in checks), 1)
+        timeit(f"batch_verify_schnorr ({label})", lambda: batch_verify_schnorr(checks), 1)
+
+
+def benchmark_psbt_export(iterations: int):
+    from seedcash.models.encode_qr import BBQrPsbtQrEncoder, UrPsbtQrEncoder
+    from seedcash.models.psbt_signer import minimize_psbt, sign_psbt
+
+    xpriv = test_xpriv()
+    for num_inputs, prev_tx_outputs in [(5, 20), (20, 100)]:
+        psbt = synthetic_psbt(num_inputs=num_inputs, prev_tx_outputs=prev_tx_outputs, xpriv=xpriv)
+        signed = sign_psbt(bytearray(psbt), xpriv)
+        label = f"{num_inputs} inputs, {prev_tx_outputs}-output parents"
+        for name, export in [
+            ("full", signed),
+            ("minimal", minimize_psbt(signed)),
+            ("signatures only", minimize_psbt(signed, partial_sigs_only=True)),
+        ]:
+            frames = UrPsbtQrEncoder(psbt=bytearray(export)).seq_len()
+            bbqr = BBQrPsbtQrEncoder(psbt=bytearray(export))
+            print(
+                f"{'  ' + name + ' (' + label + ')':<48} {len(export):7d} B {frames:5d} UR"
+                f" {bbqr.seq_len():5d} BBQr ({bbqr.encoding}) frames"
+            )
+        timeit(f"minimize_psbt ({label})", lambda: minimize_psbt(signed), iterations)
+
+
+def benchmark_qr_plan(iterations: int):
+    from seedcash.models.encode_qr import UrPsbtQrEncoder
+    from seedcash.models.settings_definition import SettingsConstants
+
+    for size in [500, 3_000, 20_000]:
+        psbt = bytearray(random.Random(size).randbytes(size))
+        print(f"  UR, {size} B: legacy 65 B fragments, {math.ceil(size / 65)} frames")
+        for density, name in SettingsConstants.ALL_QR_DENSITIES:
+            plan = UrPsbtQrEncoder(psbt=psbt, qr_density=density).plan
+            print(
+                f"  UR, {size} B, {name:<6}: v{plan.qr_version:<2} {plan.fragment_size:4d} B fragments,"
+                f" {plan.num_frames:4d} frames, {plan.module_px} px modules ({plan.rendered_px} px QR), {plan.cycle_seconds:5.1f}s/cycle"
+            )
+
+
+def benchmark_fountain(iterations: int):
+    from seedcash.helpers.ur2.fountain_utils import choose_fragments
+
+    seq_len = 300
+    checksum = 0x12345678
+
+    def choose_mixed():
+        for seq_num in range(seq_len + 1, seq_len + 101):
+            choose_fragments(seq_num, seq_len, checksum)
+
+    timeit(f"choose_fragments x100 ({seq_len} fragments)", choose_mixed, iterations)
+
+    from seedcash.helpers.ur2.fountain_encoder import FountainEncoder
+
+    message = bytearray(random.Random(0).randbytes(50_000))
+    for max_fragment_len in [65, 1000]:
+        def generate_parts():
+            encoder = FountainEncoder(message, max_fragment_len)
+            for _ in range(1000):
+                encoder.next_part()
+
+        timeit(f"FountainEncoder 1000 parts (50 KB, {max_fragment_len} B frags)", generate_parts, 1)
+
+
+def benchmark_bytewords(iterations: int):
+    from seedcash.helpers.ur2.bytewords import Bytewords, Bytewords_Style_minimal
+    from seedcash.helpers.ur2.ur import UR
+    from seedcash.helpers.ur2.ur_decoder import URDecoder
+    from seedcash.helpers.ur2.ur_encoder import UREncoder
+
+    fragment = bytearray(random.Random(0).randbytes(80))
+    encoded = Bytewords.encode(Bytewords_Style_minimal, fragment)
+    timeit(
+        "Bytewords.encode x100 (80 B, minimal)",
+        lambda: [Bytewords.encode(Bytewords_Style_minimal, fragment) for _ in range(100)],
+        iterations,
+    )
+    timeit(
+        "Bytewords.decode x100 (80 B, minimal)",
+        lambda: [Bytewords.decode(Bytewords_Style_minimal, encoded) for _ in range(100)],
+        iterations,
+    )
+
+    message = bytearray(random.Random(0).randbytes(5_000))
+    encoder = UREncoder(UR("crypto-psbt", message), 65)
+    parts = [encoder.next_part().upper() for _ in range(encoder.fountain_encoder.seq_len())]
+
+    def receive_all():
+        decoder = URDecoder()
+        for part in parts:
+            decoder.receive_part(part)
+
+    timeit(f"URDecoder.receive_part x{len(parts)} (5 KB)", receive_all, iterations)
+
+
+def benchmark_ur_cbor(iterations: int):
+    from seedcash.helpers.ur2.fountain_encoder import Part
+
+    part = Part(1234, 300, 50_000, 0x89ABCDEF, random.Random(0).randbytes(170))
+    cbor = bytearray(part.cbor())
+    timeit("Part.cbor x1000", lambda: [part.cbor() for _ in range(1000)], iterations)
+    timeit("Part.from_cbor x1000", lambda: [Part.from_cbor(cbor) for _ in range(1000)], iterations)
+
+
+def benchmark_decode_qr(iterations: int):
+    from binascii import b2a_base64
+
+    from seedcash.models.decode_qr import DecodeQR
+    from seedcash.models.encode_qr import BBQrPsbtQrEncoder, UrPsbtQrEncoder
+
+    psbt = synthetic_psbt(num_inputs=5, prev_tx_outputs=20)
+    psbt_b64 = b2a_base64(psbt, newline=False).decode()
+    chunk = 300
+    specter = [psbt_b64[i : i + chunk] for i in range(0, len(psbt_b64), chunk)]
+    streams = {
+        "UR": UrPsbtQrEncoder(psbt=bytearray(psbt)),
+        "BBQr": BBQrPsbtQrEncoder(psbt=bytearray(psbt)),
+    }
+    for name, encoder in streams.items():
+        streams[name] = [encoder.next_part().encode() for _ in range(encoder.seq_len())]
+    streams["Specter"] = [f"p{i + 1}of{len(specter)} {part}".encode() for i, part in enumerate(specter)]
+    streams["base64"] = [psbt_b64.encode()]
+
+    for name, frames in streams.items():
+        def decode_all():
+            decoder = DecodeQR()
+            for frame in frames:
+                decoder.add_data(frame)
+            assert decoder.get_psbt() == psbt
+
+        timeit(f"DecodeQR.add_data x{len(frames)} ({name}, {len(psbt)} B)", decode_all, iterations)
+
+    # Large BBQr stream: whole scan, and the latency from the last frame to the PSBT
+    psbt = synthetic_psbt(num_inputs=20, prev_tx_outputs=100)
+    for encoding in ["Z", "2"]:
+        encoder = BBQrPsbtQrEncoder(psbt=bytearray(psbt))
+        if encoding == "2":
+            # Incompressible payloads skip deflate
+            encoder = BBQrPsbtQrEncoder(psbt=bytearray(random.Random(0).randbytes(len(psbt))))
+        frames = [encoder.next_part().encode() for _ in range(encoder.seq_len())]
+        expected = encoder.psbt
+
+        def decode_all():
+            decoder = DecodeQR()
+            for frame in frames:
+                decoder.add_data(frame)
+            assert decoder.get_psbt() == expected
+
+        label = f"BBQr {encoder.encoding}, {len(expected)} B"
+        timeit(f"DecodeQR.add_data x{len(frames)} ({label})", decode_all, iterations)
+
+        def last_frame():
+            decoder = DecodeQR()
+            for frame in frames[:-1]:
+                decoder.add_data(frame)
+            start = time.perf_counter()
+            decoder.add_data(frames[-1])
+            decoder.get_psbt()
+            return time.perf_counter() - start
+
+        latency = min(last_frame() for _ in range(max(1, iterations // 10)))
+        print(f"{'  last frame -> PSBT (' + label + ')':<52} {latency * 1000:.3f} ms")
+
+
+def base43_encode(data: bytes) -> str:
+    """Test-data encoder; DecodeQR only ever needs to decode base43"""
+    from seedcash.models.decode_qr import BASE43_CHARS
+
+    chars = BASE43_CHARS.decode()
+    long_value = int.from_bytes(data, "big")
+    result = []
+    while long_value:
+        long_value, chunk = divmod(long_value, 43**10)
+        for _ in range(10):
+            chunk, digit = divmod(chunk, 43)
+            result.append(chars[digit])
+    encoded = "".join(reversed(result)).lstrip(chars[0])
+    return chars[0] * (len(data) - len(data.lstrip(b"\x00"))) + encoded
+
+
+def benchmark_base43(iterations: int):
+    from seedcash.models.decode_qr import DecodeQR
+
+    for size in [100, 1_000, 4_000, 10_000]:
+        data = random.Random(size).randbytes(size)
+        encoded = base43_encode(data)
+        assert DecodeQR.base43_decode(encoded) == data
+        timeit(f"base43_decode ({size} B, {len(encoded)} chars)", lambda: DecodeQR.base43_decode(encoded), iterations)
+
+
+def record_animated_qr(parts: list, border: int = 2) -> list:
+    """(part, module bitmap with True = dark) of each displayed frame of an animated QR"""
+    import numpy as np
+    import qrcode
+
+    recording = []
+    for part in parts:
+        qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_L, box_size=1, border=border)
+        qr.add_data(part)
+        qr.make(fit=True)
+        recording.append((part, np.array(qr.get_matrix(), dtype=bool)))
+    return recording
+
+
+SCENE_GRAY = 160
+
+
+class PiZeroDecodeModel:
+    """
+    Stand-in for pyzbar on a Pi Zero, so scan replays mean something off the device
+    (or without libzbar). A decode costs SECONDS_PER_PIXEL of the image it's handed
+    (~150 ms at 480x480). A read fails if the symbol touches the image edge, and
+    otherwise succeeds with a probability that rises from 0 at MIN_PX_PER_MODULE to 1
+    at SURE_PX_PER_MODULE.
+    """
+
+    SECONDS_PER_PIXEL = 6.5e-7
+    MIN_PX_PER_MODULE = 2.0
+    SURE_PX_PER_MODULE = 3.5
+
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+
+    def decode(self, image, part: str, num_modules: int):
+        """(data, rect, seconds) for the grayscale `image` showing `part`"""
+        import numpy as np
+
+        latency = image.shape[0] * image.shape[1] * self.SECONDS_PER_PIXEL
+        rows = np.flatnonzero((image != SCENE_GRAY).any(axis=1))
+        cols = np.flatnonzero((image != SCENE_GRAY).any(axis=0))
+        if len(rows) == 0:
+            return None, None, latency
+        top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        if top == 0 or left == 0 or bottom == image.shape[0] or right == image.shape[1]:
+            return None, None, latency
+
+        px_per_module = (bottom - top + right - left) / 2 / num_modules
+        readable = (px_per_module - self.MIN_PX_PER_MODULE) / (
+            self.SURE_PX_PER_MODULE - self.MIN_PX_PER_MODULE
+        )
+        if self.rng.random() >= readable:
+            return None, None, latency
+        return part.encode(), (int(left), int(top), int(right - left), int(bottom - top)), latency
+
+
+SCAN_MODELS = {
+    "pi_zero": PiZeroDecodeModel,
+    "real": None,  # pyzbar, timed on this machine
+}
+
+
+def replay_scan(
+    recording: list,
+    profile,
+    controller=None,
+    model: PiZeroDecodeModel = None,
+    view_fraction: float = 0.45,
+    max_seconds: float = 120,
+):
+    """
+    Replays a recorded animated QR through a simulated camera on a simulated clock.
+    The display advances every QR_FRAME_SECONDS; the camera captures at the profile's
+    framerate; each decode takes as long as `model` says (or as pyzbar really takes
+    here, without one); a camera restart costs CAMERA_RESTART_SECONDS. The QR fills
+    `view_fraction` of the frame side. Returns (seconds, decode attempts) to complete.
+    """
+    import numpy as np
+    from PIL import Image
+
+    from seedcash.models.decode_qr import DecodeQR, DecodeQRStatus
+    from seedcash.models.encode_qr import QR_FRAME_SECONDS
+
+    CAMERA_RESTART_SECONDS = 1.0
+
+    decoder = DecodeQR()
+    clock = 0.0
+    attempts = 0
+    last_capture = None
+    while clock < max_seconds:
+        if controller:
+            profile = controller.profile
+
+        # Latest frame the camera has captured
+        capture = int(clock * profile.framerate)
+        if capture == last_capture:
+            clock = (capture + 1) / profile.framerate
+            continue
+        last_capture = capture
+        part, shown = recording[int(capture / profile.framerate / QR_FRAME_SECONDS) % len(recording)]
+
+        width, height = profile.resolution
+        side = int(min(width, height) * view_fraction)
+        qr = Image.fromarray(np.where(shown, 0, 255).astype(np.uint8)).resize((side, side), Image.Resampling.BILINEAR)
+        scene = np.full((height, width), SCENE_GRAY, dtype=np.uint8)
+        top, left = (height - side) // 2, (width - side) // 2
+        scene[top : top + side, left : left + side] = np.asarray(qr)
+        image = controller.crop(scene) if controller else scene
+
+        if model:
+            data, rect, latency = model.decode(image, part, len(shown))
+            status = decoder.add_data(data)
+        else:
+            start = time.perf_counter()
+            status = decoder.add_image(np.stack([image] * 3, axis=-1))
+            latency = time.perf_counter() - start
+            rect = decoder.last_rect
+        clock += latency
+        attempts += 1
+
+        if status == DecodeQRStatus.COMPLETE:
+            return clock, attempts
+        if controller and controller.record(status, latency, rect=rect):
+            clock += CAMERA_RESTART_SECONDS
+            last_capture = None
+    return None, attempts
+
+
+def benchmark_scan(iterations: int, model: str = "pi_zero"):
+    from seedcash.models.encode_qr import UrPsbtQrEncoder
+    from seedcash.models.scan_controller import BOARD__PI_ZERO, ScanController, ScanProfile
+    from seedcash.models.settings_definition import SettingsConstants
+
+    psbt = synthetic_psbt(num_inputs=5, prev_tx_outputs=20)
+    encoder = UrPsbtQrEncoder(psbt=bytearray(psbt), qr_density=SettingsConstants.QR_DENSITY__HIGH)
+    recording = record_animated_qr([encoder.next_part() for _ in range(encoder.seq_len() * 3)])
+    print(f"  {len(psbt)} B UR, {encoder.seq_len()} frames at v{encoder.plan.qr_version}, {model} decoder")
+
+    fixed = ScanProfile((480, 480), 6)
+    runs = max(3, iterations // 20)
+    for view_fraction, held in [(0.45, "at arm's length"), (0.9, "held close")]:
+        learned = None
+        for name in ["fixed 480x480@6", "adaptive", "adaptive, learned profile"]:
+            results = []
+            for run in range(runs):
+                controller = None
+                if name == "adaptive":
+                    controller = ScanController(board_type=BOARD__PI_ZERO, persist=False)
+                elif name != "fixed 480x480@6":
+                    controller = ScanController(profile=learned, board_type=BOARD__PI_ZERO, persist=False)
+                decode_model = SCAN_MODELS[model](seed=run) if SCAN_MODELS[model] else None
+                results.append(replay_scan(recording, fixed, controller, decode_model, view_fraction))
+                if name == "adaptive":
+                    learned = controller.profile
+            seconds = sorted(r[0] for r in results if r[0] is not None)
+            summary = f"median {seconds[len(seconds) // 2]:6.2f}s" if seconds else "did not complete"
+            decodes = sorted(r[1] for r in results)[len(results) // 2]
+            final = f" -> {controller.profile.key()}" if controller else ""
+            print(f"  scan to complete ({held}, {name}): {summary}, {decodes} decodes{final}")
+
+
+def benchmark_preview(iterations: int):
+    import numpy as np
+    from PIL import Image
+
+    from seedcash.gui.components import resize_frame_to_fill, resize_image_to_fill
+
+    frame = np.random.default_rng(0).integers(0, 256, (480, 480, 3), dtype=np.uint8)
+    for width, height in [(240, 240), (320, 240)]:
+        def pil_pipeline():
+            # What the live preview did before: astype copy, RGBA, rotate, resize
+            image = Image.fromarray(frame.astype("uint8")).convert("RGBA").rotate(90 + 270)
+            return resize_image_to_fill(image, width, height, sampling_method=Image.Resampling.NEAREST)
+
+        def fused():
+            return resize_frame_to_fill(frame, width, height, quarter_turns=0)
+
+        timeit(f"preview frame, PIL pipeline (480x480 -> {width}x{height})", pil_pipeline, iterations)
+        timeit(f"preview frame, fused (480x480 -> {width}x{height})", fused, iterations)
+
+
+def benchmark_slip39(iterations: int):
+    from seedcash.helpers.shamir_mnemonic.shamir import (
+        EncryptedMasterSecret,
+        ShareGroup,
+        recover_ems,
+        split_ems,
+    )
+
+    # Built directly: from_master_secret would time the PBKDF2 rounds, not the sharing
+    ems = EncryptedMasterSecret(1234, True, 1, random.Random(0).randbytes(32))
+    for group_threshold, member_threshold in [(8, 8), (16, 16)]:
+        groups = [(member_threshold, 16)] * 16
+
+        def recover(shares):
+            share_groups = {}
+            for group in shares[:group_threshold]:
+                for share in group[:member_threshold]:
+                    share_groups.setdefault(share.group_index, ShareGroup()).add(share)
+            return recover_ems(share_groups)
+
+        shares = split_ems(group_threshold, groups, ems)
+        assert recover(shares) == ems
+        label = f"{group_threshold}-of-16 groups x {member_threshold}-of-16 members"
+        timeit(f"split_ems ({label})", lambda: split_ems(group_threshold, groups, ems), iterations)
+        timeit(f"recover_ems ({label})", lambda: recover(shares), iterations)
+
+
+BENCHMARKS = {
+    "fonts": benchmark_fonts,
+    "keyboard": benchmark_keyboard,
+    "button_list": benchmark_button_list,
+    "psbt_parse": benchmark_psbt_parse,
+    "psbt_prev_tx": benchmark_psbt_prev_tx,
+    "psbt_model": benchmark_psbt_model,
+    "cashaddr": benchmark_cashaddr,
+    "derivation": benchmark_derivation,
+    "signing": benchmark_signing,
+    "verify": benchmark_verify,
+    "psbt_export": benchmark_psbt_export,
+    "qr_plan": benchmark_qr_plan,
+    "fountain": benchmark_fountain,
+    "bytewords": benchmark_bytewords,
+    "ur_cbor": benchmark_ur_cbor,
+    "decode_qr": benchmark_decode_qr,
+    "scan": benchmark_scan,
+    "preview": benchmark_preview,
+    "base43": benchmark_base43,
+    "slip39": benchmark_slip39,
+}
+
+
+def main(sys_argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("benchmark", choices=list(BENCHMARKS.keys()) + ["all"])
+    parser.add_argument("-n", "--iterations", default=100, type=int)
+    parser.add_argument(
+        "--model", choices=list(SCAN_MODELS.keys()), default="pi_zero", help="decoder for the scan replay"
+    )
+    args = parser.parse_args(sys_argv)
+
+    for name, benchmark in BENCHMARKS.items():
+        if args.benchmark in [name, "all"]:
+            print(f"--- {name} ---")
+            kwargs = {"model": args.model} if benchmark is benchmark_scan else {}
+            benchmark(args.iterations, **kwargs)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ import time
 from decimal import Decimal
 
 from dataclasses import dataclass
+from functools import lru_cache
 from gettext import gettext as _
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from typing import List, Tuple
@@ -239,6 +240,107 @@ class Fonts(Singleton):
         return cls.fonts[font_name][size]
 
 
+class GlyphAtlas(Singleton):
+    """
+    Prebaked glyph cache for the fixed-width and icon fonts.
+
+    Each glyph is rasterized by FreeType only once per (font_name, size) into an "L"
+    mask, along with its offset from the baseline origin and its advance width.
+    Strings are then composed by stamping the cached masks with `ImageDraw.bitmap()`.
+    The fill color is applied at composite time so a single bake serves every color.
+
+    Only meant for fonts that don't rely on kerning or ligatures (fixed-width and
+    icon fonts); proportional text should keep going through `ImageDraw.text()`.
+
+    Set `is_enabled = False` to fall back to FreeType rendering for every draw.
+    """
+
+    is_enabled = True
+    glyphs = {}
+
+    @classmethod
+    def get_glyph(cls, font_name: str, size: int, char: str) -> tuple:
+        """
+        Returns the cached (mask, offset_x, offset_y, advance) for `char`, where the
+        offsets are relative to the left edge of the glyph's baseline.
+        """
+        if (font_name, size) not in cls.glyphs:
+            cls.glyphs[(font_name, size)] = {}
+        atlas = cls.glyphs[(font_name, size)]
+
+        if char not in atlas:
+            font = Fonts.get_font(font_name, size)
+            left, top, right, bottom = font.getbbox(char, anchor="ls")
+            mask = Image.new("L", (max(right - left, 0), max(bottom - top, 0)))
+            if mask.width and mask.height:
+                ImageDraw.Draw(mask).text(
+                    (-left, -top), char, fill=255, font=font, anchor="ls"
+                )
+            atlas[char] = (mask, left, top, font.getlength(char))
+
+        return atlas[char]
+
+    @classmethod
+    def bake(cls, font_name: str, size: int, chars: str):
+        """Rasterize `chars` ahead of time (e.g. a Keyboard's full charset)"""
+        for char in chars:
+            cls.get_glyph(font_name, size, char)
+
+    @classmethod
+    def get_text_width(cls, font_name: str, size: int, text: str) -> float:
+        return sum(cls.get_glyph(font_name, size, char)[3] for char in text)
+
+    @classmethod
+    def draw_text(
+        cls,
+        image_draw: ImageDraw.ImageDraw,
+        xy: Tuple[int, int],
+        text: str,
+        font_name: str,
+        size: int,
+        fill: str,
+        anchor: str = "la",
+    ):
+        """
+        Drop-in for `image_draw.text()` that composes `text` from cached glyphs.
+
+        Supports the horizontal anchors "l", "m", "r" and the vertical anchors "a",
+        "s", "d".
+        """
+        if not cls.is_enabled:
+            image_draw.text(
+                xy,
+                text,
+                fill=fill,
+                font=Fonts.get_font(font_name, size),
+                anchor=anchor,
+            )
+            return
+
+        x, y = xy
+        if anchor[0] == "m":
+            x -= cls.get_text_width(font_name, size, text) / 2
+        elif anchor[0] == "r":
+            x -= cls.get_text_width(font_name, size, text)
+        elif anchor[0] != "l":
+            raise ValueError(f"Unsupported horizontal anchor: {anchor}")
+
+        if anchor[1] == "a":
+            y += Fonts.get_font(font_name, size).getmetrics()[0]
+        elif anchor[1] == "d":
+            y -= Fonts.get_font(font_name, size).getmetrics()[1]
+        elif anchor[1] != "s":
+            raise ValueError(f"Unsupported vertical anchor: {anchor}")
+
+        for char in text:
+            mask, offset_x, offset_y, advance = cls.get_glyph(font_name, size, char)
+            if mask.width and mask.height:
+                image_draw.bitmap(
+                    (int(x) + offset_x, int(y) + offset_y), mask, fill=fill
+                )
+            x += advance
+
+
 class TextDoesNotFitException(Exception):
     pass
 
@@ -877,15 +979,10 @@ class Icon(BaseComponent):
             SeedCashIconsConstants.MIN_VALUE <= self.icon_name
             and self.icon_name <= SeedCashIconsConstants.MAX_VALUE
         ):
-            self.icon_font = Fonts.get_font(
-                GUIConstants.ICON_FONT_NAME__SEEDCASH,
-                self.icon_size,
-                file_extension="ttf",
-            )
+            self.icon_font_name = GUIConstants.ICON_FONT_NAME__SEEDCASH
         else:
-            self.icon_font = Fonts.get_font(
-                GUIConstants.ICON_FONT_NAME__FONT_AWESOME, self.icon_size
-            )
+            self.icon_font_name = GUIConstants.ICON_FONT_NAME__FONT_AWESOME
+        self.icon_font = Fonts.get_font(self.icon_font_name, self.icon_size)
 
         # Set width/height based on exact pixels that are rendered
         left, top, self.width, bottom = self.icon_font.getbbox(
@@ -894,10 +991,12 @@ class Icon(BaseComponent):
         self.height = -1 * top
 
     def render(self):
-        self.image_draw.text(
+        GlyphAtlas.draw_text(
+            self.image_draw,
             (self.screen_x, self.screen_y + self.height),
             text=self.icon_name,
-            font=self.icon_font,
+            font_name=self.icon_font_name,
+            size=self.icon_size,
             fill=self.icon_color,
             anchor="ls",
         )
@@ -1081,10 +1180,9 @@ class FormattedAddress(BaseComponent):
         else:
             display_address = self.address
 
+        # Both fixed-width fonts are drawn through the GlyphAtlas
+        self.accent_font_name = GUIConstants.FIXED_WIDTH_EMPHASIS_FONT_NAME
         self.font = Fonts.get_font(self.font_name, self.font_size)
-        self.accent_font = Fonts.get_font(
-            GUIConstants.FIXED_WIDTH_EMPHASIS_FONT_NAME, self.font_size
-        )
 
         # Fixed width font means we only have to measure one max-height character
         left, top, right, bottom = self.font.getbbox("Q")
@@ -1103,7 +1201,7 @@ class FormattedAddress(BaseComponent):
                     (addr_lines_x, cur_y),
                     display_str.split()[0],
                     self.font_accent_color,
-                    self.accent_font,
+                    self.accent_font_name,
                 )
             )
             self.text_params.append(
@@ -1111,7 +1209,7 @@ class FormattedAddress(BaseComponent):
                     (addr_lines_x + char_width * n, cur_y),
                     "...",
                     self.font_base_color,
-                    self.font,
+                    self.font_name,
                 )
             )
             self.text_params.append(
@@ -1119,7 +1217,7 @@ class FormattedAddress(BaseComponent):
                     (addr_lines_x + char_width * (n + 3), cur_y),
                     display_str.split()[2],
                     self.font_accent_color,
-                    self.accent_font,
+                    self.accent_font_name,
                 )
             )
             cur_y += char_height
@@ -1144,7 +1242,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x, cur_y),
                             cur_str.split()[0],
                             self.font_accent_color,
-                            self.accent_font,
+                            self.accent_font_name,
                         )
                     )
                     self.text_params.append(
@@ -1152,7 +1250,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x + char_width * (n + 1), cur_y),
                             cur_str.split()[1],
                             self.font_base_color,
-                            self.font,
+                            self.font_name,
                         )
                     )
 
@@ -1163,7 +1261,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x, cur_y),
                             cur_str.split()[0],
                             self.font_base_color,
-                            self.font,
+                            self.font_name,
                         )
                     )
                     self.text_params.append(
@@ -1171,7 +1269,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x + char_width * (len(cur_str) - (n)), cur_y),
                             cur_str.split()[1],
                             self.font_accent_color,
-                            self.accent_font,
+                            self.accent_font_name,
                         )
                     )
 
@@ -1183,7 +1281,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x, cur_y),
                             cur_str[: -1 * n - 3] + "...",
                             self.font_base_color,
-                            self.font,
+                            self.font_name,
                         )
                     )
                     self.text_params.append(
@@ -1191,7 +1289,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x + char_width * (len(cur_str) - (n)), cur_y),
                             display_address[-1 * n :],
                             self.font_accent_color,
-                            self.accent_font,
+                            self.accent_font_name,
                         )
                     )
                     cur_y += char_height
@@ -1204,7 +1302,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x, cur_y),
                             cur_str,
                             self.font_base_color,
-                            self.font,
+                            self.font_name,
                         )
                     )
 
@@ -1215,8 +1313,13 @@ class FormattedAddress(BaseComponent):
 
     def render(self):
         for p in self.text_params:
-            self.image_draw.text(
-                (p[0][0], p[0][1] + self.screen_y), text=p[1], fill=p[2], font=p[3]
+            GlyphAtlas.draw_text(
+                self.image_draw,
+                (p[0][0], p[0][1] + self.screen_y),
+                text=p[1],
+                font_name=p[3],
+                size=self.font_size,
+                fill=p[2],
             )
 
 
@@ -2030,9 +2133,13 @@ def linear_interp(a, b, t):
     return (int((1.0 - t) * a[0] + t * b[0]), int((1.0 - t) * a[1] + t * b[1]))
 
 
+# Per-step (1 - t, t) interpolation weights, cached by number of segments
+bezier_t_tables = {}
+
+
 def calc_bezier_curve(
     p1: Tuple[int, int], p2: Tuple[int, int], p3: Tuple[int, int], segments: int
-) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+) -> List[Tuple[int, int]]:
     """
     Calculates the points of a bezier curve between points p1 and p3 with p2 as a
     control point influencing the amount of curve deflection.
@@ -2044,19 +2151,23 @@ def calc_bezier_curve(
 
     And then interpolate over the two line segments
     Q1 = (1 - t)*L1(t) + t*L2(t)
+
+    The t values for each segment count are only computed once; the results are
+    identical to chaining `linear_interp()` calls.
     """
-    t_step = 1.0 / segments
+    if segments not in bezier_t_tables:
+        t_step = 1.0 / segments
+        bezier_t_tables[segments] = [
+            (1.0 - t_step * i, t_step * i) for i in range(1, segments)
+        ]
 
+    (x1, y1), (x2, y2), (x3, y3) = p1, p2, p3
     points = [p1]
-    for i in range(1, segments + 1):
-        t = t_step * i
-        if i == segments:
-            points.append(p3)
-            break
-        l1_t = linear_interp(p1, p2, t)
-        l2_t = linear_interp(p2, p3, t)
-        q1 = linear_interp(l1_t, l2_t, t)
-        points.append(q1)
+    for u, t in bezier_t_tables[segments]:
+        l1_x, l1_y = int(u * x1 + t * x2), int(u * y1 + t * y2)
+        l2_x, l2_y = int(u * x2 + t * x3), int(u * y2 + t * y3)
+        points.append((int(u * l1_x + t * l2_x), int(u * l1_y + t * l2_y)))
+    points.append(p3)
 
     return points
 
@@ -2294,3 +2405,47 @@ def resize_image_to_fill(
         resample=sampling_method,
         box=box,
     )
+
+
+
+@lru_cache(maxsize=4)
+def _fill_sample_indices(
+    rows: int, cols: int, target_size_x: int, target_size_y: int, quarter_turns: int
+):
+    """
+    Flat pixel indices into a (rows, cols) frame that produce the rotated, cropped
+    and nearest-neighbor resized image; computed once per geometry.
+    """
+    import numpy as np
+
+    rotated = np.rot90(np.arange(rows * cols).reshape(rows, cols), quarter_turns)
+    src_y, src_x = rotated.shape
+
+    # Same centered crop as `resize_image_to_fill`, sampled at pixel centers
+    scale = min(src_x / target_size_x, src_y / target_size_y)
+    x0 = (src_x - target_size_x * scale) / 2
+    y0 = (src_y - target_size_y * scale) / 2
+    sample_x = (x0 + (np.arange(target_size_x) + 0.5) * scale).astype(np.intp)
+    sample_y = (y0 + (np.arange(target_size_y) + 0.5) * scale).astype(np.intp)
+    return rotated[np.ix_(sample_y, sample_x)].ravel()
+
+
+def resize_frame_to_fill(
+    frame, target_size_x: int, target_size_y: int, quarter_turns: int = 0
+) -> Image:
+    """
+    Counterpart to `resize_image_to_fill` for raw (rows, cols, 3) uint8 camera
+    frames, also rotating by `quarter_turns` * 90° counter-clockwise. Rotation, crop
+    and nearest-neighbor downsampling are folded into one precomputed index, so each
+    frame is a single gather of the target-sized image (no full-frame copies).
+    """
+    import numpy as np
+
+    rows, cols = frame.shape[:2]
+    indices = _fill_sample_indices(rows, cols, target_size_x, target_size_y, quarter_turns)
+
+    # One 3-byte element per pixel so the gather moves whole pixels
+    pixels = np.ascontiguousarray(frame).reshape(-1, 3).view("V3").ravel()
+    return Image.fromarray(
+        pixels.take(indices).view(np.uint8).reshape(target_size_y, target_size_x, 3)
+    )
@@ -3,7 +3,12 @@ from PIL import Image, ImageDraw
 from typing import Tuple
 from gettext import gettext as _
 
-from seedcash.gui.components import Fonts, GUIConstants, SeedCashIconsConstants
+from seedcash.gui.components import (
+    Fonts,
+    GlyphAtlas,
+    GUIConstants,
+    SeedCashIconsConstants,
+)
 from seedcash.hardware.buttons import HardwareButtonsConstants
 
 
@@ -31,6 +36,7 @@ class Keyboard:
 
     REGULAR_KEY_FONT = "regular"
     ICON_KEY_FONT = GUIConstants.ICON_FONT_NAME__SEEDCASH
+    ICON_KEY_FONT_SIZE = 26
 
     KEY_BACKSPACE = {
         "code": "DEL",
@@ -115,20 +121,62 @@ class Keyboard:
         is_active: bool = True
         is_selected: bool = False
         is_additional_key: bool = False
+        rendered_state: Tuple[bool, bool] = None  # (is_active, is_selected) on canvas
 
         def __post_init__(self):
             if not self.code:
                 self.code = self.letter
 
+        @property
+        def rect(self) -> Tuple[int, int, int, int]:
+            return (
+                self.screen_x,
+                self.screen_y,
+                self.screen_x + self.keyboard.key_width * self.size,
+                self.screen_y + self.keyboard.key_height + 1,
+            )
+
+        @property
+        def state(self) -> Tuple[bool, bool]:
+            return (self.is_active, self.is_selected)
+
         def render_key(self):
-            font = self.keyboard.font
+            """
+            Pastes this Key's prerendered sprite for its current state, building the
+            sprite on first use. Falls back to drawing in place when the Keyboard has
+            no canvas to paste into.
+            """
+            self.rendered_state = self.state
+            self.keyboard.add_damage_rect(self.rect)
+
+            if self.keyboard.canvas is None:
+                self.draw_key(self.keyboard.draw, self.screen_x, self.screen_y)
+                return
+
+            sprite_key = (self.code, self.letter, self.size) + self.state
+            sprite = self.keyboard.key_sprites.get(sprite_key)
+            if sprite is None:
+                sprite = Image.new(
+                    "RGB",
+                    (self.rect[2] - self.rect[0], self.rect[3] - self.rect[1]),
+                    self.keyboard.deactivated_background_color,
+                )
+                self.draw_key(ImageDraw.Draw(sprite), 0, 0)
+                self.keyboard.key_sprites[sprite_key] = sprite
+
+            self.keyboard.canvas.paste(sprite, (self.screen_x, self.screen_y))
+
+        def draw_key(self, draw: ImageDraw.ImageDraw, x: int, y: int):
+            font_name = self.keyboard.font_name
+            font_size = self.keyboard.font_size
             text_height = self.keyboard.text_height
             if self.is_additional_key:
                 if (
                     Keyboard.ADDITIONAL_KEYS[self.code]["font"]
                     == Keyboard.ICON_KEY_FONT
                 ):
-                    font = self.keyboard.icon_key_font
+                    font_name = Keyboard.ICON_KEY_FONT
+                    font_size = Keyboard.ICON_KEY_FONT_SIZE
                     text_height = self.keyboard.icon_key_height
 
             outline_color = "#333"
@@ -153,34 +201,37 @@ class Keyboard:
                     rect_color = self.keyboard.background_color
                     font_color = "#e8e8e8"
 
-            self.keyboard.draw.rounded_rectangle(
+            draw.rounded_rectangle(
                 (
-                    self.screen_x,
-                    self.screen_y,
-                    self.screen_x + self.keyboard.key_width * self.size - 1,
-                    self.screen_y + self.keyboard.key_height,
+                    x,
+                    y,
+                    x + self.keyboard.key_width * self.size - 1,
+                    y + self.keyboard.key_height,
                 ),
                 outline=outline_color,
                 fill=rect_color,
                 radius=4,
             )
 
-            self.keyboard.draw.text(
+            GlyphAtlas.draw_text(
+                draw,
                 (
-                    self.screen_x + int(self.keyboard.key_width * self.size / 2),
-                    self.screen_y
+                    x + int(self.keyboard.key_width * self.size / 2),
+                    y
                     + self.keyboard.key_height
                     - int((self.keyboard.key_height - text_height) / 2),
                 ),
                 self.letter,
+                font_name=font_name,
+                size=font_size,
                 fill=font_color,
-                font=font,
                 anchor="ms",
             )
 
     def __init__(
         self,
         draw: ImageDraw,
+        canvas: Image = None,
         charset="1234567890abcdefghijklmnopqrstuvwxyz",
         font_name=GUIConstants.FIXED_WIDTH_EMPHASIS_FONT_NAME,
         font_size=24,
@@ -196,12 +247,21 @@ class Keyboard:
         """
         `auto_wrap` specifies which edges the keyboard is allowed to loop back when
         navigating past the end.
+
+        `canvas` should be the Image that `draw` writes to. When provided, each Key's
+        active/inactive/selected looks are prerendered once as sprites and pasted in,
+        rather than redrawn on every selection change.
         """
         self.draw = draw
+        self.canvas = canvas
+        self.key_sprites = {}
+        self.damage_rect = None
         self.charset = charset
         self.rows = rows
         self.cols = cols
         self.rect = rect
+        self.font_name = font_name
+        self.font_size = font_size
         self.font = Fonts.get_font(font_name, font_size)
 
         self.auto_wrap = auto_wrap
@@ -226,7 +286,21 @@ class Keyboard:
 
         # Set up the rendering and state params
         self.active_keys = list(self.charset)
-        self.icon_key_font = Fonts.get_font(GUIConstants.ICON_FONT_NAME__SEEDCASH, 26)
+        self.icon_key_font = Fonts.get_font(
+            Keyboard.ICON_KEY_FONT, Keyboard.ICON_KEY_FONT_SIZE
+        )
+
+        # Rasterize every key label up front so navigation only stamps cached glyphs
+        GlyphAtlas.bake(font_name, font_size, charset)
+        GlyphAtlas.bake(
+            Keyboard.ICON_KEY_FONT,
+            Keyboard.ICON_KEY_FONT_SIZE,
+            "".join(
+                additional_key["letter"]
+                for additional_key in additional_keys
+                if additional_key["font"] == Keyboard.ICON_KEY_FONT
+            ),
+        )
 
         # Fixed-width fonts will all have same height, ignoring below baseline (e.g. "Q" or "q")
         (left, top, right, bottom) = self.font.getbbox("X", anchor="ls")
@@ -304,7 +378,32 @@ class Keyboard:
             # Render the initial highlighted character
             self.update_from_input(input=None)
 
+    def add_damage_rect(self, rect: Tuple[int, int, int, int]):
+        if self.damage_rect is None:
+            self.damage_rect = rect
+        else:
+            self.damage_rect = (
+                min(self.damage_rect[0], rect[0]),
+                min(self.damage_rect[1], rect[1]),
+                max(self.damage_rect[2], rect[2]),
+                max(self.damage_rect[3], rect[3]),
+            )
+
+    def pop_damage_rect(self) -> Tuple[int, int, int, int]:
+        """
+        Returns the bounding rect of everything the keyboard has redrawn since the
+        last `update_from_input()` (or the last pop) so that the Screen can push just
+        that region via `Renderer.show_image_rect()`.
+        """
+        damage_rect = self.damage_rect
+        self.damage_rect = None
+        return damage_rect
+
     def update_active_keys(self, active_keys):
+        """
+        Updates each Key's active state but does not render. Follow up with
+        `render_changed_keys()` to redraw just the Keys whose state actually changed.
+        """
         self.active_keys = active_keys
         for i, row_keys in enumerate(self.keys):
             for j, key in enumerate(row_keys):
@@ -333,6 +432,19 @@ class Keyboard:
                     self.selected_key["x"] = j
                 key.render_key()
 
+        self.damage_rect = self.rect
+
+    def render_changed_keys(self):
+        """
+        Redraws only the Keys whose active/selected state differs from what was last
+        rendered. Assumes nothing else has drawn over the keyboard since then (e.g. a
+        different Keyboard sharing the same rect); use `render_keys()` in that case.
+        """
+        for row_keys in self.keys:
+            for key in row_keys:
+                if key.rendered_state != key.state:
+                    key.render_key()
+
     def get_selected_key(self):
         return self.get_key_at(self.selected_key["x"], self.selected_key["y"])
 
@@ -412,6 +524,7 @@ class Keyboard:
 
         Does NOT call self.renderer.show_image to avoid multiple calls on the same screen.
         """
+        self.damage_rect = None
         key = self.get_key_at(self.selected_key["x"], self.selected_key["y"])
 
         # Before we update, undo our previously self.selected_key key
@@ -92,6 +92,30 @@ class Renderer(ConfigurableSingleton):
 
         self.disp.show_image(self.canvas, 0, 0)
 
+    def show_image_rect(self, rect):
+        """
+        Pushes just the `rect` (x0, y0, x1, y1) region of the current canvas to the
+        display, e.g. the damage rect reported by `Keyboard.pop_damage_rect()`.
+
+        Falls back to a full-frame push on display drivers that can't write a partial
+        window.
+        """
+        if rect is None:
+            return
+
+        if not self.disp.supports_partial_update:
+            self.disp.show_image(self.canvas, 0, 0)
+            return
+
+        x0 = max(0, rect[0])
+        y0 = max(0, rect[1])
+        x1 = min(self.canvas_width, rect[2])
+        y1 = min(self.canvas_height, rect[3])
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        self.disp.show_image_partial(self.canvas.crop((x0, y0, x1, y1)), x0, y0)
+
     def show_image_pan(
         self, image, start_x, start_y, end_x, end_y, rate, alpha_overlay=None
     ):
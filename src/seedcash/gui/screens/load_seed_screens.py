@@ -272,6 +272,7 @@ class SeedMnemonicEntryScreen(BaseTopNavScreen):
         # TODO: support other BIP39 languages/charsets
         self.keyboard = Keyboard(
             draw=self.image_draw,
+            canvas=self.canvas,
             charset=self.possible_alphabet,
             rows=5,
             cols=6,
@@ -546,7 +547,7 @@ class SeedMnemonicEntryScreen(BaseTopNavScreen):
                         self.keyboard.update_active_keys(
                             active_keys=self.possible_alphabet
                         )
-                        self.keyboard.render_keys()
+                        self.keyboard.render_changed_keys()
 
                         # Update the right-hand possible matches area
                         self.render_possible_matches()
@@ -648,7 +649,7 @@ class SeedMnemonicEntryScreen(BaseTopNavScreen):
                         # If there's only one possible letter left, select it
                         self.keyboard.set_selected_key(self.possible_alphabet[0])
 
-                    self.keyboard.render_keys()
+                    self.keyboard.render_changed_keys()
 
                 elif (
                     input in HardwareButtonsConstants.KEYS__LEFT_RIGHT_UP_DOWN
@@ -905,6 +906,7 @@ class SeedAddPassphraseScreen(BaseTopNavScreen):
         )
         self.keyboard_abc = Keyboard(
             draw=self.renderer.draw,
+            canvas=self.renderer.canvas,
             charset=keys_lower,
             rows=4,
             cols=max_cols,
@@ -927,6 +929,7 @@ class SeedAddPassphraseScreen(BaseTopNavScreen):
 
         self.keyboard_ABC = Keyboard(
             draw=self.renderer.draw,
+            canvas=self.renderer.canvas,
             charset=keys_upper,
             rows=4,
             cols=max_cols,
@@ -950,6 +953,7 @@ class SeedAddPassphraseScreen(BaseTopNavScreen):
 
         self.keyboard_digits = Keyboard(
             draw=self.renderer.draw,
+            canvas=self.renderer.canvas,
             charset=keys_number,
             rows=3,
             cols=5,
@@ -972,6 +976,7 @@ class SeedAddPassphraseScreen(BaseTopNavScreen):
 
         self.keyboard_symbols_1 = Keyboard(
             draw=self.renderer.draw,
+            canvas=self.renderer.canvas,
             charset=keys_symbol_1,
             rows=4,
             cols=6,
@@ -995,6 +1000,7 @@ class SeedAddPassphraseScreen(BaseTopNavScreen):
 
         self.keyboard_symbols_2 = Keyboard(
             draw=self.renderer.draw,
+            canvas=self.renderer.canvas,
             charset=keys_symbol_2,
             rows=4,
             cols=6,
@@ -1316,12 +1322,13 @@ class SeedAddPassphraseScreen(BaseTopNavScreen):
 
                 elif (
                     input in HardwareButtonsConstants.KEYS__LEFT_RIGHT_UP_DOWN
-                    or keyboard_swap
+                    and not keyboard_swap
                 ):
                     # Live joystick movement; haven't locked this new letter in yet.
-                    # Leave current spot blank for now. Only update the active keyboard keys
-                    # when a selection has been locked in (KEY_PRESS) or removed ("del").
-                    pass
+                    # Only the previous and newly selected keys changed so just push
+                    # that region.
+                    self.renderer.show_image_rect(cur_keyboard.pop_damage_rect())
+                    continue
 
                 if keyboard_swap:
                     # Show the hw buttons' updated text and not active state
@@ -1647,6 +1654,7 @@ class SeedGenerateAddressScreen(BaseTopNavScreen):
 
         self.keyboard = Keyboard(
             draw=self.renderer.draw,
+            canvas=self.renderer.canvas,
             charset="1234567890",
             rows=3,
             cols=4,
@@ -451,15 +451,13 @@ class PSBTOverviewScreen(PSBTButtonListScreen):
 
             input_curves.append(bezier_points)
 
-            prev_pt = bezier_points[0]
-            for pt in bezier_points[1:]:
-                draw.line(
-                    (prev_pt[0], prev_pt[1], pt[0], pt[1]),
-                    fill=association_line_color,
-                    width=association_line_width + 1,
-                    joint="curve",
-                )
-                prev_pt = pt
+            # Render the whole polyline in one call so the joints are smoothed
+            draw.line(
+                bezier_points,
+                fill=association_line_color,
+                width=association_line_width + 1,
+                joint="curve",
+            )
 
             inputs_y += inputs_y_spacing
 
@@ -538,15 +536,13 @@ class PSBTOverviewScreen(PSBTButtonListScreen):
 
             output_curves.append(bezier_points)
 
-            prev_pt = bezier_points[0]
-            for pt in bezier_points[1:]:
-                draw.line(
-                    (prev_pt[0], prev_pt[1], pt[0], pt[1]),
-                    fill=association_line_color,
-                    width=association_line_width + 1,
-                    joint="curve",
-                )
-                prev_pt = pt
+            # Render the whole polyline in one call so the joints are smoothed
+            draw.line(
+                bezier_points,
+                fill=association_line_color,
+                width=association_line_width + 1,
+                joint="curve",
+            )
 
             destination_y += destination_y_spacing
 
@@ -554,11 +550,11 @@ class PSBTOverviewScreen(PSBTButtonListScreen):
         image = image.resize(
             (self.canvas_width, chart_height), Image.Resampling.LANCZOS
         )
-        self.paste_images.append(
-            (image.filter(ImageFilter.SHARPEN), (self.chart_x, self.chart_y))
-        )
+        chart_image = image.filter(ImageFilter.SHARPEN)
+        self.paste_images.append((chart_image, (self.chart_x, self.chart_y)))
 
-        # Pass input and output curves to the animation thread
+        # Pass input and output curves to the animation thread along with the static
+        # chart so each frame only has to composite the moving pulse over it.
         self.threads.append(
             PSBTOverviewScreen.TxExplorerAnimationThread(
                 pulse_color=self.category.icon_color,
@@ -567,12 +563,24 @@ class PSBTOverviewScreen(PSBTButtonListScreen):
                 supersampling_factor=ssf,
                 offset_y=self.chart_y,
                 renderer=self.renderer,
+                chart_image=chart_image,
+                chart_x=self.chart_x,
             )
         )
 
     class TxExplorerAnimationThread(BaseThread):
+        PULSE_LENGTH = 10  # Number of line segments lit at once
+
         def __init__(
-            self, pulse_color, inputs, outputs, supersampling_factor, offset_y, renderer: Renderer
+            self,
+            pulse_color,
+            inputs,
+            outputs,
+            supersampling_factor,
+            offset_y,
+            renderer: Renderer,
+            chart_image: Image.Image,
+            chart_x: int = 0,
         ):
             super().__init__()
             self.pulse_color = pulse_color
@@ -587,14 +595,20 @@ class PSBTOverviewScreen(PSBTButtonListScreen):
                 for curve in outputs
             ]
             self.renderer = renderer
+            self.chart_image = chart_image
+            self.chart_rect = (
+                chart_x,
+                offset_y,
+                chart_x + chart_image.width,
+                offset_y + chart_image.height,
+            )
 
-        def run(self):
-            pulse_color = self.pulse_color
-            reset_color = "#666"
-            line_width = 3
-
-            pulses = []
-
+        def calc_path_segments(self) -> list[list[tuple[int, int, int, int]]]:
+            """
+            Flattens the input curves, center bar, and output curves into a single
+            path where each step is the list of line segments (one per curve) that the
+            pulse lights up at that point in its travel.
+            """
             # The center bar needs to be segmented to support animation across it
             start_pt = self.inputs[0][-1]
             end_pt = self.outputs[0][0]
@@ -611,58 +625,83 @@ class PSBTOverviewScreen(PSBTButtonListScreen):
                     end_pt,
                 ]
 
-            def draw_line_segment(curves, i, j, color):
-                # print(f"draw: {curves[0][i]} to {curves[0][j]}")
-                for points in curves:
-                    pt1 = points[i]
-                    pt2 = points[j]
-                    self.renderer.draw.line(
-                        (pt1[0], pt1[1], pt2[0], pt2[1]), fill=color, width=line_width
+            path_segments = []
+            for curves in [self.inputs, [center_bar_pts], self.outputs]:
+                for i in range(len(curves[0]) - 1):
+                    path_segments.append(
+                        [
+                            (points[i][0], points[i][1], points[i + 1][0], points[i + 1][1])
+                            for points in curves
+                        ]
                     )
+            return path_segments
 
-            prev_color = reset_color
+        def run(self):
+            line_width = 3
+            path_segments = self.calc_path_segments()
+            chart_x, chart_y = self.chart_rect[:2]
+
+            def segment_rect(segment):
+                # Chart-relative bounds of a line segment, padded for its width
+                return (
+                    max(0, min(segment[0], segment[2]) - chart_x - line_width),
+                    max(0, min(segment[1], segment[3]) - chart_y - line_width),
+                    min(
+                        self.chart_image.width,
+                        max(segment[0], segment[2]) - chart_x + line_width + 1,
+                    ),
+                    min(
+                        self.chart_image.height,
+                        max(segment[1], segment[3]) - chart_y + line_width + 1,
+                    ),
+                )
+
+            # Each cycle the pulse's head travels the full path and then its tail
+            # follows it out. Segments that go dark are restored from the cached static
+            # chart rather than redrawn, so only the moving pulse is composited.
+            num_frames = len(path_segments) + self.PULSE_LENGTH + 1
+            frame = 0
+            prev_lit_steps = range(0)
             while self.keep_running:
+                first_lit = max(0, frame - self.PULSE_LENGTH + 1)
+                lit_steps = range(first_lit, min(frame + 1, len(path_segments)))
+
+                dark_steps = [step for step in prev_lit_steps if step not in lit_steps]
+                new_steps = [step for step in lit_steps if step not in prev_lit_steps]
+
                 with self.renderer.lock:
-                    # Only generate one new pulse at a time; trailing "reset_color" pulse
-                    # erases the most recent pulse.
-                    if not pulses or (
-                        prev_color == pulse_color and pulses[-1][0] == 10
-                    ):
-                        # Create a new pulse
-                        if prev_color == pulse_color:
-                            pulses.append([0, reset_color])
-                        else:
-                            pulses.append([0, pulse_color])
-                        prev_color = pulses[-1][1]
-
-                    for pulse_num, pulse in enumerate(pulses):
-                        i = pulse[0]
-                        color = pulse[1]
-                        if i < len(self.inputs[0]) - 1:
-                            # We're in the input curves
-                            draw_line_segment(self.inputs, i, i + 1, color)
-                        elif i < len(self.inputs[0]) + len(center_bar_pts) - 2:
-                            # We're in the center bar
-                            index = i - len(self.inputs[0]) + 1
-                            draw_line_segment([center_bar_pts], index, index + 1, color)
-                        elif (
-                            i
-                            < len(self.inputs[0])
-                            + len(center_bar_pts)
-                            - 2
-                            + len(self.outputs[0])
-                            - 1
-                        ):
-                            index = i - (len(self.inputs[0]) + len(center_bar_pts) - 2)
-                            draw_line_segment(self.outputs, index, index + 1, color)
-                        else:
-                            # This pulse is done
-                            del pulses[pulse_num]
-                            continue
+                    for step in dark_steps:
+                        for segment in path_segments[step]:
+                            rect = segment_rect(segment)
+                            self.renderer.canvas.paste(
+                                self.chart_image.crop(rect),
+                                (chart_x + rect[0], chart_y + rect[1]),
+                            )
 
-                        pulse[0] += 1
+                    # Restoring a dark segment can clip a lit neighbor; redraw them all
+                    for step in lit_steps:
+                        for segment in path_segments[step]:
+                            self.renderer.draw.line(
+                                segment, fill=self.pulse_color, width=line_width
+                            )
+
+                    changed_rects = [
+                        segment_rect(segment)
+                        for step in dark_steps + new_steps
+                        for segment in path_segments[step]
+                    ]
+                    if changed_rects:
+                        self.renderer.show_image_rect(
+                            (
+                                chart_x + min(rect[0] for rect in changed_rects),
+                                chart_y + min(rect[1] for rect in changed_rects),
+                                chart_x + max(rect[2] for rect in changed_rects),
+                                chart_y + max(rect[3] for rect in changed_rects),
+                            )
+                        )
 
-                    self.renderer.show_image()
+                prev_lit_steps = lit_steps
+                frame = (frame + 1) % num_frames
 
                 # No need to CPU limit when running in its own thread?
                 time.sleep(0.02)
@@ -5,10 +5,11 @@ from gettext import gettext as _
 from PIL import Image, ImageDraw
 
 from seedcash.gui import renderer
-from seedcash.gui.components import GUIConstants, Fonts, resize_image_to_fill
+from seedcash.gui.components import GUIConstants, Fonts, resize_frame_to_fill
 from seedcash.models.threads import BaseThread
 from seedcash.models.threads import ThreadsafeCounter
 from seedcash.models.decode_qr import DecodeQR
+from seedcash.models.scan_controller import ScanController, ScanProfile
 from .screen import BaseScreen
 
 
@@ -30,10 +31,10 @@ class ScanScreen(BaseScreen):
 
     Note: performance tuning was targeted for the Pi Zero.
 
-    The resolution (480x480) has not been tweaked in order to guarantee that our
-    decoding abilities remain as-is. It's possible that more optimizations could be made
-    here (e.g. higher res w/no performance impact? Lower res w/same decoding but faster
-    performance? etc).
+    Resolution, framerate and the region of the frame that is decoded are tuned at
+    runtime by a `ScanController`, starting from the profile last used on this board
+    type (480x480 @ 6fps on a fresh Pi Zero). Passing `resolution`/`framerate`
+    overrides the starting point.
 
     Note: This is quite a lot of important tasks for a Screen to be managing; much of
     this should probably be refactored into the Controller.
@@ -41,8 +42,8 @@ class ScanScreen(BaseScreen):
 
     decoder: DecodeQR = None
     instructions_text: str = None
-    resolution: tuple[int, int] = (480, 480)
-    framerate: int = 6  # TODO: alternate optimization for Pi Zero 2W?
+    resolution: tuple[int, int] = None
+    framerate: int = None
     render_rect: tuple[int, int, int, int] = None
 
     FRAME__ADDED_PART = 1
@@ -58,9 +59,19 @@ class ScanScreen(BaseScreen):
         # TODO: Arrange this with UI elements rather than text
         self.instructions_text = "< " + _("back") + "  |  " + _(self.instructions_text)
 
+        self.scan_controller = ScanController()
+        profile = self.scan_controller.profile
+        if self.resolution or self.framerate:
+            profile = ScanProfile(
+                resolution=self.resolution or profile.resolution,
+                framerate=self.framerate or profile.framerate,
+            )
+            self.scan_controller = ScanController(profile=profile)
+            profile = self.scan_controller.profile
+
         self.camera = Camera.get_instance()
         self.camera.start_video_stream_mode(
-            resolution=self.resolution, framerate=self.framerate, format="rgb"
+            resolution=profile.resolution, framerate=profile.framerate, format="rgb"
         )
 
         self.frames_decode_status = ThreadsafeCounter()
@@ -127,7 +138,7 @@ class ScanScreen(BaseScreen):
             debug = False
             show_framerate = False  # enable for debugging / testing
             while self.keep_running:
-                frame = self.camera.read_video_stream(as_image=True)
+                frame = self.camera.read_video_stream()
                 if frame is not None:
                     num_frames += 1
                     cur_time = time.time()
@@ -149,12 +160,12 @@ class ScanScreen(BaseScreen):
                             scan_text += f" {cur_fps:0.2f} | {self.decoder_fps}"
 
                     with self.renderer.lock:
-                        # Use nearest neighbor resizing for max speed
-                        frame = resize_image_to_fill(
+                        # Rotate, crop and nearest-neighbor downsample in one pass
+                        frame = resize_frame_to_fill(
                             frame,
                             self.render_width,
                             self.render_height,
-                            sampling_method=Image.Resampling.NEAREST,
+                            quarter_turns=self.camera.preview_quarter_turns,
                         )
 
                         if scan_text:
@@ -345,7 +356,11 @@ class ScanScreen(BaseScreen):
         while True:
             frame = self.camera.read_video_stream()
             if frame is not None:
-                status = self.decoder.add_image(frame)
+                decode_start = time.time()
+                status = self.decoder.add_image(self.scan_controller.crop(frame))
+                new_profile = self.scan_controller.record(
+                    status, time.time() - decode_start, rect=self.decoder.last_rect
+                )
 
                 num_frames += 1
                 decoder_fps = f"{num_frames / (time.time() - start_time):0.2f}"
@@ -353,8 +368,17 @@ class ScanScreen(BaseScreen):
 
                 if status in (DecodeQRStatus.COMPLETE, DecodeQRStatus.INVALID):
                     self.camera.stop_video_stream_mode()
+                    if status == DecodeQRStatus.COMPLETE:
+                        self.scan_controller.complete()
                     break
 
+                if new_profile:
+                    self.camera.restart_video_stream_mode(
+                        resolution=new_profile.resolution,
+                        framerate=new_profile.framerate,
+                        format="rgb",
+                    )
+
                 self.frames_decoded_counter.increment()
                 # Notify the live preview thread how our most recent decode went
                 if status == DecodeQRStatus.FALSE:
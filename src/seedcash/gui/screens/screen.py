@@ -21,7 +21,7 @@ from seedcash.gui.components import (
 )
 from seedcash.gui.keyboard import Keyboard, TextEntryDisplay
 from seedcash.hardware.buttons import HardwareButtonsConstants, HardwareButtons
-from seedcash.models.encode_qr import BaseQrEncoder
+from seedcash.models.encode_qr import QR_FRAME_SECONDS, BaseQrEncoder
 from seedcash.models.threads import BaseThread, ThreadsafeCounter
 
 logger = logging.getLogger(__name__)
@@ -342,6 +342,60 @@ class ButtonOption:
     font_size: int = None  # Optional override
 
 
+class LazyButtonList:
+    """
+    Sequence of a ButtonListScreen's Buttons that only instantiates each Button when
+    it's first accessed so that lists with hundreds of entries (PSBT outputs, SLIP-39
+    shares, addresses) open in time proportional to the rows actually on screen.
+
+    All Buttons in the list share the same `scroll_y`. Iterating yields just the
+    Buttons that currently exist, which is all the screens' scroll loops need.
+    """
+
+    def __init__(self, num_buttons: int, build_button, initial_scroll_y: int = 0):
+        self.num_buttons = num_buttons
+        self.build_button = build_button
+        self.initial_scroll_y = initial_scroll_y
+        self.built_buttons: dict[int, Button] = {}
+
+    def __len__(self) -> int:
+        return self.num_buttons
+
+    def __getitem__(self, i: int) -> Button:
+        if i < 0:
+            i += self.num_buttons
+        if not 0 <= i < self.num_buttons:
+            raise IndexError(f"Button index {i} out of range")
+
+        button = self.built_buttons.get(i)
+        if button is None:
+            button = self.build_button(i)
+            self.built_buttons[i] = button
+        return button
+
+    def __iter__(self):
+        return iter(list(self.built_buttons.values()))
+
+    @property
+    def scroll_y(self) -> int:
+        for button in self.built_buttons.values():
+            return button.scroll_y
+        return self.initial_scroll_y
+
+    def recycle(self, keep: range):
+        """Drop the Buttons outside of `keep`; the selected Button is always retained"""
+        for i in list(self.built_buttons.keys()):
+            button = self.built_buttons[i]
+            if i in keep or button.is_selected:
+                continue
+
+            # Carry the shared scroll position if this was the last built Button
+            self.initial_scroll_y = button.scroll_y
+            for thread in button.threads:
+                thread.stop()
+            del self.built_buttons[i]
+
+
 @dataclass
 class ButtonListScreen(BaseScreen):
     # Class attributes with default values
@@ -363,6 +417,9 @@ class ButtonListScreen(BaseScreen):
     # Scroll position persistence
     scroll_y_initial_offset: int = None  # Initial scroll offset for rendering
 
+    # Extra rows above/below the viewport whose Buttons are kept around while scrolling
+    BUTTON_CACHE_MARGIN = 2
+
     def __post_init__(self):
         """Initialize screen and button layout after instance creation"""
         # Set default font if not specified
@@ -426,44 +483,17 @@ class ButtonListScreen(BaseScreen):
                     button_height + GUIConstants.LIST_ITEM_PADDING
                 ) * (self.selected_button - num_buttons_pre_scroll + 1)
 
-        # Create button instances
-        self.buttons: List[Button] = []
-        for i, button_option in enumerate(self.button_data):
+        # Buttons are only built once they're scrolled near the viewport
+        self.button_list_y = button_list_y
+        self.button_step = button_height + GUIConstants.LIST_ITEM_PADDING
+        for button_option in self.button_data:
             if type(button_option) != ButtonOption:
                 raise Exception("Button data must use ButtonOption class")
-
-            # Configure button properties
-            button_kwargs = dict(
-                text=_(button_option.button_label),  # Localized button text
-                active_text=_(
-                    button_option.active_button_label
-                ),  # Localized active state text
-                icon_name=button_option.icon_name,  # Optional left icon
-                icon_color=button_option.icon_color or GUIConstants.BUTTON_FONT_COLOR,
-                is_icon_inline=True,
-                right_icon_name=button_option.right_icon_name,  # Optional right icon
-                screen_x=GUIConstants.EDGE_PADDING,  # X position (fixed to left edge)
-                screen_y=button_list_y
-                + i * (button_height + GUIConstants.LIST_ITEM_PADDING),
-                scroll_y=self.scroll_y_initial_offset or 0,  # Initial scroll position
-                width=self.canvas_width - (2 * GUIConstants.EDGE_PADDING),  # Full width
-                height=button_height,
-                is_text_centered=self.is_button_text_centered,
-                font_name=button_option.font_name or self.button_font_name,
-                font_size=button_option.font_size or self.button_font_size,
-                font_color=button_option.button_label_color
-                or GUIConstants.BUTTON_FONT_COLOR,
-                selected_color=button_option.button_color,
-                is_scrollable_text=True,  # Enables text scrolling for long labels
-            )
-
-            # Add checkmark if this is a checked button
-            if self.checked_buttons and i in self.checked_buttons:
-                button_kwargs["is_checked"] = True
-
-            # Create and store button instance
-            button = self.Button_cls(**button_kwargs)
-            self.buttons.append(button)
+        self.buttons = LazyButtonList(
+            num_buttons=len(self.button_data),
+            build_button=self._build_button,
+            initial_scroll_y=self.scroll_y_initial_offset or 0,
+        )
 
         # Create scroll arrows if needed
         if self.has_scroll_arrows:
@@ -510,6 +540,42 @@ class ButtonListScreen(BaseScreen):
         cur_selected_button = self.buttons[self.selected_button]
         cur_selected_button.is_selected = True
 
+    def _build_button(self, i: int) -> Button:
+        """Instantiate the Button for `button_data[i]`"""
+        button_option = self.button_data[i]
+
+        # Configure button properties
+        button_kwargs = dict(
+            text=_(button_option.button_label),  # Localized button text
+            active_text=_(
+                button_option.active_button_label
+            ),  # Localized active state text
+            icon_name=button_option.icon_name,  # Optional left icon
+            icon_color=button_option.icon_color or GUIConstants.BUTTON_FONT_COLOR,
+            is_icon_inline=True,
+            right_icon_name=button_option.right_icon_name,  # Optional right icon
+            screen_x=GUIConstants.EDGE_PADDING,  # X position (fixed to left edge)
+            screen_y=self.button_list_y + i * self.button_step,
+            scroll_y=self.buttons.scroll_y,  # Current (shared) scroll position
+            width=self.canvas_width - (2 * GUIConstants.EDGE_PADDING),  # Full width
+            height=GUIConstants.BUTTON_HEIGHT,
+            is_text_centered=self.is_button_text_centered,
+            font_name=button_option.font_name or self.button_font_name,
+            font_size=button_option.font_size or self.button_font_size,
+            font_color=button_option.button_label_color
+            or GUIConstants.BUTTON_FONT_COLOR,
+            selected_color=button_option.button_color,
+            is_scrollable_text=True,  # Enables text scrolling for long labels
+        )
+
+        # Add checkmark if this is a checked button
+        if self.checked_buttons and i in self.checked_buttons:
+            button_kwargs["is_checked"] = True
+
+        button = self.Button_cls(**button_kwargs)
+        button.is_selected = i == self.selected_button
+        return button
+
     def get_threads(self) -> List[BaseThread]:
         """Get all active threads including button animation threads"""
         threads = super().get_threads()
@@ -530,27 +596,42 @@ class ButtonListScreen(BaseScreen):
             self._render_up_arrow()
             self._render_down_arrow()
 
-        for i, button in enumerate(self.buttons):
-            # Skip rendering if no scrolling needed
-            if not self.has_scroll_arrows:
-                button.render()
-                continue
+        if not self.has_scroll_arrows:
+            # Short list; everything fits on screen
+            for i in range(len(self.buttons)):
+                self.buttons[i].render()
+            return
+
+        # Only the rows that overlap the visible area need to exist
+        scroll_y = self.buttons.scroll_y
+        first = max(
+            0,
+            math.ceil(
+                (GUIConstants.TOP_NAV_HEIGHT + scroll_y - self.button_list_y)
+                / self.button_step
+            ),
+        )
+        last = min(
+            len(self.buttons) - 1,
+            (self.down_arrow_img_y - 1 + scroll_y - self.button_list_y)
+            // self.button_step,
+        )
 
-            # Calculate button's visible position
-            button_position_y = button.screen_y - button.scroll_y
+        for i in range(first, last + 1):
+            # Hide arrows when reaching list boundaries
+            if i == 0:
+                self._hide_up_arrow()
+            if i == len(self.buttons) - 1:
+                self._hide_down_arrow()
 
-            # Only render if button is within visible area
-            if (
-                button_position_y >= GUIConstants.TOP_NAV_HEIGHT
-                and button_position_y < self.down_arrow_img_y
-            ):
-                # Hide arrows when reaching list boundaries
-                if i == 0:
-                    self._hide_up_arrow()
-                if i == len(self.buttons) - 1:
-                    self._hide_down_arrow()
+            self.buttons[i].render()  # Render visible button
 
-                button.render()  # Render visible button
+        # Release Buttons that have scrolled well out of view
+        self.buttons.recycle(
+            keep=range(
+                first - self.BUTTON_CACHE_MARGIN, last + self.BUTTON_CACHE_MARGIN + 1
+            )
+        )
 
     def _render_up_arrow(self):
         """Render the scroll up indicator arrow"""
@@ -686,17 +767,53 @@ class QRDisplayScreen(BaseScreen):
     qr_encoder: BaseQrEncoder = None
     qr_brightness: ThreadsafeCounter = field(default_factory=lambda: ThreadsafeCounter(initial_value=255))
     tips_start_time: ThreadsafeCounter = field(default_factory=lambda: ThreadsafeCounter(initial_value=0))
+    status_text: str = None  # e.g. what the export costs; shown briefly up top
 
     class QRDisplayThread(BaseThread):
-        def __init__(self, qr_encoder: BaseQrEncoder, qr_brightness: ThreadsafeCounter, tips_start_time: ThreadsafeCounter):
+        def __init__(self, qr_encoder: BaseQrEncoder, qr_brightness: ThreadsafeCounter, tips_start_time: ThreadsafeCounter, status_text: str = None):
             from seedcash.gui.renderer import Renderer
 
             super().__init__()
             self.qr_encoder = qr_encoder
             self.qr_brightness = qr_brightness
             self.tips_start_time = tips_start_time
+            self.status_text = status_text
             self.renderer = Renderer.get_instance()
 
+        def render_status_line(self, image: Image.Image) -> None:
+            rectangle_width = image.width
+            rectangle_height = (
+                GUIConstants.COMPONENT_PADDING * 2 + GUIConstants.BODY_FONT_SIZE
+            )
+            rectangle = Image.new(
+                "RGBA", (rectangle_width, rectangle_height), (0, 0, 0, 0)
+            )
+            img_draw = ImageDraw.Draw(rectangle)
+
+            overlay_opacity = 224
+            img_draw.rounded_rectangle(
+                (1, 0, rectangle_width - 2, rectangle_height - 1),
+                radius=8,
+                fill=(0, 0, 0, overlay_opacity),
+            )
+
+            TextArea(
+                image_draw=img_draw,
+                canvas=rectangle,
+                text=self.status_text,
+                font_size=GUIConstants.BODY_FONT_SIZE,
+                background_color=(0, 0, 0, overlay_opacity),
+                edge_padding=0,
+                is_text_centered=True,
+                auto_line_break=False,
+                width=rectangle_width,
+                screen_x=0,
+                screen_y=GUIConstants.COMPONENT_PADDING,
+                allow_text_overflow=False,
+            ).render()
+
+            image.paste(rectangle, (0, 1), rectangle)
+
         def render_brightness_tip(self, image: Image.Image) -> None:
             # TODO: Refactor ToastOverlay to support two lines of icon + text and use
             # that instead of this more manual approach.
@@ -789,6 +906,7 @@ class QRDisplayScreen(BaseScreen):
 
         def run(self):
             pending_encoder_restart = False
+            status_start_time = time.time_ns()
 
             # Loop whether the QR is a single frame or animated; each loop might adjust
             # brightness setting.
@@ -800,8 +918,13 @@ class QRDisplayScreen(BaseScreen):
                 duration = 10**9 * 1.2  # 1.2 seconds
                 display_tip = time.time_ns() - self.tips_start_time.cur_count < duration
 
-                # Only advance the QR animation when the brightness tip is not displayed
-                if display_tip:
+                # The status line opens the screen and comes back with the tip
+                display_status = self.status_text and (
+                    display_tip or time.time_ns() - status_start_time < 2 * duration
+                )
+
+                # Only advance the QR animation when no overlay is displayed
+                if display_tip or display_status:
                     pending_encoder_restart = True
                 elif pending_encoder_restart:
                     # Animated QRs should restart their frame sequence after the
@@ -815,12 +938,14 @@ class QRDisplayScreen(BaseScreen):
 
                 if display_tip:
                     self.render_brightness_tip(image)
+                if display_status:
+                    self.render_status_line(image)
 
                 with self.renderer.lock:
                     self.renderer.show_image(image)
 
                 # Target n held frames per second before rendering next QR image
-                time.sleep(5 / 30.0)
+                time.sleep(QR_FRAME_SECONDS)
 
     def __post_init__(self):
         super().__post_init__()
@@ -829,7 +954,8 @@ class QRDisplayScreen(BaseScreen):
         self.threads.append(QRDisplayScreen.QRDisplayThread(
             qr_encoder=self.qr_encoder,
             qr_brightness=self.qr_brightness,
-            tips_start_time=self.tips_start_time
+            tips_start_time=self.tips_start_time,
+            status_text=self.status_text,
         ))
 
     def _run(self):
@@ -1305,6 +1431,7 @@ class KeyboardScreen(BaseTopNavScreen):
 
         self.keyboard = Keyboard(
             draw=self.renderer.draw,
+            canvas=self.renderer.canvas,
             charset=self.keys_charset,
             font_name=self.keyboard_font_name,
             font_size=font_size,
@@ -1445,8 +1572,10 @@ class KeyboardScreen(BaseTopNavScreen):
 
                 elif input in HardwareButtonsConstants.KEYS__LEFT_RIGHT_UP_DOWN:
                     # Live joystick movement; haven't locked this new letter in yet.
-                    # Leave current spot blank for now.
-                    pass
+                    # Only the previous and newly selected keys changed so just push
+                    # that region.
+                    self.renderer.show_image_rect(self.keyboard.pop_damage_rect())
+                    continue
 
                 # Render the text entry display and cursor block
                 self.text_entry_display.render(self.user_input)
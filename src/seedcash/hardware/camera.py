@@ -30,6 +30,27 @@ class Camera(Singleton):
         self._video_stream.start()
 
 
+    def restart_video_stream_mode(self, resolution, framerate, format="bgr"):
+        """
+        Swaps in a stream with new settings. Unlike stop + start, `_video_stream` is
+        never None in between, so a concurrent reader (e.g. the live preview) keeps
+        getting the old stream's last frame instead of seeing the stream end.
+        """
+        from seedcash.hardware.pivideostream import PiVideoStream
+        if self._video_stream is not None:
+            self._video_stream.stop()
+
+        video_stream = PiVideoStream(resolution=resolution, framerate=framerate, format=format)
+        video_stream.start()
+        self._video_stream = video_stream
+
+
+    @property
+    def preview_quarter_turns(self) -> int:
+        """Counter-clockwise quarter turns that make raw frames upright"""
+        return ((90 + self._camera_rotation) // 90) % 4
+
+
     def read_video_stream(self, as_image=False):
         if not self._video_stream:
             raise Exception("Must call start_video_stream first.")
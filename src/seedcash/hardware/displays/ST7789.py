@@ -161,6 +161,19 @@ class ST7789(object):
         GPIO.output(self._dc,GPIO.HIGH)
         self._spi.writebytes2(pix)	
         
+    def show_image_partial(self,Image,Xstart,Ystart):
+        """Write an image smaller than the display to the window at (Xstart, Ystart)"""
+        imwidth, imheight = Image.size
+        if Xstart + imwidth > self.width or Ystart + imheight > self.height:
+            raise ValueError('Image must fit within the display \
+                ({0}x{1}).' .format(self.width, self.height))
+        arr = array.array("H", Image.convert("BGR;16").tobytes())
+        arr.byteswap()
+        pix = arr.tobytes()
+        self.SetWindows ( Xstart, Ystart, Xstart + imwidth, Ystart + imheight)
+        GPIO.output(self._dc,GPIO.HIGH)
+        self._spi.writebytes2(pix)
+
     def clear(self):
         """Clear contents of image buffer"""
         _buffer = [0xff]*(self.width * self.height * 2)
@@ -57,4 +57,14 @@ class DisplayDriver:
 
 
     def show_image(self, image, x_start: int = 0, y_start: int = 0):
-        self.display.show_image(image, x_start, y_start)
\ No newline at end of file
+        self.display.show_image(image, x_start, y_start)
+
+
+    @property
+    def supports_partial_update(self) -> bool:
+        """Whether the driver can write an image smaller than the full display"""
+        return hasattr(self.display, "show_image_partial")
+
+
+    def show_image_partial(self, image, x_start: int, y_start: int):
+        self.display.show_image_partial(image, x_start, y_start)
\ No newline at end of file
@@ -364,6 +364,21 @@ class ST7789:
         GPIO.output(self.dc,GPIO.HIGH)
         self._write(data=pix)
 
+    def show_image_partial(self, image, x_start: int, y_start: int):
+        """Write an image smaller than the display to the window at (x_start, y_start)"""
+        imwidth, imheight = image.size
+        if x_start + imwidth > self.width or y_start + imheight > self.height:
+            raise ValueError('Image must fit within the display \
+                ({0}x{1}).' .format(self.width, self.height))
+
+        arr = array.array("H", image.convert("BGR;16").tobytes())
+        arr.byteswap()
+        pix = arr.tobytes()
+
+        self._set_window(x_start, y_start, x_start + imwidth - 1, y_start + imheight - 1)
+        GPIO.output(self.dc,GPIO.HIGH)
+        self._write(data=pix)
+
     def _write(self, command=None, data=None):
         """SPI write to the device: commands and data."""
         if self.cs:
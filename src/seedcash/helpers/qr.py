@@ -90,13 +90,20 @@ class QR:
                 ).resize((width,height)).convert('RGBA')
 
 
-    def qrimage_io(self, data, width=240, height=240, border=3, background_color="808080"):
+    def qrimage_io(self, data, width=240, height=240, border=3, background_color="808080", scale=3, version=None):
         if 1 <= border <= 10:
             border_str = str(border)
         else:
             border_str = "3"
 
-        cmd = f"""qrencode -m {border_str} -s 3 -l L --foreground=000000 --background={background_color} -t PNG -o "/tmp/qrcode.png" "{str(data)}" """
+        # Pixels per module. Asking for exactly (modules + 2 * border) * scale, as
+        # planned exports do, makes the resize below a no-op so modules stay even.
+        scale_str = str(scale) if 1 <= scale <= 20 else "3"
+
+        # Minimum QR version, so short final frames of an animation keep its size
+        version_str = f"-v {version} " if version and 1 <= version <= 40 else ""
+
+        cmd = f"""qrencode {version_str}-m {border_str} -s {scale_str} -l L --foreground=000000 --background={background_color} -t PNG -o "/tmp/qrcode.png" "{str(data)}" """
         rv = subprocess.call(cmd, shell=True)
 
         # if qrencode fails, fall back to only encoder
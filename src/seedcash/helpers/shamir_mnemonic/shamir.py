@@ -22,6 +22,7 @@
 import hmac
 import secrets
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterator, List, NamedTuple, Sequence, Set, Tuple
 
 from . import cipher
@@ -158,6 +159,39 @@ def _precompute_exp_log() -> Tuple[List[int], List[int]]:
 EXP_TABLE, LOG_TABLE = _precompute_exp_log()
 
 
+@lru_cache(maxsize=256)
+def _multiply_table(coefficient: int) -> bytes:
+    """`bytes.translate` table multiplying every byte by `coefficient` in GF(256)."""
+    if coefficient == 0:
+        return bytes(256)
+    log_coefficient = LOG_TABLE[coefficient]
+    return bytes(
+        [0] + [EXP_TABLE[(LOG_TABLE[v] + log_coefficient) % 255] for v in range(1, 256)]
+    )
+
+
+@lru_cache(maxsize=64)
+def _basis_coefficients(x_coordinates: Tuple[int, ...], x: int) -> Tuple[int, ...]:
+    """
+    The Lagrange basis polynomials for `x_coordinates`, evaluated at x. Depends only
+    on the x coordinates, so e.g. every group split with the same threshold shares them.
+    """
+    # Logarithm of the product of (x_i - x) for i = 1, ... , k.
+    log_prod = sum(LOG_TABLE[x_i ^ x] for x_i in x_coordinates)
+
+    return tuple(
+        EXP_TABLE[
+            (
+                log_prod
+                - LOG_TABLE[x_i ^ x]
+                - sum(LOG_TABLE[x_i ^ x_j] for x_j in x_coordinates)
+            )
+            % 255
+        ]
+        for x_i in x_coordinates
+    )
+
+
 def _interpolate(shares: Sequence[RawShare], x: int) -> bytes:
     """
     Returns f(x) given the Shamir shares (x_1, f(x_1)), ... , (x_k, f(x_k)).
@@ -185,29 +219,14 @@ def _interpolate(shares: Sequence[RawShare], x: int) -> bytes:
             if share.x == x:
                 return share.data
 
-    # Logarithm of the product of (x_i - x) for i = 1, ... , k.
-    log_prod = sum(LOG_TABLE[share.x ^ x] for share in shares)
-
-    result = bytes(share_value_lengths.pop())
-    for share in shares:
-        # The logarithm of the Lagrange basis polynomial evaluated at x.
-        log_basis_eval = (
-            log_prod
-            - LOG_TABLE[share.x ^ x]
-            - sum(LOG_TABLE[share.x ^ other.x] for other in shares)
-        ) % 255
-
-        result = bytes(
-            intermediate_sum
-            ^ (
-                EXP_TABLE[(LOG_TABLE[share_val] + log_basis_eval) % 255]
-                if share_val != 0
-                else 0
-            )
-            for share_val, intermediate_sum in zip(share.data, result)
-        )
+    # Each term is one byte-wise GF(256) multiply (a translate) and the sum is XOR,
+    # done on the whole share value at once as an int.
+    basis = _basis_coefficients(tuple(share.x for share in shares), x)
+    result = 0
+    for share, coefficient in zip(shares, basis):
+        result ^= int.from_bytes(share.data.translate(_multiply_table(coefficient)), "big")
 
-    return result
+    return result.to_bytes(share_value_lengths.pop(), "big")
 
 
 def _create_digest(random_data: bytes, shared_secret: bytes) -> bytes:
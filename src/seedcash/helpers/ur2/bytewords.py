@@ -5,71 +5,42 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
-from .utils import crc32_bytes, partition
+from .utils import crc32_bytes
 
 BYTEWORDS = 'ableacidalsoapexaquaarchatomauntawayaxisbackbaldbarnbeltbetabiasbluebodybragbrewbulbbuzzcalmcashcatschefcityclawcodecolacookcostcruxcurlcuspcyandarkdatadaysdelidicedietdoordowndrawdropdrumdulldutyeacheasyechoedgeepicevenexamexiteyesfactfairfernfigsfilmfishfizzflapflewfluxfoxyfreefrogfuelfundgalagamegeargemsgiftgirlglowgoodgraygrimgurugushgyrohalfhanghardhawkheathelphighhillholyhopehornhutsicedideaidleinchinkyintoirisironitemjadejazzjoinjoltjowljudojugsjumpjunkjurykeepkenokeptkeyskickkilnkingkitekiwiknoblamblavalazyleaflegsliarlimplionlistlogoloudloveluaulucklungmainmanymathmazememomenumeowmildmintmissmonknailnavyneednewsnextnoonnotenumbobeyoboeomitonyxopenovalowlspaidpartpeckplaypluspoempoolposepuffpumapurrquadquizraceramprealredorichroadrockroofrubyruinrunsrustsafesagascarsetssilkskewslotsoapsolosongstubsurfswantacotasktaxitenttiedtimetinytoiltombtoystriptunatwinuglyundouniturgeuservastveryvetovialvibeviewvisavoidvowswallwandwarmwaspwavewaxywebswhatwhenwhizwolfworkyankyawnyellyogayurtzapszerozestzinczonezoom'
-WORD_ARRAY = None
+# Precomputed lookup tables: index -> word for encoding, word -> index for
+# decoding. Decoding tables also hold the upper case forms, since UR frames are
+# usually upper-cased to use the QR alphanumeric mode.
+WORDS = [BYTEWORDS[i * 4:i * 4 + 4] for i in range(256)]
+MINIMAL_WORDS = [word[0] + word[3] for word in WORDS]
+WORD_VALUES = {}
+MINIMAL_WORD_VALUES = {}
+for _value, _word in enumerate(WORDS):
+    WORD_VALUES[_word] = WORD_VALUES[_word.upper()] = _value
+    _minimal = MINIMAL_WORDS[_value]
+    MINIMAL_WORD_VALUES[_minimal] = MINIMAL_WORD_VALUES[_minimal.upper()] = _value
 
 def decode_word(word, word_len):
-    global WORD_ARRAY
-    global BYTEWORDS
-
     if len(word) != word_len:
         raise ValueError('Invalid Bytewords.')
 
-    dim = 26
-
-    # Since the first and last letters of each Byteword are unique,
-    # we can use them as indexes into a two-dimensional lookup table.
-    # This table is generated lazily.
-    if WORD_ARRAY == None:
-        WORD_ARRAY = [-1] * (dim * dim)  # create empty array
-
-        for i in range(256):
-            byteword_offset = i * 4
-            x = ord(BYTEWORDS[byteword_offset]) - ord('a')
-            y = ord(BYTEWORDS[byteword_offset + 3]) - ord('a')
-            array_offset = y * dim + x
-            WORD_ARRAY[array_offset] = i
-
-    # If the coordinates generated by the first and last letters are out of bounds,
-    # or the lookup table contains -1 at the coordinates, then the word is not valid.
-    x = ord(word[0].lower()) - ord('a')
-    y = ord((word[3 if len(word) == 4 else 1]).lower()) - ord('a')
-    if not (0 <= x and x < dim and 0 <= y and y < dim):
-        raise ValueError('Invalid Bytewords.')
-
-    offset = y * dim + x
-    value = WORD_ARRAY[offset]
-    if value == -1:
-        raise ValueError('Invalid Bytewords.')
-
-    # If we're decoding a full four-letter word, verify that the two middle letters are correct.
-    if len(word) == 4:
-        byteword_offset = value * 4
-        c1 = word[1].lower()
-        c2 = word[2].lower()
-        if c1 != BYTEWORDS[byteword_offset + 1] or c2 != BYTEWORDS[byteword_offset + 2]:
+    value = (WORD_VALUES if word_len == 4 else MINIMAL_WORD_VALUES).get(word)
+    if value is None:
+        # Mixed case
+        value = (WORD_VALUES if word_len == 4 else MINIMAL_WORD_VALUES).get(word.lower())
+        if value is None:
             raise ValueError('Invalid Bytewords.')
 
-    # Successful decode.
     return value
 
 def get_word(index):
-    byteword_offset = index * 4
-    return BYTEWORDS[byteword_offset:byteword_offset + 4]
+    return WORDS[index]
 
 def get_minimal_word(index):
-    byteword_offset = index * 4
-    return BYTEWORDS[byteword_offset] + BYTEWORDS[byteword_offset + 3]
+    return MINIMAL_WORDS[index]
 
 def encode(buf, separator):
-    words = []
-    for i in range(len(buf)):
-        byte = buf[i]
-        words.append(get_word(byte))
-
-    return separator.join(words)
+    return separator.join([WORDS[byte] for byte in buf])
 
 def add_crc(buf):
     crc_buf = crc32_bytes(buf)
@@ -80,35 +51,34 @@ def encode_with_separator(buf, separator):
     return encode(crc_buf, separator)
 
 def encode_minimal(buf):
-    result = ''
-
     crc_buf = add_crc(buf)
-    for i in range(len(crc_buf)):
-        byte = crc_buf[i]
-        result += get_minimal_word(byte)
-
-    return result
+    return ''.join([MINIMAL_WORDS[byte] for byte in crc_buf])
 
 def decode(s, separator, word_len):
-    buf = bytearray()
-
     if word_len == 4:
         words = s.split(separator)
+        table = WORD_VALUES
     else:
-        words = partition(s, 2)
+        if len(s) % 2:
+            raise ValueError('Invalid Bytewords.')
+        words = [s[i:i + 2] for i in range(0, len(s), 2)]
+        table = MINIMAL_WORD_VALUES
 
-    for word in words:
-        buf.append(decode_word(word, word_len))
+    try:
+        buf = bytearray([table[word] for word in words])
+    except KeyError:
+        # Mixed case words are still valid; anything else isn't
+        buf = bytearray([decode_word(word, word_len) for word in words])
 
     if len(buf) < 5:
-        raise ValueError('Invalid Bytewords.') 
+        raise ValueError('Invalid Bytewords.')
 
     # Validate checksum
     body = buf[0:-4]
     body_checksum = buf[-4:]
     checksum = crc32_bytes(body)
-    # if checksum != body_checksum:
-    #     raise ValueError('Invalid Bytewords.')
+    if checksum != body_checksum:
+        raise ValueError('Invalid Bytewords.')
 
     return body
 
@@ -272,7 +272,7 @@ class CBORDecoder:
             raise Exception("Not a Boolean")
         raise Exception("Not Simple/Boolean")
 
-    def decodeBytes(self, flags=Flag_None):
+    def decodeBytes(self, flags=Flag_None, zero_copy=False):
         # First value is the length of the bytes that follow
         tag, byte_length, size_length = self.decodeTagAndValue(flags)
         if tag != Tag_Major_byteString:
@@ -282,7 +282,11 @@ class CBORDecoder:
         if end - self.pos < byte_length:
             raise Exception("Not enough input")
 
-        value = bytes(self.buf[self.pos : self.pos + byte_length])
+        if zero_copy:
+            # A view into the input buffer rather than a copy of it
+            value = memoryview(self.buf)[self.pos : self.pos + byte_length]
+        else:
+            value = bytes(self.buf[self.pos : self.pos + byte_length])
         self.pos += byte_length
         return (value, size_length + byte_length)
 
@@ -6,14 +6,78 @@
 #
 
 import math
-from .cbor_lite import CBORDecoder, CBOREncoder
+import struct
+from .cbor_lite import CBORDecoder
 from .fountain_utils import choose_fragments
-from .utils import split, crc32_int, xor_into, data_to_hex
+from .utils import crc32_int, data_to_hex
 from .constants import MAX_UINT32, MAX_UINT64
 
 class InvalidHeader(Exception):
     pass
 
+# Every fragment is the CBOR array [seq_num, seq_len, message_len, checksum, data].
+# The specialized codec below handles just that layout with `struct`; anything
+# else in a frame falls back to the generic CBORDecoder.
+CBOR_ARRAY_5 = 0x85
+CBOR_MAJOR_UNSIGNED = 0x00
+CBOR_MAJOR_BYTES = 0x40
+
+# seq_num, seq_len, message_len, checksum, data
+PART_FIELD_MAJORS = (CBOR_MAJOR_UNSIGNED,) * 4 + (CBOR_MAJOR_BYTES,)
+
+# CBOR additional-info value -> the big-endian int that follows it
+CBOR_ARGUMENT_FORMATS = {
+    24: struct.Struct('>B'),
+    25: struct.Struct('>H'),
+    26: struct.Struct('>I'),
+    27: struct.Struct('>Q'),
+}
+
+def encode_cbor_head(major, value):
+    # Same (shortest) argument sizes as CBOREncoder.encodeTagAndValue
+    if value < 24:
+        return bytes([major | value])
+    if value <= 0xFF:
+        return bytes([major | 24, value])
+    if value <= 0xFFFF:
+        return struct.pack('>BH', major | 25, value)
+    if value <= 0xFFFFFFFF:
+        return struct.pack('>BI', major | 26, value)
+    return struct.pack('>BQ', major | 27, value)
+
+def decode_part_cbor(cbor_buf):
+    """
+    Decode a fragment in one pass: returns (seq_num, seq_len, message_len,
+    checksum, data), with `data` a memoryview into `cbor_buf`, or None if the
+    frame isn't laid out the way this fast path expects.
+    """
+    end = len(cbor_buf)
+    if end == 0 or cbor_buf[0] != CBOR_ARRAY_5:
+        return None
+
+    pos = 1
+    values = []
+    for major in PART_FIELD_MAJORS:
+        if pos >= end:
+            return None
+        octet = cbor_buf[pos]
+        pos += 1
+        if octet & 0xE0 != major:
+            return None
+        value = octet & 0x1F
+        if value >= 24:
+            argument_format = CBOR_ARGUMENT_FORMATS.get(value)
+            if argument_format is None or end - pos < argument_format.size:
+                return None
+            value = argument_format.unpack_from(cbor_buf, pos)[0]
+            pos += argument_format.size
+        values.append(value)
+
+    if end - pos < value:
+        return None
+    values[4] = memoryview(cbor_buf)[pos:pos + value]
+    return values
+
 class Part:
 
     def __init__(self, seq_num, seq_len, message_len, checksum, data):
@@ -25,6 +89,10 @@ class Part:
 
     @staticmethod
     def from_cbor(cbor_buf):
+        values = decode_part_cbor(cbor_buf)
+        if values is not None:
+            return Part(*values)
+
         try:
             decoder = CBORDecoder(cbor_buf)
             (array_size, _) = decoder.decodeArraySize()
@@ -47,21 +115,22 @@ class Part:
             if checksum > MAX_UINT64:
                 raise InvalidHeader()
 
-            (data, _) = decoder.decodeBytes()
+            (data, _) = decoder.decodeBytes(zero_copy=True)
 
             return Part(seq_num, seq_len, message_len, checksum, data)
         except Exception as err:
             raise InvalidHeader()
 
     def cbor(self):
-        encoder = CBOREncoder()
-        encoder.encodeArraySize(5)
-        encoder.encodeInteger(self.seq_num)
-        encoder.encodeInteger(self.seq_len)
-        encoder.encodeInteger(self.message_len)
-        encoder.encodeInteger(self.checksum)
-        encoder.encodeBytes(self.data)
-        return encoder.get_bytes()
+        return b''.join([
+            bytes([CBOR_ARRAY_5]),
+            encode_cbor_head(CBOR_MAJOR_UNSIGNED, self.seq_num),
+            encode_cbor_head(CBOR_MAJOR_UNSIGNED, self.seq_len),
+            encode_cbor_head(CBOR_MAJOR_UNSIGNED, self.message_len),
+            encode_cbor_head(CBOR_MAJOR_UNSIGNED, self.checksum),
+            encode_cbor_head(CBOR_MAJOR_BYTES, len(self.data)),
+            self.data,
+        ])
 
     def seq_num(self):
         return self.seq_num
@@ -89,6 +158,8 @@ class FountainEncoder:
         self.checksum = crc32_int(message)
         self.fragment_len = FountainEncoder.find_nominal_fragment_length(self.message_len, min_fragment_len, max_fragment_len)
         self.fragments = FountainEncoder.partition_message(message, self.fragment_len)
+        # Each fragment as one big-endian int, so mixing is a few int XORs
+        self.fragment_ints = [int.from_bytes(fragment, 'big') for fragment in self.fragments]
         self.seq_num = first_seq_num
         self.current_part: Part = None
     
@@ -111,15 +182,11 @@ class FountainEncoder:
 
     @staticmethod
     def partition_message(message, fragment_len):
-        remaining = message
+        message = bytes(message)
         fragments = []
-        while len(remaining) != 0:
-            (fragment, remaining) = split(remaining, fragment_len)
-            padding = fragment_len - len(fragment)
-            while padding > 0:
-                fragment.append(0)
-                padding -= 1
-            fragments.append(fragment)
+        for start in range(0, len(message), fragment_len):
+            # Zero-pad the last fragment
+            fragments.append(message[start:start + fragment_len].ljust(fragment_len, b'\x00'))
 
         return fragments
 
@@ -142,8 +209,7 @@ class FountainEncoder:
         self.seq_num += 1
         self.seq_num = self.seq_num % MAX_UINT32  # wrap at period 2^32
         indexes = choose_fragments(self.seq_num, self.seq_len(), self.checksum)
-        mixed = self.mix(indexes)
-        data = bytes(mixed)
+        data = self.mix(indexes)
         self.current_part = Part(self.seq_num, self.seq_len(), self.message_len, self.checksum, data)
         return self.current_part
     
@@ -157,7 +223,7 @@ class FountainEncoder:
 
 
     def mix(self, indexes):
-        result = [0] * self.fragment_len
+        result = 0
         for index in indexes:
-            xor_into(result, self.fragments[index])
-        return result
+            result ^= self.fragment_ints[index]
+        return result.to_bytes(self.fragment_len, 'big')
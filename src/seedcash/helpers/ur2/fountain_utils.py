@@ -5,27 +5,39 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
+from functools import lru_cache
+
 from .random_sampler import RandomSampler
 from .utils import int_to_bytes
 from .xoshiro256 import Xoshiro256
 
-# Fisher-Yates shuffle
-def shuffled(items, rng):
+# Fisher-Yates shuffle. With `count`, stop after the first `count` picks: each
+# pick only depends on the rng and on how many items remain, so the result is
+# exactly the first `count` items of the full shuffle.
+def shuffled(items, rng, count=None):
     remaining = items
     result = []
-    while len(remaining) > 0:
+    if count is None:
+        count = len(remaining)
+    while len(remaining) > 0 and len(result) < count:
         index = rng.next_int(0, len(remaining) - 1)
         item = remaining.pop(index)
         result.append(item)
 
     return result
 
-def choose_degree(seq_len, rng):
+# The degree distribution only depends on `seq_len`, so build its alias table
+# once per message rather than once per mixed part
+@lru_cache(maxsize=16)
+def degree_sampler(seq_len):
     degree_probabilities = []
     for i in range(1, seq_len + 1):
         degree_probabilities.append(1.0 / i)
 
-    degree_chooser = RandomSampler(degree_probabilities)
+    return RandomSampler(degree_probabilities)
+
+def choose_degree(seq_len, rng):
+    degree_chooser = degree_sampler(seq_len)
     return degree_chooser.next(lambda: rng.next_double()) + 1
 
 def choose_fragments(seq_num, seq_len, checksum):
@@ -38,12 +50,12 @@ def choose_fragments(seq_num, seq_len, checksum):
         seed = int_to_bytes(seq_num) + int_to_bytes(checksum)
         rng = Xoshiro256.from_bytes(seed)
         degree = choose_degree(seq_len, rng)
-        indexes = []
+        indexes = list(range(seq_len))
 
-        for i in range(seq_len):
-            indexes.append(i)
-        shuffled_indexes = shuffled(indexes, rng)
-        return set(shuffled_indexes[0:degree])
+        # Only the first `degree` picks are kept and `rng` isn't used again, so
+        # the rest of the shuffle can be skipped
+        shuffled_indexes = shuffled(indexes, rng, degree)
+        return set(shuffled_indexes)
 
 def contains(set_or_list, el):
     return el in set_or_list
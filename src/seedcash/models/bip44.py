@@ -4,6 +4,8 @@ from base58 import b58decode, b58encode
 from ecdsa import SECP256k1, SigningKey, VerifyingKey
 from ecdsa.util import string_to_number, number_to_string
 
+from seedcash.models import cashaddr
+
 
 class Bip44:
 
@@ -169,6 +171,36 @@ class Bip44:
 
         return derivet_key, chain_code
 
+    @staticmethod
+    def derive_private_child_key(
+        parent_key, parent_chain_code, index, parent_public_key=None
+    ):
+        """BIP32 CKDpriv. `index` includes the 0x80000000 bit for hardened children.
+        Pass `parent_public_key` when it's already known to skip recomputing it for
+        non-hardened children."""
+        curve_order = SECP256k1.order
+        if index & 0x80000000:
+            data = b"\x00" + parent_key + index.to_bytes(4, "big")
+        else:
+            if parent_public_key is None:
+                parent_public_key = Bip44.private_to_public(parent_key)
+            data = parent_public_key + index.to_bytes(4, "big")
+        I = Bip44.hmac_sha512(parent_chain_code, data)
+
+        number_Il = string_to_number(I[:32])
+        if number_Il >= curve_order:
+            raise ValueError(f"Invalid child key at index {index}")
+        number_derived = (number_Il + string_to_number(parent_key)) % curve_order
+        if number_derived == 0:
+            raise ValueError(f"Invalid child key at index {index}")
+
+        return number_to_string(number_derived, curve_order), I[32:]
+
+    @staticmethod
+    def private_to_public(private_key):
+        """Compressed public key for a 32-byte private key"""
+        return Bip44.public_master_key_compressed_generaitor(private_key)
+
     @staticmethod
     def fingerprint_hex(account_key):
         """Donada una compressed_master_public_key_bytes retorna un master fingerprint en hexadecimal"""
@@ -264,48 +296,19 @@ class Bip44:
 
     @staticmethod
     def convert_bits(data, from_bits, to_bits, pad=True):
-        acc = 0
-        bits = 0
-        ret = []
-        maxv = (1 << to_bits) - 1  # Màxim valor per un bloc de to_bits
-        for value in data:
-            acc = (acc << from_bits) | value  # Afegeix el nou valor
-            bits += from_bits
-            while bits >= to_bits:
-                bits -= to_bits
-                ret.append((acc >> bits) & maxv)  # Extreu el bloc de to_bits
-        if pad and bits:
-            ret.append((acc << (to_bits - bits)) & maxv)  # Completa el bloc restant
-        return ret
+        return cashaddr.convert_bits(data, from_bits, to_bits, pad)
 
     @staticmethod
     def polymod(values):
-        c = 1
-        for d in values:
-            c0 = c >> 35
-            c = ((c & 0x07FFFFFFFF) << 5) ^ d
-            if c0 & 0x01:
-                c ^= 0x98F2BC8E61
-            if c0 & 0x02:
-                c ^= 0x79B76D99E2
-            if c0 & 0x04:
-                c ^= 0xF33E5FB3C4
-            if c0 & 0x08:
-                c ^= 0xAE2EABE2A8
-            if c0 & 0x10:
-                c ^= 0x1E4F43E470
-        return c ^ 1
+        return cashaddr.polymod(values)
 
     @staticmethod
     def create_checksum(prefix, payload):
-        values = [ord(x) & 0x1F for x in prefix] + [0] + payload
-        polymod_result = Bip44.polymod(values + [0, 0, 0, 0, 0, 0, 0, 0])
-        return [(polymod_result >> (5 * (7 - i))) & 0x1F for i in range(8)]
+        return cashaddr.create_checksum(prefix, payload)
 
     @staticmethod
     def encode_base32(data):
-        CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
-        return "".join([CHARSET[d] for d in data])
+        return "".join([cashaddr.CHARSET[d] for d in data])
 
     @staticmethod
     def hash160(pubkey):
@@ -315,25 +318,15 @@ class Bip44:
 
     @staticmethod
     def public_key_to_cashaddr_address(pubkey):
-        version_byte = 0x00  # Per P2PKH
-        payload = bytes([version_byte]) + Bip44.hash160(pubkey)
-        payload_5bit = Bip44.convert_bits(payload, 8, 5)
-        checksum = Bip44.create_checksum("bitcoincash", payload_5bit)
-        address = "bitcoincash:" + Bip44.encode_base32(payload_5bit + checksum)
-        return address
+        return cashaddr.encode(Bip44.hash160(pubkey), cashaddr.VERSION__P2PKH)
 
     @staticmethod
     def hash160_to_cashaddr(hash160: bytes, version_byte: int = 0x00) -> str:
         """Convert a 20-byte HASH160 to a cashaddr string.
-        - version_byte: 0x00 for P2PKH (q...), 0x08 for P2SH (p...).
+        - version_byte: 0x00 for P2PKH (q...), 0x08 for P2SH (p...),
+          0x10/0x18 for their token-aware forms (z.../r...).
         """
-        if len(hash160) != 20:
-            raise ValueError("hash160 must be 20 bytes")
-        payload = bytes([version_byte]) + hash160
-        payload_5bit = Bip44.convert_bits(payload, 8, 5)
-        checksum = Bip44.create_checksum("bitcoincash", payload_5bit)
-        return "bitcoincash:" + Bip44.encode_base32(payload_5bit + checksum)
-
+        return cashaddr.encode(bytes(hash160), version_byte)
 
     @staticmethod
     def xpub_to_cashaddr_address(xpub, address_index):
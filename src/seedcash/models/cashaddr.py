@@ -0,0 +1,112 @@
+"""
+Table-driven CashAddr encoding.
+
+The BCH polymod checksum works on 5-bit symbols. Rather than testing the five
+top bits of the state one at a time, the combined generator XOR for every
+possible top-bits value is precomputed, and the state after the prefix (plus
+separator) is cached per prefix so each address only runs the polymod over its
+payload.
+"""
+from functools import lru_cache
+from typing import Dict, List
+
+
+CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+
+MAINNET_PREFIX = "bitcoincash"
+TESTNET_PREFIX = "bchtest"
+
+# Version bytes for a 160-bit hash
+VERSION__P2PKH = 0x00
+VERSION__P2SH = 0x08
+VERSION__P2PKH_TOKEN = 0x10  # "z..." token-aware P2PKH
+VERSION__P2SH_TOKEN = 0x18  # "r..." token-aware P2SH
+
+GENERATORS = [0x98F2BC8E61, 0x79B76D99E2, 0xF33E5FB3C4, 0xAE2EABE2A8, 0x1E4F43E470]
+
+
+def _generator_table() -> List[int]:
+    table = []
+    for c0 in range(32):
+        value = 0
+        for i, generator in enumerate(GENERATORS):
+            if (c0 >> i) & 1:
+                value ^= generator
+        table.append(value)
+    return table
+
+
+# GENERATOR_TABLE[c >> 35] is the XOR of every generator whose bit is set
+GENERATOR_TABLE = _generator_table()
+
+
+def polymod_step(c: int, values) -> int:
+    """Feed 5-bit `values` into the (un-finalized) polymod state `c`"""
+    table = GENERATOR_TABLE
+    for d in values:
+        c = (((c & 0x07FFFFFFFF) << 5) ^ d) ^ table[c >> 35]
+    return c
+
+
+def polymod(values) -> int:
+    return polymod_step(1, values) ^ 1
+
+
+# Polymod state after each prefix's expansion and the ":" separator
+prefix_states: Dict[str, int] = {}
+
+
+def prefix_state(prefix: str) -> int:
+    state = prefix_states.get(prefix)
+    if state is None:
+        state = polymod_step(1, [ord(x) & 0x1F for x in prefix] + [0])
+        prefix_states[prefix] = state
+    return state
+
+
+for _prefix in [MAINNET_PREFIX, TESTNET_PREFIX]:
+    prefix_state(_prefix)
+
+
+def convert_bits(data: bytes, from_bits: int, to_bits: int, pad: bool = True) -> List[int]:
+    """Regroup `data` from `from_bits`-bit to `to_bits`-bit values (big-endian)"""
+    num_bits = len(data) * from_bits
+    if from_bits == 8:
+        acc = int.from_bytes(data, "big")
+    else:
+        acc = 0
+        for value in data:
+            acc = (acc << from_bits) | value
+
+    num_groups, remainder = divmod(num_bits, to_bits)
+    if pad and remainder:
+        acc <<= to_bits - remainder
+        num_groups += 1
+    else:
+        acc >>= remainder
+
+    maxv = (1 << to_bits) - 1
+    return [(acc >> (to_bits * i)) & maxv for i in range(num_groups - 1, -1, -1)]
+
+
+def create_checksum(prefix: str, payload: List[int]) -> List[int]:
+    c = polymod_step(prefix_state(prefix), payload)
+    c = polymod_step(c, [0] * 8) ^ 1
+    return [(c >> (5 * (7 - i))) & 0x1F for i in range(8)]
+
+
+def verify_checksum(prefix: str, values: List[int]) -> bool:
+    return polymod_step(prefix_state(prefix), values) ^ 1 == 0
+
+
+@lru_cache(maxsize=1024)
+def encode(hash160: bytes, version_byte: int = VERSION__P2PKH, prefix: str = MAINNET_PREFIX) -> str:
+    """
+    Encode a 20-byte HASH160 as a CashAddr string. Memoized since a PSBT tends to
+    send to (and get rendered with) the same few addresses over and over.
+    """
+    if len(hash160) != 20:
+        raise ValueError("hash160 must be 20 bytes")
+    payload = convert_bits(bytes([version_byte]) + hash160, 8, 5)
+    checksum = create_checksum(prefix, payload)
+    return prefix + ":" + "".join([CHARSET[d] for d in payload + checksum])
@@ -4,7 +4,9 @@ import re
 import zlib
 
 from binascii import a2b_base64, b2a_base64
+from dataclasses import dataclass
 from enum import IntEnum
+from functools import lru_cache
 from pyzbar import pyzbar
 from pyzbar.pyzbar import ZBarSymbol
 from base64 import b32decode
@@ -47,6 +49,41 @@ def _scan_psbt_map_end(buf: bytes, pos: int) -> int:
     raise ValueError("unexpected end while scanning PSBT map")
 
 
+# Frame classifiers, compiled once
+UR_PSBT_PREFIX = "UR:CRYPTO-PSBT/"
+UR_OUTPUT_PREFIX = "UR:CRYPTO-OUTPUT/"
+UR_BYTES_PREFIX = "UR:BYTES/"
+# must be base64 characters only in segment
+SPECTER_SEGMENT_RE = re.compile(r"^p(\d+)of(\d+) ([A-Za-z0-9+\/=]+$)", re.IGNORECASE)
+SPECTER_HEADER_RE = re.compile(r"^p(\d+)of(\d+) ", re.IGNORECASE)
+# https://github.com/coinkite/BBQr/blob/master/BBQr.md#spliting-the-data
+BBQR_SEGMENT_RE = re.compile(r"^B\$[2HZ]P[0-9A-Z]{4}")
+
+BASE43_CHARS = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ$*+-./:"
+# Each byte's base43 digit value; 0xFF for bytes outside the alphabet
+BASE43_DIGITS = bytes(BASE43_CHARS.find(bytes([c])) & 0xFF for c in range(256))
+# Digits folded into one machine-word-ish int before the limbs are combined
+BASE43_LIMB_DIGITS = 16
+
+
+def _has_prefix(s: str, prefix: str) -> bool:
+    # Case-insensitive, without lowering the whole frame
+    return s[: len(prefix)].upper() == prefix
+
+
+@dataclass
+class QRSegment:
+    """
+    A frame as classified by `DecodeQR.classify_segment`. Formats that can only be
+    recognized by decoding them (base64/base43 PSBTs) carry the decoded bytes in
+    `data` so the decoder doesn't have to decode and parse them again.
+    """
+
+    qr_type: str
+    text: str = None
+    data: bytes = None
+
+
 class DecodeQRStatus(IntEnum):
     """
     Used in DecodeQR to communicate status of adding qr frame/segment
@@ -68,19 +105,32 @@ class DecodeQR:
         self.complete = False
         self.qr_type = None
         self.decoder = None
+        # (left, top, width, height) of the symbol in the last image read, if any
+        self.last_rect = None
 
     def add_image(self, image):
-        data = DecodeQR.extract_qr_data(image, is_binary=True)
-        if data == None:
+        barcode = DecodeQR.extract_qr_barcode(image, is_binary=True)
+        if barcode is None:
+            self.last_rect = None
             return DecodeQRStatus.FALSE
 
-        return self.add_data(data)
+        self.last_rect = barcode.rect
+        return self.add_data(barcode.data)
 
     def add_data(self, data):
         if data == None:
             return DecodeQRStatus.FALSE
 
-        qr_type = DecodeQR.detect_segment_type(data)
+        # Once the stream's type is known, frames of that type only need a cheap
+        # prefix check; anything else is fully classified.
+        segment = None
+        qr_str = DecodeQR.segment_text(data) if self.qr_type is not None else None
+        if qr_str is not None and DecodeQR.is_segment_of_type(qr_str, self.qr_type):
+            qr_type = self.qr_type
+        else:
+            segment = DecodeQR.classify_segment(data)
+            qr_type = segment.qr_type
+            qr_str = segment.text
 
         if self.qr_type == None:
             self.qr_type = qr_type
@@ -103,16 +153,6 @@ class DecodeQR:
             # Did not find any recognizable format
             return DecodeQRStatus.INVALID
 
-        # Convert to string data
-        if type(data) == bytes:
-            # Should always be bytes, but the test suite has some manual datasets that
-            # are strings.
-            # TODO: Convert the test suite rather than handle here?
-            qr_str = data.decode("utf-8")
-        else:
-            # it's already str data
-            qr_str = data
-
         if self.qr_type == QRType.PSBT__UR2:
             added_part = self.decoder.receive_part(qr_str)
             if self.decoder.is_complete():
@@ -123,6 +163,13 @@ class DecodeQR:
             else:
                 return DecodeQRStatus.PART_EXISTING
 
+        elif segment is not None and segment.data is not None:
+            # Already decoded (and validated) while classifying
+            rt = self.decoder.add(qr_str, self.qr_type, decoded=segment.data)
+            if rt == DecodeQRStatus.COMPLETE:
+                self.complete = True
+            return rt
+
         else:
             # All other formats use the same method signature
             rt = self.decoder.add(qr_str, self.qr_type)
@@ -139,6 +186,8 @@ class DecodeQR:
         if self.complete:
             if self.qr_type == QRType.PSBT__UR2:
                 return self.decoder.result_message().cbor
+            elif self.is_psbt:
+                return self.decoder.get_data()
 
         return None
 
@@ -196,7 +245,11 @@ class DecodeQR:
 
     @property
     def is_invalid(self) -> bool:
-        return self.qr_type == QRType.INVALID
+        # URDecoder isn't a BaseQrDecoder and has no `error`
+        return (
+            self.qr_type == QRType.INVALID
+            or getattr(self.decoder, "error", None) is not None
+        )
 
     @property
     def is_psbt(self) -> bool:
@@ -209,7 +262,8 @@ class DecodeQR:
         ]
 
     @staticmethod
-    def extract_qr_data(image, is_binary: bool = False) -> str | None:
+    def extract_qr_barcode(image, is_binary: bool = False):
+        """The first QR pyzbar finds in `image` (with its `data` and `rect`), or None"""
         if image is None:
             return None
 
@@ -221,63 +275,77 @@ class DecodeQR:
 
         for barcode in barcodes:
             # Only pull and return the first barcode
+            return barcode
+
+    @staticmethod
+    def extract_qr_data(image, is_binary: bool = False) -> str | None:
+        barcode = DecodeQR.extract_qr_barcode(image, is_binary=is_binary)
+        if barcode is not None:
             return barcode.data
 
     @staticmethod
-    def detect_segment_type(s):
+    def segment_text(s) -> str | None:
+        """The frame as str data, or None if it isn't text"""
+        if type(s) == bytes:
+            # Should always be bytes, but the test suite has some manual datasets that
+            # are strings.
+            # TODO: Convert the test suite rather than handle here?
+            try:
+                return s.decode("utf-8")
+            except UnicodeDecodeError:
+                return None
+        return s
 
-        try:
-            # Convert to str data
-            if type(s) == bytes:
-                # Should always be bytes, but the test suite has some manual datasets that
-                # are strings.
-                # TODO: Convert the test suite rather than handle here?
-                s = s.decode("utf-8")
+    @staticmethod
+    def is_segment_of_type(s: str, qr_type: str) -> bool:
+        """Cheap check that a frame continues an animated stream of `qr_type`"""
+        if qr_type == QRType.PSBT__UR2:
+            return _has_prefix(s, UR_PSBT_PREFIX)
+        elif qr_type == QRType.PSBT__SPECTER:
+            return SPECTER_SEGMENT_RE.match(s) is not None
+        elif qr_type == QRType.PSBT__BBQR:
+            return BBQR_SEGMENT_RE.match(s) is not None
+        return False
 
-            logger.debug(f"segment string: {s}")
-            logger.debug(f"segment string length: {len(s)}")
+    @staticmethod
+    def detect_segment_type(s):
+        return DecodeQR.classify_segment(s).qr_type
 
-            # PSBT
-            if re.search("^UR:CRYPTO-PSBT/", s, re.IGNORECASE):
-                return QRType.PSBT__UR2
+    @staticmethod
+    def classify_segment(s) -> QRSegment:
+        s = DecodeQR.segment_text(s)
+        if s is None:
+            # Probably this isn't meant to be string data
+            return QRSegment(QRType.INVALID)
 
-            elif re.search("^UR:CRYPTO-OUTPUT/", s, re.IGNORECASE):
-                return QRType.OUTPUT__UR
+        logger.debug(f"segment string: {s}")
+        logger.debug(f"segment string length: {len(s)}")
 
-            elif re.search(
-                r"^p(\d+)of(\d+) ([A-Za-z0-9+\/=]+$)", s, re.IGNORECASE
-            ):  # must be base64 characters only in segment
-                return QRType.PSBT__SPECTER
+        # PSBT
+        if _has_prefix(s, UR_PSBT_PREFIX):
+            return QRSegment(QRType.PSBT__UR2, s)
 
-            elif re.search("^UR:BYTES/", s, re.IGNORECASE):
-                return QRType.BYTES__UR
+        elif _has_prefix(s, UR_OUTPUT_PREFIX):
+            return QRSegment(QRType.OUTPUT__UR, s)
 
-            elif DecodeQR.is_base64_psbt(s):
-                return QRType.PSBT__BASE64
+        elif SPECTER_SEGMENT_RE.match(s):
+            return QRSegment(QRType.PSBT__SPECTER, s)
 
-            elif re.search(
-                r"^B\$[2HZ]P[0-9A-Z]{4}", s
-            ):  # https://github.com/coinkite/BBQr/blob/master/BBQr.md#spliting-the-data
-                return QRType.PSBT__BBQR
+        elif _has_prefix(s, UR_BYTES_PREFIX):
+            return QRSegment(QRType.BYTES__UR, s)
 
-            elif DecodeQR.is_base43_psbt(s):
-                return QRType.PSBT__BASE43
+        data = DecodeQR.decode_base64_psbt(s)
+        if data is not None:
+            return QRSegment(QRType.PSBT__BASE64, s, data)
 
-        except UnicodeDecodeError:
-            # Probably this isn't meant to be string data; check if it's valid byte data
-            # below.
-            pass
+        if BBQR_SEGMENT_RE.match(s):
+            return QRSegment(QRType.PSBT__BBQR, s)
 
-        # Is it byte data?
-        if not isinstance(s, bytes):
-            try:
-                # TODO: remove this check & conversion once above cast to str is removed
-                s = s.encode()
-            except UnicodeError:
-                # Couldn't convert back to bytes; shouldn't happen
-                raise Exception("Conversion to bytes failed")
+        data = DecodeQR.decode_base43_psbt(s)
+        if data is not None:
+            return QRSegment(QRType.PSBT__BASE43, s, data)
 
-        return QRType.INVALID
+        return QRSegment(QRType.INVALID, s)
 
     @staticmethod
     def is_base64(s):
@@ -287,31 +355,41 @@ class DecodeQR:
             return False
 
     @staticmethod
-    def is_base64_psbt(s):
+    def decode_base64_psbt(s) -> bytes | None:
+        """The PSBT bytes if `s` is a base64-encoded PSBT, else None"""
         from seedcash.models.psbt_parser import parse_psbt
 
         try:
             if DecodeQR.is_base64(s):
-                parse_psbt(a2b_base64(s))
-                return True
+                data = a2b_base64(s)
+                parse_psbt(data, zero_copy=True)
+                return data
         except Exception:
-            return False
-        return False
+            return None
+        return None
 
     @staticmethod
-    def is_base43_psbt(s):
+    def is_base64_psbt(s):
+        return DecodeQR.decode_base64_psbt(s) is not None
+
+    @staticmethod
+    def decode_base43_psbt(s) -> bytes | None:
+        """The PSBT bytes if `s` is a base43-encoded PSBT, else None"""
         from seedcash.models.psbt_parser import parse_psbt
 
         try:
-            parse_psbt(DecodeQR.base43_decode(s))
-            return True
+            data = DecodeQR.base43_decode(s)
+            parse_psbt(data, zero_copy=True)
+            return data
         except Exception:
-            return False
+            return None
 
     @staticmethod
-    def base43_decode(s):
-        chars = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ$*+-./:"  # base43 chars
+    def is_base43_psbt(s):
+        return DecodeQR.decode_base43_psbt(s) is not None
 
+    @staticmethod
+    def base43_decode(s):
         if isinstance(s, bytes):
             v = s
         if isinstance(s, str):
@@ -319,30 +397,42 @@ class DecodeQR:
         elif isinstance(s, bytearray):
             v = bytes(s)
 
-        long_value = 0
-        power_of_base = 1
-        for c in v[::-1]:
-            digit = chars.find(bytes([c]))
-            if digit == -1:
-                raise Exception("Forbidden character {} for base {}".format(c, 43))
-            # naive but slow variant:   long_value += digit * (base**i)
-            long_value += digit * power_of_base
-            power_of_base *= 43
-        result = bytearray()
-        while long_value >= 256:
-            div, mod = divmod(long_value, 256)
-            result.append(mod)
-            long_value = div
-        result.append(long_value)
-        nPad = 0
-        for c in v:
-            if c == chars[0]:
-                nPad += 1
-            else:
-                break
-        result.extend(b"\x00" * nPad)
-        result.reverse()
-        return bytes(result)
+        digits = v.translate(BASE43_DIGITS)
+        if 0xFF in digits:
+            c = v[digits.rindex(0xFF)]
+            raise Exception("Forbidden character {} for base {}".format(c, 43))
+
+        long_value = DecodeQR.base43_digits_to_int(digits)
+
+        # Leading "0"s are leading zero bytes; the value itself takes at least one
+        nPad = len(v) - len(v.lstrip(BASE43_CHARS[:1]))
+        num_bytes = max(1, (long_value.bit_length() + 7) // 8)
+        return bytes(nPad) + long_value.to_bytes(num_bytes, "big")
+
+    @staticmethod
+    def base43_digits_to_int(digits: bytes) -> int:
+        """
+        Radix conversion by divide and conquer: fold the digits into base-43^16
+        limbs, then repeatedly combine neighbouring limbs pairwise (squaring the
+        radix each round). The big multiplications stay balanced, so this is
+        subquadratic rather than one multiply-add per digit on an ever-growing int.
+        """
+        size = BASE43_LIMB_DIGITS
+        digits = bytes(-len(digits) % size) + digits
+        limbs = []
+        for i in range(0, len(digits), size):
+            limb = 0
+            for d in digits[i : i + size]:
+                limb = limb * 43 + d
+            limbs.append(limb)
+
+        radix = 43**size
+        while len(limbs) > 1:
+            if len(limbs) & 1:
+                limbs.insert(0, 0)
+            limbs = [hi * radix + lo for hi, lo in zip(limbs[::2], limbs[1::2])]
+            radix *= radix
+        return limbs[0] if limbs else 0
 
 
 class BaseQrDecoder:
@@ -350,6 +440,7 @@ class BaseQrDecoder:
         self.total_segments = None
         self.collected_segments = 0
         self.complete = False
+        self.error = None  # why the data was rejected, if it was
 
     @property
     def is_complete(self) -> bool:
@@ -430,13 +521,20 @@ class SpecterPsbtQrDecoder(BaseAnimatedQrDecoder):
 
         return None
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def segment_header(segment) -> tuple:
+        # (current, total); both are asked for with the same segment in a row
+        match = SPECTER_HEADER_RE.match(segment)
+        if match is None:
+            return (None, None)
+        return (int(match.group(1)), int(match.group(2)))
+
     def current_segment_num(self, segment) -> int:
-        if re.search(r"^p(\d+)of(\d+) ", segment, re.IGNORECASE) != None:
-            return int(re.search(r"^p(\d+)of(\d+) ", segment, re.IGNORECASE).group(1))
+        return self.segment_header(segment)[0]
 
     def total_segment_nums(self, segment) -> int:
-        if re.search(r"^p(\d+)of(\d+) ", segment, re.IGNORECASE) != None:
-            return int(re.search(r"^p(\d+)of(\d+) ", segment, re.IGNORECASE).group(2))
+        return self.segment_header(segment)[1]
 
     def parse_segment(self, segment) -> str:
         return segment.split(" ")[-1].strip()
@@ -445,32 +543,73 @@ class SpecterPsbtQrDecoder(BaseAnimatedQrDecoder):
 class BBQRPsbtQrDecoder(BaseAnimatedQrDecoder):
     """
     Used to decode BBQR Animated PSBT encoding.
+
+    Segments are decoded to bytes as they arrive and, as soon as every earlier
+    segment is in, streamed through the decompressor ("Z") into the output. The
+    PSBT is then ready on the frame that completes it, and bad data is reported on
+    the frame that carries it rather than after the whole animation was scanned.
     """
 
+    # Refuse to reassemble (or inflate) anything larger than this
+    MAX_DATA_SIZE = 2 * 1024 * 1024
+
     def __init__(self):
         super().__init__()
         self.encoding = None
+        self.decompressor = None
+        self.next_segment = 0  # first segment not yet streamed into `chunks`
+        self.chunks = []
+        self.data_size = 0
+        self.data = None
 
-    def get_data(self) -> str:
-        logger.debug("BBQRPsbtQrDecoder get_data")
-        data = "".join(self.segments)
-        if self.complete and self.encoding:
-            if self.encoding == "H":
-                return b"".join(bytes.fromhex(s) for s in self.segments)
+    def add(self, segment, qr_type=None):
+        if self.error is not None:
+            return DecodeQRStatus.INVALID
 
-            # base32 decode, but insert padding for API
-            rv = b""
-            for p in self.segments:
-                padding = (8 - (len(p) % 8)) % 8
-                rv += b32decode(p + (padding * "="))
+        try:
+            rt = super().add(segment, qr_type)
+            if rt != DecodeQRStatus.PART_EXISTING:
+                self._stream_segments()
+            if rt == DecodeQRStatus.COMPLETE:
+                self._finish()
+            return rt
 
-            if self.encoding == "Z":
-                # decompress
-                z = zlib.decompressobj(wbits=-10)
-                rv = z.decompress(rv)
-                rv += z.flush()
+        except (ValueError, zlib.error) as e:
+            logger.warning(f"BBQr segment rejected: {e}")
+            self.error = str(e)
+            self.complete = False
+            return DecodeQRStatus.INVALID
 
-            return rv
+    def _stream_segments(self):
+        while self.next_segment < self.total_segments:
+            chunk = self.segments[self.next_segment]
+            if chunk is None:
+                break
+
+            if self.decompressor:
+                # Bound the output so a corrupt (or hostile) stream can't balloon
+                chunk = self.decompressor.decompress(
+                    chunk, self.MAX_DATA_SIZE + 1 - self.data_size
+                )
+            self.chunks.append(chunk)
+            self.data_size += len(chunk)
+            if self.data_size > self.MAX_DATA_SIZE:
+                raise ValueError("BBQr data too large")
+
+            # Keep a placeholder so a repeated segment still counts as already seen
+            self.segments[self.next_segment] = b""
+            self.next_segment += 1
+
+    def _finish(self):
+        if self.decompressor:
+            self.chunks.append(self.decompressor.flush())
+        self.data = b"".join(self.chunks)
+        self.chunks = []
+
+    def get_data(self) -> bytes:
+        logger.debug("BBQRPsbtQrDecoder get_data")
+        if self.complete:
+            return self.data
 
         return None
 
@@ -484,12 +623,30 @@ class BBQRPsbtQrDecoder(BaseAnimatedQrDecoder):
         logger.debug(f"BBQRPsbtQrDecoder total_segment_nums {total_segments}")
         return total_segments
 
-    def parse_segment(self, segment) -> str:
-        self.encoding = segment[2]
-        file_type = segment[3]
-        data = segment[8:]
+    def parse_segment(self, segment) -> bytes:
+        encoding = segment[2]
+        if self.encoding is None:
+            if encoding not in ("H", "2", "Z"):
+                raise ValueError(f"Unsupported BBQr encoding {encoding}")
+            self.encoding = encoding
+            if encoding == "Z":
+                self.decompressor = zlib.decompressobj(wbits=-10)
+        elif encoding != self.encoding:
+            raise ValueError("BBQr encoding changed unexpectedly")
+
+        data = segment[8:].strip()
+        if encoding == "H":
+            chunk = bytes.fromhex(data)
+        else:
+            # base32 decode, but insert padding for API
+            padding = (8 - (len(data) % 8)) % 8
+            chunk = b32decode(data + (padding * "="))
 
-        return data.strip()
+        # Segments are evenly sized, so one of them gives the (pre-inflate) total
+        if (self.total_segments - 1) * len(chunk) > self.MAX_DATA_SIZE:
+            raise ValueError("BBQr data too large")
+
+        return chunk
 
 
 class Base64PsbtQrDecoder(BaseSingleFrameQrDecoder):
@@ -498,10 +655,15 @@ class Base64PsbtQrDecoder(BaseSingleFrameQrDecoder):
     Does not support animated qr because no indicator of segments or their order
     """
 
-    def add(self, segment, qr_type=QRType.PSBT__BASE64):
-        if DecodeQR.is_base64(segment):
+    def __init__(self):
+        super().__init__()
+        self.decoded = None
+
+    def add(self, segment, qr_type=QRType.PSBT__BASE64, decoded: bytes = None):
+        if decoded is not None or DecodeQR.is_base64(segment):
             self.complete = True
             self.data = segment
+            self.decoded = decoded
             self.collected_segments = 1
             return DecodeQRStatus.COMPLETE
 
@@ -511,6 +673,9 @@ class Base64PsbtQrDecoder(BaseSingleFrameQrDecoder):
         return self.data
 
     def get_data(self):
+        if self.decoded is not None:
+            return self.decoded
+
         base64 = self.get_base64_data()
         if base64 != None:
             return a2b_base64(base64)
@@ -524,10 +689,12 @@ class Base43PsbtQrDecoder(BaseSingleFrameQrDecoder):
     Does not support animated qr because no indicator of segments or their order
     """
 
-    def add(self, segment, qr_type=QRType.PSBT__BASE43):
-        if DecodeQR.is_base43_psbt(segment):
+    def add(self, segment, qr_type=QRType.PSBT__BASE43, decoded: bytes = None):
+        if decoded is None:
+            decoded = DecodeQR.decode_base43_psbt(segment)
+        if decoded is not None:
             self.complete = True
-            self.data = DecodeQR.base43_decode(segment)
+            self.data = decoded
             self.collected_segments = 1
             return DecodeQRStatus.COMPLETE
 
@@ -1,6 +1,9 @@
 import math
+import zlib
+from base64 import b32encode
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, List
+from PIL import Image
 from seedcash.helpers.ur2.ur_encoder import UREncoder
 from seedcash.helpers.ur2.ur import UR
 from seedcash.helpers.qr import QR
@@ -8,6 +11,99 @@ from seedcash.models.seed import Seed
 from seedcash.models.settings import SettingsConstants
 
 
+# Characters per QR version (1-40) at ERROR_CORRECT_L, which is what `QR.qrimage_io`
+# renders with. Alphanumeric mode only covers 0-9, A-Z and " $%*+-./:".
+QR_ALPHANUMERIC_CAPACITY = [
+    25, 47, 77, 114, 154, 195, 224, 279, 335, 395,
+    468, 535, 619, 667, 758, 854, 938, 1046, 1153, 1249,
+    1352, 1460, 1588, 1704, 1853, 1990, 2132, 2223, 2369, 2520,
+    2677, 2840, 3009, 3183, 3351, 3537, 3729, 3927, 4087, 4296,
+]
+QR_BYTE_CAPACITY = [
+    17, 32, 53, 78, 106, 134, 154, 192, 230, 271,
+    321, 367, 425, 458, 520, 586, 644, 718, 792, 858,
+    929, 1003, 1091, 1171, 1273, 1367, 1465, 1528, 1628, 1732,
+    1840, 1952, 2068, 2188, 2303, 2431, 2563, 2699, 2809, 2953,
+]
+
+# Smallest QR module, in display pixels, each density setting will go down to
+QR_DENSITY_MIN_MODULE_PX = {
+    SettingsConstants.QR_DENSITY__LOW: 5,
+    SettingsConstants.QR_DENSITY__MEDIUM: 4,
+    SettingsConstants.QR_DENSITY__HIGH: 3,
+}
+
+# How long QRDisplayScreen holds each frame of an animated QR
+QR_FRAME_SECONDS = 5 / 30.0
+
+
+@dataclass
+class QRExportPlan:
+    qr_version: int
+    fragment_size: int  # payload per frame, in the format's own units
+    num_frames: int
+    module_px: int  # display pixels per QR module
+    border: int = 2  # quiet zone, in modules
+    frame_seconds: float = QR_FRAME_SECONDS
+
+    @property
+    def rendered_px(self) -> int:
+        """Side of the QR image, quiet zone included, at `module_px`"""
+        return (17 + 4 * self.qr_version + 2 * self.border) * self.module_px
+
+    @property
+    def cycle_seconds(self) -> float:
+        """Time to show every frame once"""
+        return self.num_frames * self.frame_seconds
+
+
+def plan_qr_export(
+    data_len: int,
+    fragment_size: Callable[[int], int],
+    display_px: int = 240,
+    density: str = SettingsConstants.QR_DENSITY__MEDIUM,
+    border: int = 2,
+) -> QRExportPlan:
+    """
+    Picks the QR version for `data_len` units of payload. `fragment_size(version)`
+    is how much payload one frame of that version carries once the format's own
+    framing is taken out.
+
+    The densest version whose modules are still at least the `density` setting's
+    minimum size sets the fewest frames we can get away with; of the versions that
+    need that many frames, the least dense one is used so small payloads get big,
+    easy-to-scan modules.
+    """
+    min_module_px = QR_DENSITY_MIN_MODULE_PX[density]
+
+    def module_px(version: int) -> int:
+        return max(1, display_px // (17 + 4 * version + 2 * border))
+
+    def num_frames(version: int) -> int:
+        return max(1, math.ceil(data_len / fragment_size(version)))
+
+    usable = [v for v in range(1, 41) if fragment_size(v) > 0]
+    # Even if the display is too small for the density setting, send something
+    max_version = usable[0]
+    for version in usable:
+        if module_px(version) < min_module_px:
+            break
+        max_version = version
+
+    frames = num_frames(max_version)
+    version = max_version
+    while version > usable[0] and num_frames(version - 1) == frames:
+        version -= 1
+
+    return QRExportPlan(
+        qr_version=version,
+        fragment_size=fragment_size(version),
+        num_frames=frames,
+        module_px=module_px(version),
+        border=border,
+    )
+
+
 @dataclass
 class BaseQrEncoder:
 
@@ -41,9 +137,30 @@ class BaseQrEncoder:
     def part_to_image(
         self, part, width, height, border: int = 3, background_color: str = "ffffff"
     ):
-        return self.qr.qrimage_io(
-            part, width, height, border, background_color=background_color
+        plan: QRExportPlan = getattr(self, "plan", None)
+        if plan is None or plan.rendered_px > min(width, height):
+            return self.qr.qrimage_io(
+                part, width, height, border, background_color=background_color
+            )
+
+        # Render at exactly the planned module size and quiet zone (the plan's border
+        # wins over `border`), then center it rather than stretch it, so every module
+        # is `module_px` display pixels.
+        side = plan.rendered_px
+        image = self.qr.qrimage_io(
+            part,
+            side,
+            side,
+            plan.border,
+            background_color=background_color,
+            scale=plan.module_px,
+            version=plan.qr_version,
         )
+        if (width, height) == (side, side):
+            return image
+        canvas = Image.new("RGBA", (width, height), f"#{background_color}")
+        canvas.paste(image, ((width - side) // 2, (height - side) // 2))
+        return canvas
 
     def next_part_image(
         self, width=240, height=240, border=3, background_color="bdbdbd"
@@ -202,12 +319,29 @@ class BaseSimpleAnimatedQREncoder(BaseQrEncoder):
 
 @dataclass
 class SpecterXPubQrEncoder(BaseSimpleAnimatedQREncoder, BaseXpubQrEncoder):
+    qr_density: str = SettingsConstants.QR_DENSITY__MEDIUM
+    display_px: int = 240
+
+    # "p12of34 " worst case for the frame counts we'd ever show
+    HEADER_LEN = 10
+
     @property
     def qr_max_fragment_size(self):
-        return 50
+        return self.plan.fragment_size
+
+    @classmethod
+    def fragment_size_for_version(cls, version: int) -> int:
+        # base58 xpubs are mixed case, so the QR is in byte mode
+        return QR_BYTE_CAPACITY[version - 1] - cls.HEADER_LEN
 
     def _create_parts(self):
         self.prep_xpub()
+        self.plan = plan_qr_export(
+            len(self.xpubstring),
+            self.fragment_size_for_version,
+            display_px=self.display_px,
+            density=self.qr_density,
+        )
         start = 0
         stop = self.qr_max_fragment_size
         qr_cnt = ((len(self.xpubstring) - 1) // self.qr_max_fragment_size) + 1
@@ -234,6 +368,75 @@ class SpecterXPubQrEncoder(BaseSimpleAnimatedQREncoder, BaseXpubQrEncoder):
             cnt += 1
 
 
+@dataclass
+class BBQrPsbtQrEncoder(BaseSimpleAnimatedQREncoder):
+    """
+    BBQr animated PSBT encoding (https://github.com/coinkite/BBQr/blob/master/BBQr.md).
+
+    Every frame is "B$" + encoding + file type + 2-digit base36 frame total + 2-digit
+    base36 frame index + data, all in the QR alphanumeric charset. The PSBT is sent
+    as deflate-compressed base32 ("Z") when that helps, otherwise as plain base32
+    ("2") or hex ("H"), whichever needs the fewest frames at `qr_version`. Frames
+    are then evenly sized so they all render at about the same density.
+    """
+
+    psbt: bytearray = None
+    qr_version: int = 8
+
+    HEADER_LEN = 8
+    MAX_FRAMES = 36 * 36 - 1
+
+    @property
+    def qr_max_fragment_size(self):
+        return QR_ALPHANUMERIC_CAPACITY[self.qr_version - 1] - self.HEADER_LEN
+
+    @staticmethod
+    def deflate(data: bytes) -> bytes:
+        # Raw deflate with a 1 KB window, as BBQr specifies (decoders use wbits=-10)
+        z = zlib.compressobj(level=9, wbits=-10)
+        return z.compress(data) + z.flush()
+
+    def _create_parts(self):
+        psbt = bytes(self.psbt)
+        compressed = self.deflate(psbt)
+
+        # (encoding, data string, chars per indivisible unit)
+        candidates = [("H", psbt.hex().upper(), 2), ("2", self._b32(psbt), 8)]
+        if len(compressed) < len(psbt):
+            candidates.append(("Z", self._b32(compressed), 8))
+
+        best = None
+        for encoding, data, unit in candidates:
+            max_chars = self.qr_max_fragment_size // unit * unit
+            num_frames = math.ceil(len(data) / max_chars)
+            # Spread the data evenly rather than leaving a short last frame
+            frame_chars = math.ceil(math.ceil(len(data) / num_frames) / unit) * unit
+            num_frames = math.ceil(len(data) / frame_chars)
+            if best is None or (num_frames, len(data)) < (best[0], len(best[2])):
+                best = (num_frames, encoding, data, frame_chars)
+
+        num_frames, self.encoding, data, frame_chars = best
+        if num_frames > self.MAX_FRAMES:
+            raise ValueError(f"PSBT too large for BBQr at QR version {self.qr_version}")
+
+        total = self._base36(num_frames)
+        for i in range(num_frames):
+            self.parts.append(
+                f"B${self.encoding}P{total}{self._base36(i)}"
+                + data[i * frame_chars:(i + 1) * frame_chars]
+            )
+
+    @staticmethod
+    def _b32(data: bytes) -> str:
+        # BBQr drops the padding; decoders re-pad each frame
+        return b32encode(data).decode().rstrip("=")
+
+    @staticmethod
+    def _base36(n: int) -> str:
+        digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        return digits[n // 36] + digits[n % 36]
+
+
 """**************************************************************************************
     Fountain encoded animated QR encoders
 **************************************************************************************"""
@@ -241,10 +444,27 @@ class SpecterXPubQrEncoder(BaseSimpleAnimatedQREncoder, BaseXpubQrEncoder):
 
 @dataclass
 class BaseFountainQrEncoder(BaseQrEncoder):
+    """
+    UR fountain encoders. Parts are sent upper-cased, as BCR-2020-005 recommends,
+    so the QR uses alphanumeric rather than byte mode (UR decoders are
+    case-insensitive).
+    """
+
+    qr_density: str = SettingsConstants.QR_DENSITY__MEDIUM
+    display_px: int = 240
+
+    # "UR:CRYPTO-PSBT/" plus "1234567-12345/"; seq nums keep counting past the
+    # seq len for as long as the animation runs
+    UR_HEADER_LEN = 15 + 14
+    # Part CBOR around the fragment (array head, four uint32s, byte string head)
+    # plus the bytewords CRC-32
+    PART_OVERHEAD = 1 + 4 * 5 + 3 + 4
+
     def __post_init__(self):
         super().__post_init__()
 
         self.ur2_encode: UREncoder = None
+        self.plan: QRExportPlan = None
 
     @property
     def is_complete(self):
@@ -252,7 +472,21 @@ class BaseFountainQrEncoder(BaseQrEncoder):
 
     @property
     def qr_max_fragment_size(self):
-        return 65
+        return self.plan.fragment_size
+
+    @classmethod
+    def fragment_size_for_version(cls, version: int) -> int:
+        # Minimal bytewords: two characters per byte
+        chars = QR_ALPHANUMERIC_CAPACITY[version - 1] - cls.UR_HEADER_LEN
+        return chars // 2 - cls.PART_OVERHEAD
+
+    def _plan(self, message_len: int):
+        self.plan = plan_qr_export(
+            message_len,
+            self.fragment_size_for_version,
+            display_px=self.display_px,
+            density=self.qr_density,
+        )
 
     def _create_parts(self):
         """parts are dynamically generated by the fountain encoder"""
@@ -262,10 +496,10 @@ class BaseFountainQrEncoder(BaseQrEncoder):
         return self.ur2_encode.fountain_encoder.seq_len()
 
     def next_part(self) -> str:
-        return self.ur2_encode.next_part()
+        return self.ur2_encode.next_part().upper()
 
     def cur_part(self) -> str:
-        return self.ur2_encode.current_part()
+        return self.ur2_encode.current_part().upper()
 
     def restart(self):
         self.ur2_encode.fountain_encoder.restart()
@@ -278,4 +512,5 @@ class UrPsbtQrEncoder(BaseFountainQrEncoder):
     def __post_init__(self):
         super().__post_init__()
         ur = UR("crypto-psbt", self.psbt)
+        self._plan(len(ur.cbor))
         self.ur2_encode = UREncoder(ur=ur, max_fragment_len=self.qr_max_fragment_size)
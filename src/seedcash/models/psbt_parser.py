@@ -1,18 +1,21 @@
+import hashlib
 import logging
 import struct
+from collections import Counter
 from enum import StrEnum
 from typing import Dict, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass, field
 
 
-from seedcash.models.bip44 import Bip44
+from seedcash.models import cashaddr
 
 logger = logging.getLogger(__name__)
 
 
 
-# Data Classes Used for Display
-@dataclass
+# Data Classes Used for Display. Slotted since a large PSBT can carry thousands
+# of outputs and these are built straight from the raw transaction bytes.
+@dataclass(slots=True)
 class NFTData:
     capability: str
     commitment: str
@@ -22,13 +25,13 @@ class NFTWarning(StrEnum):
     MINTING = "minting"
     BURNING = "burning"
 
-@dataclass
+@dataclass(slots=True)
 class TokenData:
     category_id: str
     ft_amount: Optional[int] = None
     nft_data: Optional[NFTData] = None  # {'capability': 'none', 'commitment': b'...'}
 
-@dataclass
+@dataclass(slots=True)
 class TxOutput:
     value_satoshis: int
     script_pubkey: bytes                       # CashToken prefix stripped
@@ -40,7 +43,7 @@ class TxOutput:
     def is_token_output(self) -> bool:
         return self.token is not None
 
-@dataclass
+@dataclass(slots=True)
 class TxInput:
     prev_txid: bytes
     prev_index: int
@@ -52,7 +55,34 @@ class TxInput:
     def is_token_input(self) -> bool:
         return self.spent_output is not None and self.spent_output.token is not None
 
-@dataclass
+@dataclass(slots=True)
+class TokenCategorySummary:
+    """Everything the PSBT views show for one token category, gathered in a
+    single pass over the transaction so paging through categories never
+    re-walks the inputs/outputs."""
+    category_id: str
+    ft_inputs: List[TxInput] = field(default_factory=list)  # FT-only (no NFT)
+    ft_outputs: List[TxOutput] = field(default_factory=list)
+    nft_inputs: List[TxInput] = field(default_factory=list)
+    nft_outputs: List[TxOutput] = field(default_factory=list)
+    ft_input_amount: int = 0
+    ft_output_amount: int = 0
+    nft_input_set: Counter = field(default_factory=Counter)  # (capability, commitment) multiset
+    nft_output_set: Counter = field(default_factory=Counter)
+    destination_addresses: List[str] = field(default_factory=list)  # outputs carrying FT
+    is_minting: bool = False
+    is_ft_burning: bool = False
+    is_nft_burning: bool = False
+
+    @property
+    def nft_warning(self) -> Optional[NFTWarning]:
+        if self.is_minting:
+            return NFTWarning.MINTING
+        if self.is_nft_burning:
+            return NFTWarning.BURNING
+        return None
+
+@dataclass(slots=True)
 class Transaction:
     version: int
     locktime: int
@@ -77,56 +107,60 @@ class Transaction:
         return self.total_input - self.total_output
 
 
-    def arrange_inputs_by_type_and_category(self) -> List[Dict[str, List[TxInput]]]: 
-        st_dict: Dict[str, List[TxInput]] = {}
-        ft_dict: Dict[str, List[TxInput]] = {}
-        nft_dict: Dict[str, List[TxInput]] = {}
+    def summarize_tokens(self) -> Dict[str, TokenCategorySummary]:
+        """Build the per-category token index (and ``categories``, in input
+        order) in one pass over the inputs and one over the outputs."""
+        self.categories = {"nft": [], "ft": []}
+        summaries: Dict[str, TokenCategorySummary] = {}
 
         for inp in self.inputs:
-            if inp.is_token_input:
-                if inp.spent_output.token.nft_data is not None:
-                    category = inp.spent_output.token.category_id
-                    if category not in nft_dict:
-                        self.categories["nft"].append(category)
-                        nft_dict[category] = []
-                    nft_dict[category].append(inp)
-                elif inp.spent_output.token.ft_amount is not None:
-                    category = inp.spent_output.token.category_id
-                    if category not in ft_dict:
-                        self.categories["ft"].append(category)
-                        ft_dict[category] = []
-                    ft_dict[category].append(inp)
-            else:
-                if "bch" not in st_dict:
-                    st_dict["bch"] = []
-                st_dict["bch"].append(inp)
-
-        return [nft_dict,ft_dict,st_dict]
-
-    def arrange_outputs_by_type_and_category(self) -> List[Dict[str, List[TxOutput]]]:
-        st_dict: Dict[str, List[TxOutput]] = {}
-        ft_dict: Dict[str, List[TxOutput]] = {}
-        nft_dict: Dict[str, List[TxOutput]] = {}
+            if not inp.is_token_input:
+                continue
+            token = inp.spent_output.token
+            category = token.category_id
+            summary = summaries.get(category)
+            if summary is None:
+                summary = summaries[category] = TokenCategorySummary(category)
+
+            if token.ft_amount is not None:
+                summary.ft_input_amount += token.ft_amount
+            if token.nft_data is not None:
+                if not summary.nft_inputs:
+                    self.categories["nft"].append(category)
+                summary.nft_inputs.append(inp)
+                summary.nft_input_set[(token.nft_data.capability, token.nft_data.commitment)] += 1
+            elif token.ft_amount is not None:
+                if not summary.ft_inputs:
+                    self.categories["ft"].append(category)
+                summary.ft_inputs.append(inp)
 
         for out in self.outputs:
-            if out.is_token_output:
-                if out.token.nft_data is not None:
-                    category = out.token.category_id
-                    if category not in nft_dict:
-                        nft_dict[category] = []
-                    nft_dict[category].append(out)
-                elif out.token.ft_amount is not None:
-                    category = out.token.category_id
-                    if category not in ft_dict:
-                        ft_dict[category] = []
-                    ft_dict[category].append(out)
-            else:
-                if "bch" not in st_dict:
-                    st_dict["bch"] = []
-                st_dict["bch"].append(out)
-
-        return [nft_dict, ft_dict, st_dict]
-    
+            if not out.is_token_output:
+                continue
+            token = out.token
+            category = token.category_id
+            summary = summaries.get(category)
+            if summary is None:
+                summary = summaries[category] = TokenCategorySummary(category)
+
+            if token.ft_amount is not None:
+                summary.ft_output_amount += token.ft_amount
+                if out.address:
+                    summary.destination_addresses.append(out.address)
+            if token.nft_data is not None:
+                summary.nft_outputs.append(out)
+                summary.nft_output_set[(token.nft_data.capability, token.nft_data.commitment)] += 1
+                if token.nft_data.capability == "minting":
+                    summary.is_minting = True
+            elif token.ft_amount is not None:
+                summary.ft_outputs.append(out)
+
+        for summary in summaries.values():
+            summary.is_ft_burning = summary.ft_output_amount < summary.ft_input_amount
+            summary.is_nft_burning = summary.nft_input_set != summary.nft_output_set
+
+        return summaries
+
     def categories_type(self, type_name: str) -> List[str]:
         return self.categories.get(type_name, [])
 
@@ -143,12 +177,12 @@ def read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
         return struct.unpack_from("<I", buf, pos + 1)[0], pos + 5
     return struct.unpack_from("<Q", buf, pos + 1)[0], pos + 9
 
-def parse_token_script(script: bytes) -> Optional[Dict[str, Any]]:
+def parse_token_script(script: bytes) -> Optional[Tuple[TokenData, int]]:
     """Decode a CashToken prefix (PREFIX_TOKEN = 0xef) from a locking script.
 
     Returns ``None`` if ``script`` has no token prefix. Otherwise returns
-    ``{'prefix': <raw prefix bytes>, 'script_pubkey': <underlying spendable
-    script>, 'data': <decoded token fields>}``.
+    ``(token_data, prefix_len)``; ``script[prefix_len:]`` is the underlying
+    spendable script.
     """
     if not script or script[0] != 0xEF:
         return None
@@ -193,73 +227,58 @@ def parse_token_script(script: bytes) -> Optional[Dict[str, Any]]:
         ft_amount=ft_amount,
         nft_data=nft_data,
     )
-    return {
-        "prefix": script[:pos],
-        "script_pubkey": script[pos:],
-        "data": token_data,
-    }
+    return token_data, pos
 
-def parse_transaction(tx_bytes: bytes) -> Dict[str, Any]:
-    """Parse a raw Bitcoin Cash transaction, with CashToken awareness.
-
-    Each output dict carries both:
-      - ``script``: the *full* raw locking script exactly as it appears on
-        chain. This is what must be used verbatim when building a sighash
-        preimage (the CashToken prefix, if any, is part of the committed
-        scriptPubKey).
-      - ``script_pubkey``: the underlying spendable script with any
-        CashToken prefix stripped off, plus ``token_data`` with the decoded
-        token fields. Use this for address extraction / OP_RETURN checks.
+def parse_output(buf: bytes, pos: int) -> Tuple[TxOutput, int]:
+    """Parse one serialized transaction output at ``pos``.
+
+    ``full_script`` is the raw locking script exactly as it appears on
+    chain. This is what must be used verbatim when building a sighash
+    preimage (the CashToken prefix, if any, is part of the committed
+    scriptPubKey). ``script_pubkey`` is the underlying spendable script with
+    any CashToken prefix stripped off, decoded into ``token``. Use it for
+    address extraction / OP_RETURN checks.
     """
-    pos = 0
-    version = tx_bytes[pos:pos + 4]
-    pos += 4
+    value_satoshis, = struct.unpack_from("<Q", buf, pos)
+    pos += 8
+    script_len, pos = read_varint(buf, pos)
+    script = bytes(buf[pos:pos + script_len])
+    pos += script_len
+
+    token = parse_token_script(script)
+    if token is None:
+        return TxOutput(value_satoshis, script, script), pos
+
+    token_data, prefix_len = token
+    return TxOutput(value_satoshis, script[prefix_len:], script, token_data), pos
+
+def parse_transaction(tx_bytes: bytes) -> Transaction:
+    """Parse a raw Bitcoin Cash transaction, with CashToken awareness, straight
+    into the ``Transaction`` model (see ``parse_output`` for the scripts)."""
+    version, = struct.unpack_from("<I", tx_bytes, 0)
+    pos = 4
 
     input_count, pos = read_varint(tx_bytes, pos)
     inputs = []
     for _ in range(input_count):
-        prev_txid = tx_bytes[pos:pos + 32]
-        pos += 32
-        prev_index = tx_bytes[pos:pos + 4]
-        pos += 4
+        prev_txid = bytes(tx_bytes[pos:pos + 32])
+        prev_index, = struct.unpack_from("<I", tx_bytes, pos + 32)
+        pos += 36
         script_len, pos = read_varint(tx_bytes, pos)
-        script_sig = tx_bytes[pos:pos + script_len]
+        script_sig = bytes(tx_bytes[pos:pos + script_len])
         pos += script_len
-        sequence = tx_bytes[pos:pos + 4]
+        sequence, = struct.unpack_from("<I", tx_bytes, pos)
         pos += 4
-        inputs.append({
-            "prev_txid": prev_txid,
-            "prev_index": prev_index,
-            "script_sig": script_sig,
-            "sequence": sequence,
-        })
+        inputs.append(TxInput(prev_txid, prev_index, sequence, script_sig))
 
     output_count, pos = read_varint(tx_bytes, pos)
     outputs = []
     for _ in range(output_count):
-        value = tx_bytes[pos:pos + 8]
-        pos += 8
-        script_len, pos = read_varint(tx_bytes, pos)
-        script = tx_bytes[pos:pos + script_len]
-        pos += script_len
+        output, pos = parse_output(tx_bytes, pos)
+        outputs.append(output)
 
-        token = parse_token_script(script)
-        outputs.append({
-            "value": value,
-            "amount_int": int.from_bytes(value, "little"),
-            "script": script,
-            "token_prefix": token["prefix"] if token else None,
-            "script_pubkey": token["script_pubkey"] if token else script,
-            "token_data": token["data"] if token else None,
-        })
-
-    locktime = tx_bytes[pos:pos + 4]
-    return {
-        "version": version,
-        "inputs": inputs,
-        "outputs": outputs,
-        "locktime": locktime,
-    }
+    locktime, = struct.unpack_from("<I", tx_bytes, pos)
+    return Transaction(version, locktime, inputs, outputs)
 
 def parse_keypairs(buf: bytes, pos: int) -> Tuple[List[Tuple[bytes, bytes]], int]:
     """Parse one PSBT key-value map, returning ``[(key, value), ...]``."""
@@ -277,18 +296,30 @@ def parse_keypairs(buf: bytes, pos: int) -> Tuple[List[Tuple[bytes, bytes]], int
         pairs.append((key, value))
     raise ValueError("unexpected end while parsing keypairs")
 
-def parse_psbt(buf) -> Dict[str, Any]:
+def parse_psbt(buf, zero_copy: bool = False) -> Dict[str, Any]:
     """Parse a PSBT binary into global/input/output key-value maps.
 
     Key-value maps are lists of ``(key, value)`` tuples (in serialization
     order, duplicates preserved) rather than dicts, since PSBT allows
     repeated key *types* (e.g. multiple BIP32 derivations) that only differ
     by the data appended to the key type byte.
+
+    With ``zero_copy`` the buffer is wrapped in a single ``memoryview`` and
+    every key and value in the result is a memoryview slice into it instead
+    of a fresh ``bytes`` copy. Call ``bytes()`` on the values that need to
+    outlive the buffer or be hashed/concatenated. A ``bytearray`` buffer
+    can't be resized while those views are alive. (``parsed_tx`` always
+    holds its own small txid/script ``bytes``.)
     """
-    if isinstance(buf, (bytearray, memoryview)):
-        buf = bytes(buf)
-    if not isinstance(buf, bytes):
-        raise TypeError(f"PSBT buffer must be bytes-like, got {type(buf).__name__}")
+    if zero_copy:
+        if not isinstance(buf, (bytes, bytearray, memoryview)):
+            raise TypeError(f"PSBT buffer must be bytes-like, got {type(buf).__name__}")
+        buf = memoryview(buf)
+    else:
+        if isinstance(buf, (bytearray, memoryview)):
+            buf = bytes(buf)
+        if not isinstance(buf, bytes):
+            raise TypeError(f"PSBT buffer must be bytes-like, got {type(buf).__name__}")
     if len(buf) < 5 or buf[:5] != b"psbt\xff":
         raise ValueError("invalid PSBT magic")
     pos = 5
@@ -317,9 +348,9 @@ def parse_psbt(buf) -> Dict[str, Any]:
 
     parsed_tx = parse_transaction(unsigned_tx)
     if input_count == 0:
-        input_count = len(parsed_tx["inputs"])
+        input_count = len(parsed_tx.inputs)
     if output_count == 0:
-        output_count = len(parsed_tx["outputs"])
+        output_count = len(parsed_tx.outputs)
 
     inputs = []
     for _ in range(input_count):
@@ -343,31 +374,72 @@ def parse_psbt(buf) -> Dict[str, Any]:
         "proprietary": proprietary,
     }
 
+class PrevTxOutputs:
+    """Skip-scanning accessor for the outputs of a PSBT_IN_NON_WITNESS_UTXO
+    previous transaction.
+
+    Only the varint length headers of the inputs and of the outputs ahead of
+    the requested index are walked; no dicts are built and no CashToken
+    prefixes are decoded for outputs nobody asks for. Output offsets found
+    along the way are kept so later lookups into the same transaction resume
+    the scan rather than restarting it.
+    """
+
+    def __init__(self, tx_bytes: bytes):
+        self.tx_bytes = tx_bytes
+        self.txid = hashlib.sha256(hashlib.sha256(tx_bytes).digest()).digest()
+
+        pos = 4  # version
+        input_count, pos = read_varint(tx_bytes, pos)
+        for _ in range(input_count):
+            pos += 36  # prev_txid + prev_index
+            script_len, pos = read_varint(tx_bytes, pos)
+            pos += script_len + 4  # script_sig + sequence
+        self.output_count, pos = read_varint(tx_bytes, pos)
+
+        # output_offsets[i] is where output i starts
+        self.output_offsets: List[int] = [pos]
+
+    def output(self, index: int) -> Optional[TxOutput]:
+        if not 0 <= index < self.output_count:
+            return None
+
+        offsets = self.output_offsets
+        while len(offsets) <= index:
+            script_len, pos = read_varint(self.tx_bytes, offsets[-1] + 8)
+            offsets.append(pos + script_len)
+
+        output, _ = parse_output(self.tx_bytes, offsets[index])
+        return output
+
 def resolve_spent_output(
-    tx_input: Dict[str, Any], input_pairs: List[Tuple[bytes, bytes]]
-) -> Optional[Dict[str, Any]]:
+    tx_input: TxInput,
+    input_pairs: List[Tuple[bytes, bytes]],
+    prev_txs: Optional[Dict[bytes, PrevTxOutputs]] = None,
+) -> Optional[TxOutput]:
     """Resolve the UTXO an input spends, from PSBT_IN_NON_WITNESS_UTXO or
-    PSBT_IN_WITNESS_UTXO, with CashToken decoding applied."""
-    prev_index = int.from_bytes(tx_input["prev_index"], "little")
+    PSBT_IN_WITNESS_UTXO, with CashToken decoding applied.
+
+    A previous transaction must hash to the input's prev txid. Pass the same
+    ``prev_txs`` dict for every input of a PSBT so that inputs spending from
+    the same parent only hash and scan it once.
+    """
     for key, value in input_pairs:
         if key[0] == 0x00:  # PSBT_IN_NON_WITNESS_UTXO
-            prev_tx = parse_transaction(value)
-            if prev_index < len(prev_tx["outputs"]):
-                return prev_tx["outputs"][prev_index]
-            return None
+            prev_txid = tx_input.prev_txid
+            prev_tx = prev_txs.get(prev_txid) if prev_txs is not None else None
+            if prev_tx is None:
+                prev_tx = PrevTxOutputs(value)
+                if prev_tx.txid != prev_txid:
+                    raise ValueError(
+                        f"PSBT_IN_NON_WITNESS_UTXO does not match prev txid {prev_txid[::-1].hex()}"
+                    )
+                if prev_txs is not None:
+                    prev_txs[prev_txid] = prev_tx
+            return prev_tx.output(tx_input.prev_index)
         if key[0] == 0x01:  # PSBT_IN_WITNESS_UTXO
-            out_value = value[:8]
-            script_len, spos = read_varint(value, 8)
-            script = value[spos:spos + script_len]
-            token = parse_token_script(script)
-            return {
-                "value": out_value,
-                "amount_int": int.from_bytes(out_value, "little"),
-                "script": script,
-                "token_prefix": token["prefix"] if token else None,
-                "script_pubkey": token["script_pubkey"] if token else script,
-                "token_data": token["data"] if token else None,
-            }
+            output, _ = parse_output(value, 0)
+            return output
     return None
 
 class PSBTParser:
@@ -377,28 +449,32 @@ class PSBTParser:
         self.wallet_fingerprint = wallet_fingerprint
 
         try:
-            self.parsed = parse_psbt(self.psbt_bytes)
+            # Key-value maps and previous txs stay as views into psbt_bytes; only
+            # the fields copied into the Transaction model are materialized.
+            self.parsed = parse_psbt(self.psbt_bytes, zero_copy=True)
             self.tx = self._build_transaction()
-            self._outputs = self.tx.arrange_outputs_by_type_and_category()
-            self._inputs = self.tx.arrange_inputs_by_type_and_category()
+            self.token_summaries = self.tx.summarize_tokens()
+            self._token_categories = sorted(self.tx.categories_type("ft"))
+            self._nft_categories = sorted(self.tx.categories_type("nft"))
         except Exception:
             logger.error(f"CRASHING PSBT BYTES HEX: {bytes(self.psbt_bytes).hex()}")
             raise
 
     @property
     def token_categories(self) -> List[str]:
-        return sorted(self.tx.categories_type("ft")) if self.tx else []
+        return self._token_categories
 
     @property
+    def nft_categories(self) -> List[str]:
+        return self._nft_categories
+
+    def token_summary(self, category_id: str) -> TokenCategorySummary:
+        summary = self.token_summaries.get(category_id)
+        return summary if summary else TokenCategorySummary(category_id)
+
     def ft_burning(self, category_id: str) -> bool:
-        input_count = len(self.inputs[1].get(category_id, []))
-        output_count = len(self.outputs[1].get(category_id, []))
-        return input_count > 0 and output_count < input_count
+        return self.token_summary(category_id).is_ft_burning
 
-    @property
-    def nft_categories(self) -> List[str]:
-        return sorted(self.tx.categories_type("nft")) if self.tx else []
-    
     @property
     def input_amount(self) -> int:
         return self.tx.total_input if self.tx else 0
@@ -411,22 +487,12 @@ class PSBTParser:
     def fee_amount(self) -> int:
         return self.tx.fee if self.tx else 0
 
-    @property
-    def inputs(self) -> List[Dict[str, TxInput]]:
-        return self._inputs
-
     @property
     def num_inputs(self) -> int:
         return len(self.tx.inputs) if self.tx else 0
 
-    @property
-    def outputs(self) -> List[Dict[str, TxOutput]]:
-        return self._outputs
     def ft_output_amount(self, category_id: str) -> Optional[int]:
-        total_ft_amount = 0
-        for out in self.outputs[1].get(category_id, []):
-            if out.token and out.token.ft_amount is not None:
-                total_ft_amount += out.token.ft_amount
+        total_ft_amount = self.token_summary(category_id).ft_output_amount
         return total_ft_amount if total_ft_amount > 0 else None
 
     @property
@@ -446,7 +512,10 @@ class PSBTParser:
         return None
 
     def token_destination_addresses(self, category_id: str) -> List[str]:
-        return [out.address for out in self.outputs[1].get(category_id, []) if out.is_token_output and out.address]
+        return self.token_summary(category_id).destination_addresses
+
+    def nft_outputs(self, category_id: str) -> List[TxOutput]:
+        return self.token_summary(category_id).nft_outputs
         
     def output_at_index(self, index: int) -> Optional[TxOutput]:
         if self.tx and 0 <= index < len(self.tx.outputs):
@@ -454,77 +523,34 @@ class PSBTParser:
         return None
 
     def get_warning(self, category_id: str) -> Optional[NFTWarning]:
-        for out in self.outputs[0].get(category_id, []):
-            if out.token.nft_data.capability == "minting":
-                return NFTWarning.MINTING.value
-            
-        if len(self.inputs[0].get(category_id, [])) < len(self.outputs[0].get(category_id, [])):
-            return NFTWarning.BURNING.value
-
-        if len(self.inputs[0].get(category_id, [])) == len(self.outputs[0].get(category_id, [])):
-            for i in range(len(self.inputs[0].get(category_id, []))):
-                if ((self.inputs[0].get(category_id, [])[i].spent_output.token.nft_data.capability != self.outputs[0].get(category_id, [])[i].token.nft_data.capability) 
-                    or self.inputs[0].get(category_id, [])[i].spent_output.token.nft_data.commitment != self.outputs[0].get(category_id, [])[i].token.nft_data.commitment):
-                    return NFTWarning.BURNING.value
-        return None
+        warning = self.token_summary(category_id).nft_warning
+        return warning.value if warning else None
 
     @staticmethod
     def address_from_script(script_pubkey: bytes, is_token_tx: bool = False) -> Optional[str]:
         if script_pubkey.startswith(b"\x76\xa9\x14") and script_pubkey.endswith(b"\x88\xac"):
             hash160 = script_pubkey[3:23]
-            addr = Bip44.hash160_to_cashaddr(hash160, version_byte=0x00).strip()
-            if is_token_tx and addr.startswith("bitcoincash:q"):
-                return addr.replace("q", "z", 1)
-            return addr
+            version_byte = cashaddr.VERSION__P2PKH_TOKEN if is_token_tx else cashaddr.VERSION__P2PKH
+            return cashaddr.encode(hash160, version_byte)
 
         if script_pubkey.startswith(b"\xa9\x14") and script_pubkey.endswith(b"\x87"):
             hash160 = script_pubkey[2:22]
-            addr = Bip44.hash160_to_cashaddr(hash160, version_byte=0x08).strip()
-            if is_token_tx and addr.startswith("bitcoincash:p"):
-                return addr.replace("p", "r", 1)
-            return addr
+            version_byte = cashaddr.VERSION__P2SH_TOKEN if is_token_tx else cashaddr.VERSION__P2SH
+            return cashaddr.encode(hash160, version_byte)
 
         return None
     
     def _build_transaction(self) -> Transaction:
-        raw_tx = self.parsed["parsed_tx"]
-
-        inputs = []
-        for i, raw_in in enumerate(raw_tx["inputs"]):
-            input_pairs = self.parsed["inputs"][i]
-            spent = resolve_spent_output(raw_in, input_pairs)
-            spent_out = None
-            if spent:
-                spent_out = TxOutput(
-                    value_satoshis=spent["amount_int"],
-                    script_pubkey=spent["script_pubkey"],
-                    full_script=spent["script"],
-                    token=spent.get("token_data"),
-                )
-            inputs.append(TxInput(
-                prev_txid=raw_in["prev_txid"],
-                prev_index=int.from_bytes(raw_in["prev_index"], "little"),
-                sequence=int.from_bytes(raw_in["sequence"], "little"),
-                script_sig=raw_in["script_sig"],
-                spent_output=spent_out,
-            ))
-
-        outputs = []
-        for raw_out in raw_tx["outputs"]:
-            outputs.append(TxOutput(
-                value_satoshis=raw_out["amount_int"],
-                script_pubkey=raw_out["script_pubkey"],
-                full_script=raw_out["script"],
-                token=raw_out.get("token_data"),
-                address=self.address_from_script(raw_out["script_pubkey"], is_token_tx=raw_out.get("token_data") is not None)
-            ))
-
-        return Transaction(
-            version=int.from_bytes(raw_tx["version"], "little"),
-            locktime=int.from_bytes(raw_tx["locktime"], "little"),
-            inputs=inputs,
-            outputs=outputs,
-            input_maps=self.parsed["inputs"],
-            output_maps=self.parsed["outputs"],
-            raw_unsigned_tx=self.parsed.get("unsigned_tx", b""),
-        )
+        tx: Transaction = self.parsed["parsed_tx"]
+
+        prev_txs: Dict[bytes, PrevTxOutputs] = {}
+        for tx_input, input_pairs in zip(tx.inputs, self.parsed["inputs"]):
+            tx_input.spent_output = resolve_spent_output(tx_input, input_pairs, prev_txs)
+
+        for out in tx.outputs:
+            out.address = self.address_from_script(out.script_pubkey, is_token_tx=out.token is not None)
+
+        tx.input_maps = self.parsed["inputs"]
+        tx.output_maps = self.parsed["outputs"]
+        tx.raw_unsigned_tx = self.parsed.get("unsigned_tx", b"")
+        return tx
@@ -1,10 +1,21 @@
 # signer.py
 import hashlib
+import os
+import secrets
 import ecdsa
-from typing import List, Tuple
-
-from src.seedcash.models.psbt_parser import parse_psbt, parse_transaction, read_varint
-from src.seedcash.models.bip44 import Bip44
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from ecdsa.ellipticcurve import INFINITY, PointJacobi
+from typing import Dict, List, Optional, Tuple
+
+from seedcash.models.psbt_parser import (
+    PrevTxOutputs,
+    parse_psbt,
+    parse_transaction,
+    read_varint,
+    resolve_spent_output,
+)
+from seedcash.models.bip44 import Bip44
 
 # ----------------------------------------------------------------------
 # Low-level helpers (if not already in psbt_parser)
@@ -70,21 +81,94 @@ def _serialize_keypairs(pairs: List[Tuple[bytes, bytes]]) -> bytes:
     out += b"\x00"
     return out
 
-def _replace_psbt_input_map(psbt_bytes: bytearray, input_index: int,
-                            updated_pairs: List[Tuple[bytes, bytes]]) -> bytearray:
-    parsed = parse_psbt(psbt_bytes)
-    if input_index >= parsed["input_count"]:
-        raise ValueError(f"Input index {input_index} out of range")
-    pos = 5
-    pos = _scan_psbt_map_end(psbt_bytes, pos)
-    input_starts, input_ends = [], []
-    for _ in range(parsed["input_count"]):
-        input_starts.append(pos)
-        pos = _scan_psbt_map_end(psbt_bytes, pos)
-        input_ends.append(pos)
-    replacement = _serialize_keypairs(updated_pairs)
-    start, end = input_starts[input_index], input_ends[input_index]
-    return psbt_bytes[:start] + replacement + psbt_bytes[end:]
+def _replace_psbt_input_maps(psbt_bytes: bytearray, input_count: int,
+                             updated_maps: Dict[int, List[Tuple[bytes, bytes]]]) -> bytearray:
+    """Swap in new key-value maps for the inputs in `updated_maps`, in one pass."""
+    pos = _scan_psbt_map_end(psbt_bytes, 5)
+    chunks = [psbt_bytes[:pos]]
+    for i in range(input_count):
+        end = _scan_psbt_map_end(psbt_bytes, pos)
+        if i in updated_maps:
+            chunks.append(_serialize_keypairs(updated_maps[i]))
+        else:
+            chunks.append(psbt_bytes[pos:end])
+        pos = end
+    for i in updated_maps:
+        if i >= input_count:
+            raise ValueError(f"Input index {i} out of range")
+    chunks.append(psbt_bytes[pos:])
+    return bytearray(b"".join(chunks))
+
+@dataclass(frozen=True)
+class SighashContext:
+    """The per-transaction parts of the BCH (BIP143-style, FORKID) sighash
+    preimage, computed once and shared read-only by every input being signed
+    (and by every signing worker process)."""
+    version: bytes
+    locktime: bytes
+    outpoints: Tuple[bytes, ...]
+    sequences: Tuple[bytes, ...]
+    outputs: Tuple[bytes, ...]  # serialized value + script per output
+    hash_prevouts: bytes
+    hash_sequence: bytes
+    hash_outputs: bytes
+
+    @classmethod
+    def from_tx(cls, tx: bytes) -> "SighashContext":
+        tx_data = parse_transaction(tx)
+        outpoints = tuple(
+            txin.prev_txid + txin.prev_index.to_bytes(4, "little") for txin in tx_data.inputs
+        )
+        sequences = tuple(txin.sequence.to_bytes(4, "little") for txin in tx_data.inputs)
+        outputs = tuple(
+            out.value_satoshis.to_bytes(8, "little")
+            + serialize_varint(len(out.full_script)) + out.full_script
+            for out in tx_data.outputs
+        )
+        return cls(
+            version=tx_data.version.to_bytes(4, "little"),
+            locktime=tx_data.locktime.to_bytes(4, "little"),
+            outpoints=outpoints,
+            sequences=sequences,
+            outputs=outputs,
+            hash_prevouts=double_sha256(b"".join(outpoints)),
+            hash_sequence=double_sha256(b"".join(sequences)),
+            hash_outputs=double_sha256(b"".join(outputs)),
+        )
+
+    def sighash(self, input_index: int, script_code: bytes, amount_sats: int,
+                hash_type: int = 0x41) -> bytes:
+        anyone_can_pay = hash_type & 0x80
+        mode = hash_type & 0x1F
+
+        if input_index >= len(self.outpoints):
+            raise ValueError("input_index out of range")
+
+        zero_hash = b"\x00" * 32
+        hash_prevouts = zero_hash if anyone_can_pay else self.hash_prevouts
+        hash_sequence = self.hash_sequence if not anyone_can_pay and mode == 0x01 else zero_hash
+
+        if mode == 0x03 and input_index < len(self.outputs):
+            hash_outputs = double_sha256(self.outputs[input_index])
+        elif mode == 0x02:
+            hash_outputs = zero_hash
+        else:
+            hash_outputs = self.hash_outputs
+
+        preimage = (
+            self.version
+            + hash_prevouts
+            + hash_sequence
+            + self.outpoints[input_index]
+            + serialize_varint(len(script_code))
+            + script_code
+            + amount_sats.to_bytes(8, "little")
+            + self.sequences[input_index]
+            + hash_outputs
+            + self.locktime
+            + hash_type.to_bytes(4, "little")
+        )
+        return double_sha256(preimage)
 
 # ----------------------------------------------------------------------
 # Main signing class (uses Bip44 for derivation)
@@ -98,6 +182,14 @@ class BitcoinCashSigner:
         self.private_key = decoded["private_key"]
         self.chain_code = decoded["chain_code"]
 
+        # Per-signing-session derivation caches, keyed by the path below the
+        # account (so () is the xpriv itself). Inputs mostly share .../0/i and
+        # .../1/i prefixes and often the same leaf.
+        self.nodes: Dict[Tuple[int, ...], Tuple[bytes, bytes]] = {
+            (): (self.private_key, self.chain_code)
+        }
+        self.public_keys: Dict[Tuple[int, ...], bytes] = {}
+
     @staticmethod
     def _decode_xpriv(xpriv: str) -> dict:
         import base58
@@ -117,66 +209,37 @@ class BitcoinCashSigner:
             "private_key": key_data[1:],
         }
 
+    def _public_key(self, node_path: Tuple[int, ...]) -> bytes:
+        pub = self.public_keys.get(node_path)
+        if pub is None:
+            pub = Bip44.private_to_public(self.nodes[node_path][0])
+            self.public_keys[node_path] = pub
+        return pub
+
     def _derive_path(self, path: List[int]) -> Tuple[bytes, bytes]:
         """Derive private key and compressed public key from the given path."""
-        priv, chain = self.private_key, self.chain_code
         # Skip the part that is already covered by the xpriv
-        for idx in path[len(self.account_path):]:
-            priv, chain = Bip44.derive_private_child_key(priv, chain, idx)
-        pub = Bip44.private_to_public(priv)
-        return priv, pub
+        node_path = tuple(path[len(self.account_path):])
 
-    def _create_sighash(self, tx: bytes, input_index: int, script_code: bytes,
-                        amount_sats: int, hash_type: int = 0x41) -> bytes:
-        tx_data = parse_transaction(tx)
-        anyone_can_pay = hash_type & 0x80
-        mode = hash_type & 0x1F
+        # Resume from the deepest node already derived this session
+        depth = len(node_path)
+        while node_path[:depth] not in self.nodes:
+            depth -= 1
 
-        if input_index >= len(tx_data["inputs"]):
-            raise ValueError("input_index out of range")
+        priv, chain = self.nodes[node_path[:depth]]
+        for i in range(depth, len(node_path)):
+            index = node_path[i]
+            parent_pub = None
+            if not index & 0x80000000:
+                parent_pub = self._public_key(node_path[:i])
+            priv, chain = Bip44.derive_private_child_key(priv, chain, index, parent_pub)
+            self.nodes[node_path[:i + 1]] = (priv, chain)
 
-        if not anyone_can_pay:
-            prevouts = b"".join(txin["prev_txid"] + txin["prev_index"] for txin in tx_data["inputs"])
-            hash_prevouts = double_sha256(prevouts)
-            if mode == 0x01:
-                sequences = b"".join(txin["sequence"] for txin in tx_data["inputs"])
-                hash_sequence = double_sha256(sequences)
-            else:
-                hash_sequence = b"\x00" * 32
-        else:
-            hash_prevouts = b"\x00" * 32
-            hash_sequence = b"\x00" * 32
-
-        if mode == 0x03 and input_index < len(tx_data["outputs"]):
-            out = tx_data["outputs"][input_index]
-            hash_outputs = double_sha256(
-                out["value"] + serialize_varint(len(out["script"])) + out["script"]
-            )
-        elif mode == 0x02:
-            hash_outputs = b"\x00" * 32
-        else:
-            out_bytes = b"".join(
-                out["value"] + serialize_varint(len(out["script"])) + out["script"]
-                for out in tx_data["outputs"]
-            )
-            hash_outputs = double_sha256(out_bytes)
+        return priv, self._public_key(node_path)
 
-        txin = tx_data["inputs"][input_index]
-        preimage = (
-            tx_data["version"]
-            + hash_prevouts
-            + hash_sequence
-            + txin["prev_txid"]
-            + txin["prev_index"]
-            + serialize_varint(len(script_code))
-            + script_code
-            + amount_sats.to_bytes(8, "little")
-            + txin["sequence"]
-            + hash_outputs
-            + tx_data["locktime"]
-            + hash_type.to_bytes(4, "little")
-        )
-        return double_sha256(preimage)
+    def _create_sighash(self, tx: bytes, input_index: int, script_code: bytes,
+                        amount_sats: int, hash_type: int = 0x41) -> bytes:
+        return SighashContext.from_tx(tx).sighash(input_index, script_code, amount_sats, hash_type)
 
     def _sign_schnorr(self, private_key: bytes, msg_hash: bytes, public_key: bytes) -> bytes:
         d = int.from_bytes(private_key, "big")
@@ -217,23 +280,215 @@ class BitcoinCashSigner:
         sig = self._sign_schnorr(priv, sighash, pub) + b"\x41"  # SIGHASH_ALL | FORKID
         return sig, pub
 
+# ----------------------------------------------------------------------
+# Signature verification
+# ----------------------------------------------------------------------
+class SignatureVerificationError(ValueError):
+    """Signatures produced for `failed_inputs` do not verify against the
+    pubkeys the PSBT declares for those inputs."""
+    def __init__(self, failed_inputs: List[int]):
+        self.failed_inputs = failed_inputs
+        super().__init__(f"Signature verification failed for input(s): {failed_inputs}")
+
+# One signature to check: (msg_hash, compressed public_key, 64-byte r || s)
+SchnorrCheck = Tuple[bytes, bytes, bytes]
+
+def _lift_x(x: int, odd: Optional[bool] = None) -> Optional[PointJacobi]:
+    """The curve point with x-coordinate `x`: with the given y parity, or
+    (by default) the one whose y is a quadratic residue."""
+    curve = ecdsa.SECP256k1.curve
+    p = curve.p()
+    if x >= p:
+        return None
+    y_squared = (pow(x, 3, p) + 7) % p
+    # p % 4 == 3, so this root is itself a square
+    y = pow(y_squared, (p + 1) // 4, p)
+    if y * y % p != y_squared:
+        return None
+    if odd is not None and (y & 1) != odd:
+        y = p - y
+    return PointJacobi(curve, x, y, 1, ecdsa.SECP256k1.order)
+
+def _decode_public_key(public_key: bytes) -> Optional[PointJacobi]:
+    if len(public_key) != 33 or public_key[0] not in (0x02, 0x03):
+        return None
+    return _lift_x(int.from_bytes(public_key[1:], "big"), odd=public_key[0] == 0x03)
+
+def _schnorr_challenge(r_bytes: bytes, public_key: bytes, msg_hash: bytes) -> int:
+    return int.from_bytes(hashlib.sha256(r_bytes + public_key + msg_hash).digest(), "big") % ecdsa.SECP256k1.order
+
+def verify_schnorr(msg_hash: bytes, public_key: bytes, signature: bytes) -> bool:
+    """Verify one 64-byte BCH Schnorr signature."""
+    order = ecdsa.SECP256k1.order
+    field_prime = ecdsa.SECP256k1.curve.p()
+    if len(signature) != 64:
+        return False
+    r = int.from_bytes(signature[:32], "big")
+    s = int.from_bytes(signature[32:], "big")
+    P = _decode_public_key(public_key)
+    if P is None or r >= field_prime or s >= order:
+        return False
+
+    e = _schnorr_challenge(signature[:32], public_key, msg_hash)
+    R = ecdsa.SECP256k1.generator.mul_add(s, P, order - e)  # sG - eP
+    if R == INFINITY:
+        return False
+    x, y = R.x(), R.y()
+    return x == r and pow(y, (field_prime - 1) // 2, field_prime) == 1
+
+def _wnaf(k: int, width: int = 5) -> List[int]:
+    """Width-w non-adjacent form of `k`, least significant digit first: odd
+    digits in (-2^(w-1), 2^(w-1)), at least w-1 zeros between nonzero ones."""
+    digits = []
+    while k:
+        digit = 0
+        if k & 1:
+            digit = k & ((1 << width) - 1)
+            if digit >= 1 << (width - 1):
+                digit -= 1 << width
+            k -= digit
+        digits.append(digit)
+        k >>= 1
+    return digits
+
+def _multi_scalar_mul(terms: List[Tuple[int, PointJacobi]]):
+    """Sum of k * P over (k, P) pairs, sharing a single doubling chain across
+    all points (Strauss' method over width-5 NAF digits, so each point only
+    costs ~bits/6 additions)."""
+    tables = []
+    for k, point in terms:
+        # Odd multiples P, 3P, ..., 15P
+        double = point.double()
+        odd_multiples = [point]
+        for _ in range(7):
+            odd_multiples.append(odd_multiples[-1] + double)
+        tables.append((_wnaf(k), odd_multiples, [-multiple for multiple in odd_multiples]))
+
+    result = INFINITY
+    for i in range(max(len(digits) for digits, _, _ in tables) - 1, -1, -1):
+        result = result.double()
+        for digits, odd_multiples, negated in tables:
+            if i < len(digits):
+                digit = digits[i]
+                if digit > 0:
+                    result = result + odd_multiples[digit >> 1]
+                elif digit < 0:
+                    result = result + negated[-digit >> 1]
+    return result
+
+def batch_verify_schnorr(checks: List[SchnorrCheck]) -> bool:
+    """
+    Verify all `checks` at once: True only if every signature is valid.
+
+    Each s_i*G == R_i + e_i*P_i is scaled by a random 128-bit a_i and the
+    equations are summed, so the whole batch costs one G multiplication plus
+    one multi-scalar multiplication instead of N double multiplications. The
+    random weights stop invalid signatures from cancelling each other out.
+    Coefficients of repeated pubkeys (inputs from the same address) are merged.
+    """
+    if not checks:
+        return True
+    order = ecdsa.SECP256k1.order
+
+    s_sum = 0
+    terms = []
+    pubkey_coefficients: Dict[bytes, int] = {}
+    for n, (msg_hash, public_key, signature) in enumerate(checks):
+        if len(signature) != 64:
+            return False
+        s = int.from_bytes(signature[32:], "big")
+        R = _lift_x(int.from_bytes(signature[:32], "big"))
+        if R is None or s >= order:
+            return False
+
+        a = 1 if n == 0 else secrets.randbits(128) | 1
+        e = _schnorr_challenge(signature[:32], public_key, msg_hash)
+        s_sum += a * s
+        terms.append((a, R))
+        pubkey_coefficients[public_key] = (pubkey_coefficients.get(public_key, 0) + a * e) % order
+
+    for public_key, coefficient in pubkey_coefficients.items():
+        P = _decode_public_key(public_key)
+        if P is None:
+            return False
+        if coefficient:
+            terms.append((coefficient, P))
+
+    return ecdsa.SECP256k1.generator * (s_sum % order) == _multi_scalar_mul(terms)
+
+def verify_signatures(checks: List[SchnorrCheck]) -> List[int]:
+    """Return the positions in `checks` whose signature is invalid.
+
+    The common all-valid case takes one batch verification; only a failed
+    batch falls back to verifying each signature to find the culprits."""
+    if batch_verify_schnorr(checks):
+        return []
+    return [n for n, check in enumerate(checks) if not verify_schnorr(*check)]
+
+# One input to sign: (input_index, script_code, amount_sats, derivation_path)
+SigningJob = Tuple[int, bytes, int, List[int]]
+
+def _sign_jobs(xpriv: str, account_path: str, context: SighashContext,
+               jobs: List[SigningJob]) -> List[Tuple[int, bytes, bytes]]:
+    """Sign a shard of inputs; returns [(input_index, signature, pubkey), ...].
+
+    Module-level so that it can run in a ProcessPoolExecutor worker. Each call
+    gets its own signer (and derivation cache)."""
+    signer = BitcoinCashSigner(xpriv, account_path)
+    results = []
+    for input_index, script_code, amount_sats, derivation_path in jobs:
+        priv, pub = signer._derive_path(derivation_path)
+        sighash = context.sighash(input_index, script_code, amount_sats)
+        sig = signer._sign_schnorr(priv, sighash, pub) + b"\x41"  # SIGHASH_ALL | FORKID
+        results.append((input_index, sig, pub))
+    return results
+
+def signing_workers() -> int:
+    """Worker processes to use for parallel signing: one per core (so a
+    single-core Pi Zero v1 always signs in-process)."""
+    return os.cpu_count() or 1
+
+# Inputs to sign before sign_psbt's default reaches for the process pool.
+# Starting the workers costs a few hundred ms on a Pi Zero 2W; each input
+# costs tens of ms, so smaller PSBTs are done before the pool would be.
+PARALLEL_MIN_INPUTS = 16
+
 # ----------------------------------------------------------------------
 # Public API: sign all inputs in a PSBT
 # ----------------------------------------------------------------------
 def sign_psbt(psbt_bytes: bytearray, xpriv: str,
-              account_path: str = "m/44'/145'/0'") -> bytearray:
+              account_path: str = "m/44'/145'/0'",
+              parallel: Optional[bool] = None,
+              max_workers: Optional[int] = None,
+              verify: bool = True) -> bytearray:
     """
     Sign all inputs in the PSBT that have a BIP32 derivation path.
     Returns the updated PSBT as bytearray.
+
+    With `parallel`, inputs are split into shards (grouped by derivation path
+    so each worker's derivation cache stays warm) and signed across
+    `max_workers` processes (default: one per core). Results are applied in
+    input order, so the output is identical to the sequential path. By default
+    (`parallel=None`) that happens on multi-core boards once there are at least
+    PARALLEL_MIN_INPUTS inputs to sign; a Pi Zero v1 always signs in-process.
+
+    With `verify`, every new signature is checked against the pubkey that the
+    input's PSBT_IN_BIP32_DERIVATION declares (so a derivation mismatch is
+    caught here rather than by the coordinator), raising
+    SignatureVerificationError listing the failing inputs.
     """
     parsed = parse_psbt(psbt_bytes)
     tx_bytes = parsed.get("unsigned_tx")
     if tx_bytes is None:
         raise ValueError("No unsigned transaction in PSBT")
-    signer = BitcoinCashSigner(xpriv, account_path)
+    # Validate the xpriv/account before doing any work
+    BitcoinCashSigner(xpriv, account_path)
     unsigned_tx = parse_transaction(tx_bytes)
+    context = SighashContext.from_tx(tx_bytes)
 
-    signed = bytearray(psbt_bytes)
+    prev_txs: Dict[bytes, PrevTxOutputs] = {}
+    jobs: List[SigningJob] = []
+    declared_pubkeys: Dict[int, bytes] = {}
 
     for i, input_pairs in enumerate(parsed["inputs"]):
         # Skip if already signed (has partial signature)
@@ -247,23 +502,18 @@ def sign_psbt(psbt_bytes: bytearray, xpriv: str,
         derivation_path = None
 
         for k, v in input_pairs:
-            if k[0] == 0x00:  # PSBT_IN_NON_WITNESS_UTXO
-                prev_tx = parse_transaction(v)
-                tx_in = unsigned_tx["inputs"][i]
-                prev_idx = int.from_bytes(tx_in["prev_index"], "little")
-                if prev_idx < len(prev_tx["outputs"]):
-                    out = prev_tx["outputs"][prev_idx]
-                    utxo_value = out["amount_int"]
-                    utxo_script = out["script"]
-            elif k[0] == 0x01:  # PSBT_IN_WITNESS_UTXO
-                utxo_value = int.from_bytes(v[:8], "little")
-                utxo_script = v[8:]
+            if k[0] in (0x00, 0x01):  # PSBT_IN_NON_WITNESS_UTXO / PSBT_IN_WITNESS_UTXO
+                out = resolve_spent_output(unsigned_tx.inputs[i], [(k, v)], prev_txs)
+                if out:
+                    utxo_value = out.value_satoshis
+                    utxo_script = out.full_script
             elif k[0] == 0x04:  # PSBT_IN_REDEEM_SCRIPT
                 redeem_script = v
             elif k[0] == 0x05:  # PSBT_IN_WITNESS_SCRIPT
                 witness_script = v
             elif k[0] == 0x06:  # PSBT_IN_BIP32_DERIVATION
                 _, derivation_path = parse_bip32_derivation_value(v)
+                declared_pubkeys[i] = k[1:]
 
         if derivation_path is None:
             continue   # not owned by this wallet
@@ -273,11 +523,92 @@ def sign_psbt(psbt_bytes: bytearray, xpriv: str,
             utxo_value = 0
 
         script_code = redeem_script or witness_script or utxo_script
-
-        sig, pub = signer.sign_input(tx_bytes, i, script_code, utxo_value, derivation_path)
+        jobs.append((i, script_code, utxo_value, derivation_path))
+
+    workers = min(max_workers or signing_workers(), len(jobs))
+    if parallel is None:
+        parallel = len(jobs) >= PARALLEL_MIN_INPUTS
+    if parallel and workers > 1:
+        jobs.sort(key=lambda job: job[3])
+        shard_size = -(-len(jobs) // workers)
+        shards = [jobs[start:start + shard_size] for start in range(0, len(jobs), shard_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_sign_jobs, xpriv, account_path, context, shard)
+                for shard in shards
+            ]
+            results = [result for future in futures for result in future.result()]
+    else:
+        results = _sign_jobs(xpriv, account_path, context, jobs)
+    results.sort()
+
+    if verify:
+        jobs_by_input = {job[0]: job for job in jobs}
+        checks = []
+        for i, sig, _ in results:
+            _, script_code, amount_sats, _ = jobs_by_input[i]
+            sighash = context.sighash(i, script_code, amount_sats)
+            checks.append((sighash, declared_pubkeys[i], sig[:64]))
+        failed = verify_signatures(checks)
+        if failed:
+            raise SignatureVerificationError([results[n][0] for n in failed])
+
+    updated_maps = {}
+    for i, sig, pub in results:
         partial_key = b"\x02" + pub
-        updated_pairs = [p for p in input_pairs if p[0] != partial_key]
+        updated_pairs = [p for p in parsed["inputs"][i] if p[0] != partial_key]
         updated_pairs.append((partial_key, sig))
-        signed = _replace_psbt_input_map(signed, i, updated_pairs)
+        updated_maps[i] = updated_pairs
+
+    return _replace_psbt_input_maps(bytearray(psbt_bytes), parsed["input_count"], updated_maps)
 
-    return signed
\ No newline at end of file
+# ----------------------------------------------------------------------
+# Export: strip what the coordinator already has before QR encoding
+# ----------------------------------------------------------------------
+# Key types kept by default: enough for a coordinator holding the original
+# PSBT to combine and finalize our signatures. Everything else (parent txs in
+# PSBT_IN_NON_WITNESS_UTXO, BIP32 derivations, xpubs, proprietary fields...)
+# is dropped.
+EXPORT_GLOBAL_KEYS = frozenset({
+    0x00,  # PSBT_GLOBAL_UNSIGNED_TX (always kept)
+    0xFB,  # PSBT_GLOBAL_VERSION
+})
+EXPORT_INPUT_KEYS = frozenset({
+    0x02,  # PSBT_IN_PARTIAL_SIG
+    0x03,  # PSBT_IN_SIGHASH_TYPE
+    0x04,  # PSBT_IN_REDEEM_SCRIPT
+    0x05,  # PSBT_IN_WITNESS_SCRIPT
+    0x07,  # PSBT_IN_FINAL_SCRIPTSIG
+    0x08,  # PSBT_IN_FINAL_SCRIPTWITNESS
+})
+EXPORT_OUTPUT_KEYS = frozenset({
+    0x00,  # PSBT_OUT_REDEEM_SCRIPT
+    0x01,  # PSBT_OUT_WITNESS_SCRIPT
+})
+
+def minimize_psbt(psbt_bytes: bytes,
+                  global_keys=EXPORT_GLOBAL_KEYS,
+                  input_keys=EXPORT_INPUT_KEYS,
+                  output_keys=EXPORT_OUTPUT_KEYS,
+                  partial_sigs_only: bool = False) -> bytearray:
+    """
+    Return a copy of the PSBT keeping only the key types in the given
+    whitelists. With `partial_sigs_only`, inputs keep nothing but their
+    PSBT_IN_PARTIAL_SIGs and outputs are emptied. The map structure (one map
+    per input and output) is always preserved.
+    """
+    if partial_sigs_only:
+        input_keys = {0x02}
+        output_keys = ()
+    global_keys = set(global_keys) | {0x00}
+
+    parsed = parse_psbt(psbt_bytes, zero_copy=True)
+    chunks = [b"psbt\xff"]
+    for whitelist, maps in [
+        (global_keys, [parsed["global"]]),
+        (input_keys, parsed["inputs"]),
+        (output_keys, parsed["outputs"]),
+    ]:
+        for pairs in maps:
+            chunks.append(_serialize_keypairs([(k, v) for k, v in pairs if k[0] in whitelist]))
+    return bytearray(b"".join(chunks))
@@ -0,0 +1,365 @@
+"""
+Adaptive camera settings for the live QR scanner.
+
+`ScanScreen` used to run the camera at a fixed 480x480 @ 6fps. That is more
+resolution than a sparse static QR needs (every decode pays for it) and too little
+for a dense animated one. The `ScanController` watches each window of decode
+attempts (how many frames held a QR, how many of those added a new part, i.e. how
+efficiently the scan is heading to completion, and how long pyzbar took on them)
+and moves along a ladder of square resolutions, sets the framerate to what the
+decoder can actually consume, and narrows the frames handed to the decoder to a centered
+region of interest once the QR is reliably in view and the symbols it has read
+sit well inside that region.
+
+Changing resolution or framerate means restarting the camera, so changes are
+rate-limited. The profile a completed animated scan settled on is kept per board
+type (Pi Zero vs Zero 2 W) in the hidden scan_profiles setting and is where the
+next scan starts. Settings only live in memory here (`Settings.set_value` does not
+write settings.json), so that lasts for the session, not across reboots.
+"""
+import logging
+import time
+
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Tuple
+
+from seedcash.models.decode_qr import DecodeQRStatus
+from seedcash.models.settings import Settings, SettingsConstants
+
+logger = logging.getLogger(__name__)
+
+
+BOARD__PI_ZERO = "pi_zero"
+BOARD__PI_ZERO_2W = "pi_zero_2w"
+BOARD__OTHER = "other"
+
+
+@lru_cache(maxsize=1)
+def get_board_type() -> str:
+    try:
+        with open("/proc/device-tree/model") as model_file:
+            model = model_file.read()
+    except OSError:
+        return BOARD__OTHER
+
+    if "Zero 2" in model:
+        return BOARD__PI_ZERO_2W
+    elif "Zero" in model:
+        return BOARD__PI_ZERO
+    return BOARD__OTHER
+
+
+@dataclass(frozen=True)
+class ScanProfile:
+    resolution: Tuple[int, int]
+    framerate: int
+    roi: float = 1.0  # centered fraction of each frame side passed to the decoder
+
+    def key(self) -> str:
+        return f"{self.resolution[0]}x{self.resolution[1]}@{self.framerate}/{self.roi}"
+
+    @classmethod
+    def from_key(cls, key: str) -> "ScanProfile":
+        size, rest = key.split("@")
+        framerate, roi = rest.split("/")
+        width, height = size.split("x")
+        return cls((int(width), int(height)), int(framerate), float(roi))
+
+
+@dataclass
+class ScanBounds:
+    """Limits the controller stays within"""
+
+    resolutions: Tuple[Tuple[int, int], ...] = (
+        (320, 320),
+        (400, 400),
+        (480, 480),
+        (560, 560),
+        (640, 640),
+    )
+    min_framerate: int = 4
+    max_framerate: int = 12
+    min_roi: float = 0.75
+
+
+# Where a board starts before it has a remembered profile
+DEFAULT_SCAN_PROFILES = {
+    BOARD__PI_ZERO: ScanProfile((480, 480), 6),
+    BOARD__PI_ZERO_2W: ScanProfile((480, 480), 10),
+    BOARD__OTHER: ScanProfile((480, 480), 6),
+}
+
+
+class ScanController:
+    # Decode attempts per adjustment decision
+    WINDOW = 12
+
+    # Windows to wait after a camera restart before judging the new profile
+    COOLDOWN_WINDOWS = 1
+
+    # Share of decodes that read a QR: below HIGH_HIT_RATE frames that should be
+    # readable are being missed; above it the QR is reliably in view. Below
+    # LOW_HIT_RATE the QR may have drifted out of the region of interest.
+    LOW_HIT_RATE = 0.3
+    HIGH_HIT_RATE = 0.8
+
+    # Only restart the camera for a framerate change at least this big
+    MIN_FRAMERATE_CHANGE = 2
+
+    # Clearance, as a share of the frame side, the decoded symbols must keep from
+    # the edge of the region of interest
+    ROI_MARGIN = 0.05
+
+    # Windows to wait before narrowing the region of interest again after it had
+    # to be widened; doubles each time it happens
+    ROI_COOLDOWN_WINDOWS = 4
+
+    def __init__(
+        self,
+        bounds: ScanBounds = None,
+        profile: ScanProfile = None,
+        board_type: str = None,
+        persist: bool = True,
+    ):
+        self.bounds = bounds or ScanBounds()
+        self.board_type = board_type or get_board_type()
+        self.persist = persist
+        self.profile = self._clamp(profile or self.load_profile())
+
+        self.start_time = time.time()
+        self.num_frames = 0
+        self.num_hits = 0
+        self.num_new_parts = 0
+        self.num_restarts = 0
+        self.cooldown = 0
+        self.roi_cooldown = 0
+        self.num_roi_resets = 0
+        self._frame_shape = None
+        self._crop_origin = (0, 0)
+        self._window_box = None
+        self._window_hits = 0
+        self._window_new_parts = 0
+        self._window_latency = 0.0
+        self._window_frames = 0
+
+    def load_profile(self) -> ScanProfile:
+        default = DEFAULT_SCAN_PROFILES.get(self.board_type, DEFAULT_SCAN_PROFILES[BOARD__OTHER])
+        if not self.persist:
+            return default
+
+        profiles = Settings.get_instance().get_value(
+            SettingsConstants.SETTING__SCAN_PROFILES, default_if_none=True
+        )
+        try:
+            return ScanProfile.from_key(profiles[self.board_type])
+        except (KeyError, TypeError, ValueError):
+            return default
+
+    def save_profile(self):
+        """Keeps the current profile for this board's next scan, for this session"""
+        settings = Settings.get_instance()
+        profiles = dict(
+            settings.get_value(SettingsConstants.SETTING__SCAN_PROFILES, default_if_none=True)
+            or {}
+        )
+        profiles[self.board_type] = self.profile.key()
+        settings.set_value(SettingsConstants.SETTING__SCAN_PROFILES, profiles)
+
+    def _clamp(self, profile: ScanProfile) -> ScanProfile:
+        bounds = self.bounds
+        resolution = profile.resolution
+        if resolution not in bounds.resolutions:
+            # Nearest rung of the ladder
+            resolution = min(bounds.resolutions, key=lambda r: abs(r[0] * r[1] - resolution[0] * resolution[1]))
+        return ScanProfile(
+            resolution=resolution,
+            framerate=max(bounds.min_framerate, min(bounds.max_framerate, profile.framerate)),
+            roi=max(bounds.min_roi, min(1.0, profile.roi)),
+        )
+
+    def _roi_margins(self, roi: float) -> Tuple[int, int]:
+        rows, cols = self._frame_shape
+        return int(rows * (1 - roi) / 2), int(cols * (1 - roi) / 2)
+
+    def crop(self, frame):
+        """The centered region of interest of a (rows, cols, ...) numpy frame"""
+        if frame is None:
+            return frame
+        self._frame_shape = frame.shape[:2]
+        margin_rows, margin_cols = self._roi_margins(self.profile.roi)
+        self._crop_origin = (margin_rows, margin_cols)
+        if not margin_rows and not margin_cols:
+            return frame
+        rows, cols = self._frame_shape
+        return frame[margin_rows : rows - margin_rows, margin_cols : cols - margin_cols]
+
+    def _roi_fits(self, box, roi: float) -> bool:
+        """Whether `box` (top, left, bottom, right frame pixels) keeps ROI_MARGIN
+        clear of the edges of the region of interest at `roi`"""
+        if box is None or self._frame_shape is None:
+            return False
+        rows, cols = self._frame_shape
+        margin_rows, margin_cols = self._roi_margins(roi)
+        clear_rows, clear_cols = rows * self.ROI_MARGIN, cols * self.ROI_MARGIN
+        top, left, bottom, right = box
+        return (
+            top - clear_rows >= margin_rows
+            and left - clear_cols >= margin_cols
+            and bottom + clear_rows <= rows - margin_rows
+            and right + clear_cols <= cols - margin_cols
+        )
+
+    def record(
+        self, status: DecodeQRStatus, latency: float, rect=None
+    ) -> ScanProfile | None:
+        """
+        Logs one decode attempt on the last `crop()`ed frame; `rect` is where the
+        decoder found the symbol in it, as pyzbar's (left, top, width, height).
+        Returns the new profile when the camera should be restarted with different
+        settings, otherwise None. ROI changes need no restart and are applied
+        directly.
+        """
+        self.num_frames += 1
+        self._window_frames += 1
+        self._window_latency += latency
+        if status not in (DecodeQRStatus.FALSE, DecodeQRStatus.INVALID):
+            self.num_hits += 1
+            self._window_hits += 1
+        if status == DecodeQRStatus.PART_COMPLETE:
+            self.num_new_parts += 1
+            self._window_new_parts += 1
+        if rect is not None:
+            # Everywhere a symbol was read this window, in full frame pixels
+            left, top, width, height = rect
+            top += self._crop_origin[0]
+            left += self._crop_origin[1]
+            box = (top, left, top + height, left + width)
+            if self._window_box is not None:
+                box = (
+                    min(box[0], self._window_box[0]),
+                    min(box[1], self._window_box[1]),
+                    max(box[2], self._window_box[2]),
+                    max(box[3], self._window_box[3]),
+                )
+            self._window_box = box
+
+        if self._window_frames < self.WINDOW:
+            return None
+
+        hit_rate = self._window_hits / self._window_frames
+        latency = self._window_latency / self._window_frames
+        progress_rate = self._window_new_parts / self._window_frames
+        box = self._window_box
+        self._window_frames = self._window_hits = self._window_new_parts = 0
+        self._window_latency = 0.0
+        self._window_box = None
+
+        if self.roi_cooldown:
+            self.roi_cooldown -= 1
+
+        if self.cooldown:
+            self.cooldown -= 1
+            return None
+
+        new_profile = self._adjust(hit_rate, latency, box, progress_rate)
+        if new_profile == self.profile:
+            return None
+
+        needs_restart = (
+            new_profile.resolution != self.profile.resolution
+            or new_profile.framerate != self.profile.framerate
+        )
+        logger.info(
+            f"Scan profile {self.profile.key()} -> {new_profile.key()} "
+            f"(hit rate {hit_rate:.2f}, decode {latency * 1000:.0f} ms)"
+        )
+        self.profile = new_profile
+        if not needs_restart:
+            return None
+
+        self.num_restarts += 1
+        self.cooldown = self.COOLDOWN_WINDOWS
+        return new_profile
+
+    def _adjust(
+        self, hit_rate: float, latency: float, box=None, progress_rate: float = 0.0
+    ) -> ScanProfile:
+        bounds = self.bounds
+        profile = self.profile
+        rung = bounds.resolutions.index(profile.resolution)
+        # Slowest decode we'll accept: one per frame at the lowest framerate
+        max_latency = 1.0 / bounds.min_framerate
+
+        def cost(resolution) -> float:
+            # Decode time scales with the pixel count
+            return (resolution[0] * resolution[1]) / (profile.resolution[0] * profile.resolution[1])
+
+        if self.num_hits == 0:
+            # Nothing has been in view yet; no evidence to act on
+            return profile
+
+        if profile.roi < 1.0 and (
+            hit_rate < self.LOW_HIT_RATE or not self._roi_fits(box, profile.roi)
+        ):
+            # The QR has left, or is about to leave, the region of interest. Hold
+            # off on narrowing it again, for longer each time.
+            self.roi_cooldown = self.ROI_COOLDOWN_WINDOWS << self.num_roi_resets
+            self.num_roi_resets += 1
+            return replace(profile, roi=1.0)
+
+        if (
+            hit_rate >= self.HIGH_HIT_RATE
+            and profile.roi > bounds.min_roi
+            and not self.roi_cooldown
+            and self._roi_fits(box, bounds.min_roi)
+        ):
+            # The QR is reliably in view and well inside the centered region; stop
+            # paying to decode the edges. A QR held close never gets cropped.
+            return replace(profile, roi=bounds.min_roi)
+
+        if progress_rate >= self.HIGH_HIT_RATE:
+            # Nearly every decode adds a new part, so frames-to-complete can't get
+            # much better; a camera restart would only cost time
+            return profile
+
+        if hit_rate < self.HIGH_HIT_RATE and rung + 1 < len(bounds.resolutions):
+            # Missing frames we know hold a QR: more pixels per module, if the
+            # decoder can afford them
+            larger = bounds.resolutions[rung + 1]
+            if latency * cost(larger) < max_latency:
+                return replace(
+                    profile, resolution=larger, framerate=self._framerate_for(latency * cost(larger))
+                )
+
+        if latency > max_latency and rung > 0:
+            # Can't keep up even at the lowest framerate
+            smaller = bounds.resolutions[rung - 1]
+            return replace(
+                profile, resolution=smaller, framerate=self._framerate_for(latency * cost(smaller))
+            )
+
+        # Otherwise just match the framerate to what the decoder consumes
+        framerate = self._framerate_for(latency)
+        if abs(framerate - profile.framerate) >= self.MIN_FRAMERATE_CHANGE:
+            return replace(profile, framerate=framerate)
+        return profile
+
+    def _framerate_for(self, latency: float) -> int:
+        # A little faster than the decoder so it never waits long for a fresh frame
+        framerate = int(1.2 / latency) if latency > 0 else self.bounds.max_framerate
+        return max(self.bounds.min_framerate, min(self.bounds.max_framerate, framerate))
+
+    def complete(self):
+        """Call when the scan completes; keeps the profile for the session's next scans
+        of animated QRs"""
+        elapsed = time.time() - self.start_time
+        logger.info(
+            f"Scan complete in {elapsed:.1f}s, {self.num_frames} frames for "
+            f"{self.num_new_parts} new parts, "
+            f"{self.num_restarts} camera restarts, profile {self.profile.key()}"
+        )
+        # A single-frame QR completes on its first read and says nothing about the
+        # profile
+        if self.persist and self.num_hits > 1:
+            self.save_profile()
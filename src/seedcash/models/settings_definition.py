@@ -127,6 +127,36 @@ class SettingsConstants:
         (33, "33 Words"),
     ]
 
+    # Signed PSBT export: which fields go into the QR
+    PSBT_EXPORT__FULL = "full"
+    PSBT_EXPORT__MINIMAL = "minimal"
+    PSBT_EXPORT__SIGNATURES = "signatures"
+
+    ALL_PSBT_EXPORTS = [
+        (PSBT_EXPORT__FULL, "Full PSBT"),
+        (PSBT_EXPORT__MINIMAL, "Minimal"),
+        (PSBT_EXPORT__SIGNATURES, "Signatures only"),
+    ]
+
+    # Animated QR format for signed PSBTs
+    PSBT_QR_FORMAT__UR = "ur"
+    PSBT_QR_FORMAT__BBQR = "bbqr"
+
+    ALL_PSBT_QR_FORMATS = [
+        (PSBT_QR_FORMAT__UR, "UR"),
+        (PSBT_QR_FORMAT__BBQR, "BBQr"),
+    ]
+
+    QR_DENSITY__LOW = "L"
+    QR_DENSITY__MEDIUM = "M"
+    QR_DENSITY__HIGH = "H"
+
+    ALL_QR_DENSITIES = [
+        (QR_DENSITY__LOW, "Low"),
+        (QR_DENSITY__MEDIUM, "Medium"),
+        (QR_DENSITY__HIGH, "High"),
+    ]
+
     PERSISTENT_SETTINGS__SD_INSERTED__HELP_TEXT = "Store Settings on SD card"
     PERSISTENT_SETTINGS__SD_REMOVED__HELP_TEXT = "Insert SD card to enable"
 
@@ -149,6 +179,9 @@ class SettingsConstants:
     SETTING__CAMERA_ROTATION = "camera_rotation"
     SETTING__SEED_PROTOCOL = "seed_protocol"
     SETTING__CHOOSE_WORDS = "choose_words"
+    SETTING__PSBT_EXPORT = "psbt_export"
+    SETTING__PSBT_QR_FORMAT = "psbt_qr_format"
+    SETTING__QR_DENSITY = "qr_density"
 
     SETTING__DEBUG = "debug"
 
@@ -174,6 +207,7 @@ class SettingsConstants:
 
     # Hidden settings
     SETTING__QR_BRIGHTNESS = "qr_background_color"
+    SETTING__SCAN_PROFILES = "scan_profiles"  # board type -> ScanProfile key, per session
 
     # Structural constants
     # TODO: Not using these for display purposes yet (ever?)
@@ -360,6 +394,34 @@ class SettingsDefinition:
             type=SettingsConstants.TYPE__SELECT_1,
             default_value=SettingsConstants.CHOOSE_BIP39_WORDS,
         ),
+        # PSBT Export Settings
+        SettingsEntry(
+            attr_name=SettingsConstants.SETTING__PSBT_EXPORT,
+            abbreviated_name="psbt_export",
+            visibility=SettingsConstants.VISIBILITY__ADVANCED,
+            type=SettingsConstants.TYPE__SELECT_1,
+            selection_options=SettingsConstants.ALL_PSBT_EXPORTS,
+            default_value=SettingsConstants.PSBT_EXPORT__MINIMAL,
+            help_text="Fields to include when exporting a signed PSBT",
+        ),
+        SettingsEntry(
+            attr_name=SettingsConstants.SETTING__PSBT_QR_FORMAT,
+            abbreviated_name="psbt_qr_format",
+            visibility=SettingsConstants.VISIBILITY__ADVANCED,
+            type=SettingsConstants.TYPE__SELECT_1,
+            selection_options=SettingsConstants.ALL_PSBT_QR_FORMATS,
+            default_value=SettingsConstants.PSBT_QR_FORMAT__UR,
+            help_text="Animated QR format for signed PSBTs",
+        ),
+        SettingsEntry(
+            attr_name=SettingsConstants.SETTING__QR_DENSITY,
+            abbreviated_name="qr_density",
+            visibility=SettingsConstants.VISIBILITY__ADVANCED,
+            type=SettingsConstants.TYPE__SELECT_1,
+            selection_options=SettingsConstants.ALL_QR_DENSITIES,
+            default_value=SettingsConstants.QR_DENSITY__MEDIUM,
+            help_text="Denser QRs send faster; lower if scans fail",
+        ),
         # Hardware config
         SettingsEntry(
             attr_name=SettingsConstants.SETTING__COORDINATORS,
@@ -387,6 +449,12 @@ class SettingsDefinition:
             default_value=255,
             visibility=SettingsConstants.VISIBILITY__GENERAL,
         ),
+        SettingsEntry(
+            attr_name=SettingsConstants.SETTING__SCAN_PROFILES,
+            type=SettingsConstants.TYPE__FREE_ENTRY,
+            default_value={},
+            visibility=SettingsConstants.VISIBILITY__HIDDEN,
+        ),
     ]
 
     @classmethod
@@ -1,3 +1,4 @@
+import logging
 import time
 from gettext import gettext as _
 from typing import List
@@ -18,6 +19,9 @@ from seedcash.views.view import (
 from seedcash.gui.screens.psbt_screens import PSBTOverviewScreen
 from seedcash.views.wallet_views import WalletOptionsView
 
+logger = logging.getLogger(__name__)
+
+
 class LoadingPSBTView(View):
     def __init__(self):
         super().__init__()
@@ -39,10 +43,9 @@ class LoadingPSBTView(View):
             self.loading_screen.stop()
 
     def run(self):
-        print("PSBT inputs:", self.controller.psbt_parser.inputs)
-        if len(self.controller.psbt_parser.inputs[0].items()) > 0:
+        if self.controller.psbt_parser.nft_categories:
             return Destination(PSBTNFTView, skip_current_view=True)
-        elif len(self.controller.psbt_parser.inputs[1].items()) > 0:
+        elif self.controller.psbt_parser.token_categories:
             return Destination(PSBTFungibleTokenDetailsView, skip_current_view=True)
         else:
             return Destination(BCHPSBTOverviewView, skip_current_view=True, view_args={"is_last": True})
@@ -105,7 +108,7 @@ class PSBTFungibleTokenDetailsView(View):
         selected_menu_num = self.run_screen(
             PSBTOverviewScreen,
             spend_amount=psbt_parser.ft_output_amount(category_id),
-            num_inputs=len(psbt_parser.inputs[1].get(category_id, [])),
+            num_inputs=len(psbt_parser.token_summary(category_id).ft_inputs),
             destination_addresses=destination_addresses,
             category_id=category_id
         )
@@ -158,7 +161,7 @@ class PSBTNFTDetailsView(View):
         from seedcash.gui.screens.psbt_screens import PSBTNFTDetailsScreen
 
         psbt_parser: PSBTParser = self.controller.psbt_parser
-        tx_outputs: List[TxOutput] = psbt_parser.outputs[0].get(psbt_parser.nft_categories[self.category_num], [])
+        tx_outputs: List[TxOutput] = psbt_parser.nft_outputs(psbt_parser.nft_categories[self.category_num])
 
         selected_menu_num = self.run_screen(
             PSBTNFTDetailsScreen,
@@ -182,7 +185,7 @@ class PSBTNFTAddressDetailsView(View):
 
         psbt_parser: PSBTParser = self.controller.psbt_parser
 
-        tx_outputs: List[TxOutput] = psbt_parser.outputs[0].get(psbt_parser.nft_categories[self.category_num], [])
+        tx_outputs: List[TxOutput] = psbt_parser.nft_outputs(psbt_parser.nft_categories[self.category_num])
         
         selected_menu_num = self.run_screen(
             PSBTNFTAddressScreen,
@@ -334,12 +337,17 @@ class PSBTOpReturnView(View):
 
         if selected_menu_num == RET_CODE__BACK_BUTTON:
             return Destination(BackStackView)
-        # TODO: Will function to sign the PSBT be added here? If so, we can route to the signing view.
         return Destination(PSBTSignedQRDisplayView)
 
 class PSBTSignedQRDisplayView(View):
     def run(self):
-        from seedcash.models.encode_qr import UrPsbtQrEncoder
+        from seedcash.gui.screens.screen import LoadingScreenThread
+        from seedcash.models.encode_qr import BBQrPsbtQrEncoder, UrPsbtQrEncoder
+        from seedcash.models.psbt_signer import (
+            SignatureVerificationError,
+            minimize_psbt,
+            sign_psbt,
+        )
         from seedcash.models.threads import ThreadsafeCounter
         from seedcash.models.settings_definition import SettingsConstants
 
@@ -347,11 +355,69 @@ class PSBTSignedQRDisplayView(View):
         if self.controller.psbt_parser and self.controller.psbt_parser.psbt_bytes:
             psbt_bytes = self.controller.psbt_parser.psbt_bytes
 
+        # Sign (and verify every new signature) before any QR frames go out
+        loading_screen = LoadingScreenThread(text=_("Signing PSBT..."))
+        loading_screen.start()
+        try:
+            signed_psbt = sign_psbt(
+                bytearray(psbt_bytes), self.controller.storage._wallet._xpriv
+            )
+        except SignatureVerificationError as e:
+            return Destination(
+                PSBTSigningErrorView, view_args={"failed_inputs": e.failed_inputs}
+            )
+        finally:
+            loading_screen.stop()
+
+        if signed_psbt == psbt_bytes:
+            return Destination(PSBTSigningErrorView)
+
         # UR encoder expects mutable bytearray fragments internally.
-        psbt_bytes = bytearray(psbt_bytes)
+        psbt_bytes = signed_psbt
         self.controller.psbt_bytes = psbt_bytes
 
-        qr_encoder = UrPsbtQrEncoder(psbt=psbt_bytes)
+        # Drop the fields the coordinator already has; fewer bytes, fewer frames
+        psbt_export = self.controller.settings.get_value(
+            SettingsConstants.SETTING__PSBT_EXPORT, default_if_none=True
+        )
+        if psbt_export != SettingsConstants.PSBT_EXPORT__FULL:
+            psbt_bytes = minimize_psbt(
+                psbt_bytes,
+                partial_sigs_only=psbt_export == SettingsConstants.PSBT_EXPORT__SIGNATURES,
+            )
+
+        qr_format = self.controller.settings.get_value(
+            SettingsConstants.SETTING__PSBT_QR_FORMAT, default_if_none=True
+        )
+        if qr_format == SettingsConstants.PSBT_QR_FORMAT__BBQR:
+            qr_encoder = BBQrPsbtQrEncoder(psbt=psbt_bytes)
+        else:
+            qr_encoder = UrPsbtQrEncoder(
+                psbt=psbt_bytes,
+                qr_density=self.controller.settings.get_value(
+                    SettingsConstants.SETTING__QR_DENSITY, default_if_none=True
+                ),
+            )
+            plan = qr_encoder.plan
+            logger.info(
+                f"UR plan: version {plan.qr_version}, {plan.fragment_size} B fragments, "
+                f"{plan.module_px} px modules, {plan.cycle_seconds:0.1f}s per cycle"
+            )
+        bytes_saved = len(signed_psbt) - len(psbt_bytes)
+        logger.info(
+            f"PSBT export: {len(psbt_bytes)} bytes "
+            f"({bytes_saved} saved), {qr_encoder.seq_len()} frames"
+        )
+        if bytes_saved > 0:
+            # TRANSLATOR_NOTE: Shown over the signed PSBT QR, e.g. "1234 bytes saved, 12 frames"
+            status_text = _("{} bytes saved, {} frames").format(
+                bytes_saved, qr_encoder.seq_len()
+            )
+        else:
+            # TRANSLATOR_NOTE: Shown over the signed PSBT QR, e.g. "5678 bytes, 40 frames"
+            status_text = _("{} bytes, {} frames").format(
+                len(psbt_bytes), qr_encoder.seq_len()
+            )
 
         current_brightness = self.controller.settings.get_value(
             SettingsConstants.SETTING__QR_BRIGHTNESS
@@ -362,7 +428,10 @@ class PSBTSignedQRDisplayView(View):
         brightness_counter = ThreadsafeCounter(initial_value=int(current_brightness))
 
         self.run_screen(
-            QRDisplayScreen, qr_encoder=qr_encoder, qr_brightness=brightness_counter
+            QRDisplayScreen,
+            qr_encoder=qr_encoder,
+            qr_brightness=brightness_counter,
+            status_text=status_text,
         )
 
         # Save any brightness adjustments made by the user
@@ -377,19 +446,30 @@ class PSBTSignedQRDisplayView(View):
 class PSBTSigningErrorView(View):
     SELECT_DIFF_SEED = ButtonOption("Select Diff Seed")
 
+    def __init__(self, failed_inputs: List[int] = None):
+        super().__init__()
+        self.failed_inputs = failed_inputs
+
     def run(self):
         psbt_parser: PSBTParser = self.controller.psbt_parser
         if not psbt_parser:
             # Should not be able to get here
             return Destination(MainMenuView)
 
+        if self.failed_inputs:
+            text = _("Signature check failed for input(s) {}.").format(
+                ", ".join(str(i) for i in self.failed_inputs)
+            )
+        else:
+            text = _("Signing with this seed did not add a valid signature.")
+
         # Just a WarningScreen here; only use DireWarningScreen for true security risks.
         selected_menu_num = self.run_screen(
             WarningScreen,
             title=_("PSBT Error"),
             status_icon_name=SeedCashIconsConstants.WARNING,
             status_headline=_("Signing Failed"),
-            text=_("Signing with this seed did not add a valid signature."),
+            text=text,
             button_data=[self.SELECT_DIFF_SEED],
         )
 